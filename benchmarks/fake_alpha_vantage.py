@@ -0,0 +1,228 @@
+"""Module implementing a local stand-in for the AlphaVantage quotes API.
+
+The fake answers the `GLOBAL_QUOTE` and `REALTIME_BULK_QUOTES` functions with
+generated quotes, after a latency drawn from a configurable distribution. A share of
+the requests can be answered with HTTP errors or with AlphaVantage's throttle payload,
+so the fetch pipeline can be exercised against slow and failing responses. It is
+served either over real HTTP, through `toolkit.server.HTTPServer`, or in-process
+through an `httpx.MockTransport`.
+"""
+
+import asyncio
+import json
+import math
+import random
+import zlib
+from collections import Counter
+from collections.abc import Mapping
+from datetime import date, datetime, timezone
+from http import HTTPStatus
+from typing import Any, Callable, Optional
+
+import httpx
+
+from src.enums import AlphaVantageAPIConsts as AVAPIConsts
+from src.enums import AlphaVantageResponseKeys as AVResponseKeys
+from toolkit.server import HTTPRequest, HTTPResponse
+
+LatencyModel = Callable[[random.Random], float]
+
+THROTTLE_MESSAGE = (
+    "Thank you for using Alpha Vantage! Our standard API call frequency is 5 calls "
+    "per minute and 500 calls per day. Please visit "
+    "https://www.alphavantage.co/premium/ if you would like to target a higher API "
+    "call frequency."
+)
+
+
+def constant_latency(seconds: float) -> LatencyModel:
+    """
+    Build a latency model answering every request after the same delay.
+
+    Parameters
+    ----------
+    seconds : float
+        The delay.
+
+    Returns
+    -------
+    LatencyModel
+        The latency model.
+    """
+    return lambda _: seconds
+
+
+def lognormal_latency(median: float, sigma: float = 0.5) -> LatencyModel:
+    """
+    Build a latency model with a long tail, as observed for real APIs.
+
+    Parameters
+    ----------
+    median : float
+        Median delay in seconds.
+    sigma : float, optional
+        Standard deviation of the logarithm of the delay. Larger values give a
+        longer tail.
+
+    Returns
+    -------
+    LatencyModel
+        The latency model.
+    """
+    mu = math.log(median)
+    return lambda rng: rng.lognormvariate(mu, sigma)
+
+
+class FakeAlphaVantage:
+    """Fake AlphaVantage API generating quotes for any symbol."""
+
+    def __init__(
+        self,
+        latency: Optional[LatencyModel] = None,
+        error_rate: float = 0.0,
+        throttle_rate: float = 0.0,
+        seed: Optional[int] = None,
+    ) -> None:
+        """
+        Initialize the FakeAlphaVantage.
+
+        Parameters
+        ----------
+        latency : LatencyModel, optional
+            Distribution of the delay before answering. Defaults to no delay.
+        error_rate : float, optional
+            Share of the requests answered with an HTTP 503 error.
+        throttle_rate : float, optional
+            Share of the requests answered with AlphaVantage's throttle payload.
+        seed : int, optional
+            Seed of the random generator, to replay the same run.
+
+        Raises
+        ------
+        ValueError
+            If the rates are not between 0 and 1, or add up to more than 1.
+        """
+        if not (0 <= error_rate <= 1 and 0 <= throttle_rate <= 1):
+            raise ValueError("`error_rate` and `throttle_rate` must be in [0, 1].")
+        if error_rate + throttle_rate > 1:
+            raise ValueError(
+                "`error_rate` and `throttle_rate` must add up to 1 at most."
+            )
+
+        self.latency = latency or constant_latency(0.0)
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.responses: Counter[str] = Counter()
+        self._random = random.Random(seed)
+
+    async def handle(self, request: HTTPRequest) -> HTTPResponse:
+        """
+        Answer a request received by a `toolkit.server.HTTPServer`.
+
+        Parameters
+        ----------
+        request : HTTPRequest
+            The received request.
+
+        Returns
+        -------
+        HTTPResponse
+            The JSON response.
+        """
+        if request.path != AVAPIConsts.ENDPOINT:
+            return HTTPResponse(status=HTTPStatus.NOT_FOUND)
+        status, payload = await self._respond(request.query)
+        return HTTPResponse(
+            status=status,
+            body=json.dumps(payload).encode(),
+            content_type="application/json",
+        )
+
+    def transport(self) -> httpx.MockTransport:
+        """
+        Build a transport answering the requests of an httpx client in-process.
+
+        Returns
+        -------
+        httpx.MockTransport
+            The transport, to pass to `toolkit.api.AsyncAPIClient`.
+        """
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path != AVAPIConsts.ENDPOINT:
+                return httpx.Response(HTTPStatus.NOT_FOUND)
+            status, payload = await self._respond(request.url.params)
+            return httpx.Response(status, json=payload)
+
+        return httpx.MockTransport(handler)
+
+    async def _respond(self, params: Mapping[str, str]) -> tuple[int, Any]:
+        """Draw the latency and outcome of a request, then build its response."""
+        await asyncio.sleep(self.latency(self._random))
+        draw = self._random.random()
+        if draw < self.error_rate:
+            self.responses["error"] += 1
+            return HTTPStatus.SERVICE_UNAVAILABLE, {}
+        if draw < self.error_rate + self.throttle_rate:
+            self.responses["throttled"] += 1
+            return HTTPStatus.OK, {AVResponseKeys.NOTE: THROTTLE_MESSAGE}
+
+        function = params.get("function")
+        symbol = params.get("symbol", "")
+        if function == AVAPIConsts.OPERATION and symbol:
+            self.responses["quote"] += 1
+            return HTTPStatus.OK, {AVResponseKeys.GLOBAL_QUOTE: self._quote(symbol)}
+        if function == AVAPIConsts.BULK_OPERATION and symbol:
+            self.responses["bulk"] += 1
+            data = [self._bulk_quote(name) for name in symbol.split(",")]
+            return HTTPStatus.OK, {AVResponseKeys.BULK_DATA: data}
+        self.responses["invalid"] += 1
+        return HTTPStatus.OK, {AVResponseKeys.ERROR_MESSAGE: "Invalid API call."}
+
+    def _prices(self, symbol: str) -> dict[str, float]:
+        """Generate the prices of a symbol around a base price derived from its name."""
+        previous_close = 10 + zlib.crc32(symbol.encode()) % 990
+        price = previous_close * (1 + self._random.gauss(0, 0.02))
+        low, high = sorted((previous_close, price))
+        return {
+            "open": previous_close,
+            "high": high * 1.005,
+            "low": low * 0.995,
+            "price": price,
+            "previous_close": previous_close,
+            "change": price - previous_close,
+            "change_percent": (price - previous_close) / previous_close * 100,
+            "volume": self._random.randint(10_000, 10_000_000),
+        }
+
+    def _quote(self, symbol: str) -> dict[str, str]:
+        """Generate a quote in the `GLOBAL_QUOTE` schema."""
+        prices = self._prices(symbol)
+        return {
+            "01. symbol": symbol.upper(),
+            "02. open": f"{prices['open']:.4f}",
+            "03. high": f"{prices['high']:.4f}",
+            "04. low": f"{prices['low']:.4f}",
+            "05. price": f"{prices['price']:.4f}",
+            "06. volume": str(prices["volume"]),
+            "07. latest trading day": date.today().isoformat(),
+            "08. previous close": f"{prices['previous_close']:.4f}",
+            "09. change": f"{prices['change']:.4f}",
+            "10. change percent": f"{prices['change_percent']:.4f}%",
+        }
+
+    def _bulk_quote(self, symbol: str) -> dict[str, str]:
+        """Generate a quote entry in the `REALTIME_BULK_QUOTES` schema."""
+        prices = self._prices(symbol)
+        return {
+            "symbol": symbol.upper(),
+            "timestamp": datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S"),
+            "open": f"{prices['open']:.4f}",
+            "high": f"{prices['high']:.4f}",
+            "low": f"{prices['low']:.4f}",
+            "close": f"{prices['price']:.4f}",
+            "volume": str(prices["volume"]),
+            "previous_close": f"{prices['previous_close']:.4f}",
+            "change": f"{prices['change']:.4f}",
+            "change_percent": f"{prices['change_percent']:.4f}",
+        }
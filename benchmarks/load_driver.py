@@ -0,0 +1,256 @@
+"""Module implementing a load driver for the stock quotes fetch pipeline.
+
+The driver streams the quotes of many symbols through `Presenter` and a
+`StockQuotesFetcher`, timing every upstream call, and reports the throughput, the
+latency percentiles and the outcome of the fetches. Run as a script, it drives the
+pipeline against a local `FakeAlphaVantage`:
+
+    python -m benchmarks.load_driver --symbols 1000 --latency-ms 80 --error-rate 0.02
+"""
+
+import argparse
+import asyncio
+import logging
+import math
+import time
+from collections import Counter
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass, field, replace
+from types import MappingProxyType
+from typing import Any, Optional
+
+from src.enums import AlphaVantageAPIConsts as AVAPIConsts
+from src.enums import FetchStatus
+from src.fetcher import StockQuotesFetcher, StockQuotesFetcherInterface
+from src.model import Model
+from src.presenter import Presenter
+from src.view import View
+from toolkit.api import AsyncAPIClient
+from toolkit.server import HTTPServer
+
+from .fake_alpha_vantage import FakeAlphaVantage, lognormal_latency
+
+
+@dataclass(frozen=True)
+class LoadReport:
+    """Dataclass representing the outcome of a load run."""
+
+    duration: float
+    latencies: tuple[float, ...]
+    statuses: Mapping[FetchStatus, int] = field(
+        default_factory=lambda: MappingProxyType({})
+    )
+    connections_opened: Optional[int] = None
+
+    @property
+    def requests(self) -> int:
+        """Number of upstream calls made."""
+        return len(self.latencies)
+
+    @property
+    def requests_per_second(self) -> float:
+        """Upstream calls completed per second."""
+        return self.requests / self.duration if self.duration > 0 else 0.0
+
+    @property
+    def errors(self) -> int:
+        """Number of symbols whose fetch failed."""
+        return sum(
+            count
+            for status, count in self.statuses.items()
+            if status is not FetchStatus.SUCCESS
+        )
+
+    def percentile(self, q: float) -> float:
+        """
+        Return a percentile of the upstream call latencies, by the nearest-rank method.
+
+        Parameters
+        ----------
+        q : float
+            The percentile, between 0 and 100.
+
+        Returns
+        -------
+        float
+            The latency in seconds, or 0 if no call was made.
+        """
+        if not self.latencies:
+            return 0.0
+        rank = max(math.ceil(q / 100 * len(self.latencies)), 1)
+        return sorted(self.latencies)[rank - 1]
+
+    def format(self) -> str:
+        """Format the report as human readable lines."""
+        lines = [
+            f"requests:      {self.requests} in {self.duration:.2f}s "
+            f"({self.requests_per_second:.1f} req/s)",
+            "latency:       "
+            + ", ".join(
+                f"p{q} {self.percentile(q) * 1000:.1f}ms" for q in (50, 95, 99)
+            ),
+            f"errors:        {self.errors}",
+        ]
+        lines.extend(
+            f"  {status}: {count}" for status, count in sorted(self.statuses.items())
+        )
+        if self.connections_opened is not None:
+            lines.append(f"connections:   {self.connections_opened} opened")
+        return "\n".join(lines)
+
+
+class _TimingFetcher(StockQuotesFetcherInterface):
+    """Fetcher decorator recording the latency of every call to the wrapped one."""
+
+    def __init__(self, fetcher: StockQuotesFetcherInterface) -> None:
+        self._fetcher = fetcher
+        self.latencies: list[float] = []
+
+    async def fetch_stock_quote(
+        self, endpoint: str, operation: str, symbol: str
+    ) -> Any:
+        start = time.perf_counter()
+        try:
+            return await self._fetcher.fetch_stock_quote(
+                endpoint=endpoint, operation=operation, symbol=symbol
+            )
+        finally:
+            self.latencies.append(time.perf_counter() - start)
+
+    async def fetch_bulk_stock_quotes(
+        self, endpoint: str, symbols: list[str]
+    ) -> dict[str, Any]:
+        start = time.perf_counter()
+        try:
+            return await self._fetcher.fetch_bulk_stock_quotes(
+                endpoint=endpoint, symbols=symbols
+            )
+        finally:
+            self.latencies.append(time.perf_counter() - start)
+
+
+async def run_load(
+    fetcher: StockQuotesFetcherInterface,
+    symbols: Sequence[str],
+    rounds: int = 1,
+    max_concurrency: int = 10,
+    use_bulk_quotes: bool = False,
+) -> LoadReport:
+    """
+    Stream the quotes of the symbols through a Presenter and report the outcome.
+
+    Parameters
+    ----------
+    fetcher : StockQuotesFetcherInterface
+        The fetcher under load.
+    symbols : Sequence[str]
+        The symbols fetched in every round.
+    rounds : int, optional
+        Number of times every symbol is fetched.
+    max_concurrency : int, optional
+        Maximum number of quotes fetched at the same time.
+    use_bulk_quotes : bool, optional
+        Whether to fetch many symbols per request with the bulk quotes endpoint.
+
+    Returns
+    -------
+    LoadReport
+        The throughput, latencies and fetch outcomes of the run. In bulk mode, one
+        latency is recorded per bulk call rather than per symbol.
+    """
+    timing_fetcher = _TimingFetcher(fetcher)
+    presenter = Presenter(
+        view=View(),
+        model=Model(),
+        fetcher=timing_fetcher,
+        max_concurrency=max_concurrency,
+        use_bulk_quotes=use_bulk_quotes,
+    )
+    statuses: Counter[FetchStatus] = Counter()
+    start = time.perf_counter()
+    for _ in range(rounds):
+        async for result in presenter.stream_stock_quotes(symbols_list=list(symbols)):
+            statuses[result.status] += 1
+    return LoadReport(
+        duration=time.perf_counter() - start,
+        latencies=tuple(timing_fetcher.latencies),
+        statuses=MappingProxyType(dict(statuses)),
+    )
+
+
+def _parse_args(argv: Optional[Sequence[str]]) -> argparse.Namespace:
+    """Parse the command line arguments of the load driver."""
+    parser = argparse.ArgumentParser(
+        description="Drive the quotes fetch pipeline against a fake AlphaVantage."
+    )
+    parser.add_argument("--symbols", type=int, default=500, help="number of symbols")
+    parser.add_argument("--rounds", type=int, default=1, help="fetches per symbol")
+    parser.add_argument("--concurrency", type=int, default=10, help="in-flight fetches")
+    parser.add_argument("--max-connections", type=int, default=100, help="pool size")
+    parser.add_argument("--timeout", type=float, default=10.0, help="request timeout")
+    parser.add_argument("--latency-ms", type=float, default=50.0, help="median latency")
+    parser.add_argument("--sigma", type=float, default=0.5, help="latency spread")
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--throttle-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--bulk", action="store_true", help="use bulk quotes")
+    parser.add_argument("--log-level", default="CRITICAL", help="pipeline log level")
+    parser.add_argument(
+        "--in-process",
+        action="store_true",
+        help="answer through an httpx.MockTransport instead of a local HTTP server",
+    )
+    return parser.parse_args(argv)
+
+
+async def main(argv: Optional[Sequence[str]] = None) -> LoadReport:  # pragma: no cover
+    """
+    Run the load driver against a local FakeAlphaVantage and print its report.
+
+    Parameters
+    ----------
+    argv : Sequence[str], optional
+        The arguments to parse. Defaults to `sys.argv[1:]`.
+
+    Returns
+    -------
+    LoadReport
+        The report of the run.
+    """
+    args = _parse_args(argv)
+    logging.basicConfig(level=args.log_level.upper())
+    fake = FakeAlphaVantage(
+        latency=lognormal_latency(args.latency_ms / 1000, sigma=args.sigma),
+        error_rate=args.error_rate,
+        throttle_rate=args.throttle_rate,
+        seed=args.seed,
+    )
+    symbols = [f"SYM{index}" for index in range(args.symbols)]
+    server = HTTPServer(handler=fake.handle)
+
+    if not args.in_process:
+        await server.start()
+    async with AsyncAPIClient(
+        base_url=server.url if not args.in_process else AVAPIConsts.BASE_URL,
+        timeout=args.timeout,
+        max_connections=args.max_connections,
+        max_keepalive_connections=args.max_connections,
+        transport=fake.transport() if args.in_process else None,
+    ) as api_client:
+        report = await run_load(
+            fetcher=StockQuotesFetcher(api_client=api_client, api_key="demo"),
+            symbols=symbols,
+            rounds=args.rounds,
+            max_concurrency=args.concurrency,
+            use_bulk_quotes=args.bulk,
+        )
+    await server.close()
+
+    if not args.in_process:
+        report = replace(report, connections_opened=server.connections_opened)
+    print(report.format())
+    return report
+
+
+if __name__ == "__main__":  # pragma: no cover
+    asyncio.run(main())
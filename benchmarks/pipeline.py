@@ -0,0 +1,139 @@
+"""Benchmarks of each stage of the fetch, parse, model and render pipeline.
+
+Every benchmark is a factory taking the number of symbols and returning the callable
+to time, so that the inputs of a stage are prepared once, outside of the timing.
+"""
+
+import io
+import json
+from collections.abc import Callable, Mapping
+from datetime import date
+from types import MappingProxyType
+from typing import Any
+
+from rich.console import Console
+
+from src.adapters import adapt_quote
+from src.model import Model, StockQuote
+from src.view import View
+from toolkit.serialization import get_json_decoder
+
+Benchmark = Callable[[int], Callable[[], object]]
+
+
+def make_payloads(size: int) -> list[dict[str, Any]]:
+    """
+    Build `GLOBAL_QUOTE` payloads for `size` distinct symbols.
+
+    Parameters
+    ----------
+    size : int
+        Number of symbols.
+
+    Returns
+    -------
+    list[dict[str, Any]]
+        One decoded payload per symbol.
+    """
+    today = date(2024, 3, 15).isoformat()
+    payloads = []
+    for index in range(size):
+        previous_close = 10 + index % 990
+        price = previous_close * (1 + (index % 7 - 3) / 100)
+        payloads.append(
+            {
+                "Global Quote": {
+                    "01. symbol": f"SYM{index}",
+                    "02. open": f"{previous_close:.4f}",
+                    "03. high": f"{max(price, previous_close) * 1.01:.4f}",
+                    "04. low": f"{min(price, previous_close) * 0.99:.4f}",
+                    "05. price": f"{price:.4f}",
+                    "06. volume": str(1000 + index * 37),
+                    "07. latest trading day": today,
+                    "08. previous close": f"{previous_close:.4f}",
+                    "09. change": f"{price - previous_close:.4f}",
+                    "10. change percent": f"{(price / previous_close - 1) * 100:.4f}%",
+                }
+            }
+        )
+    return payloads
+
+
+def make_stock_quotes(size: int) -> list[StockQuote]:
+    """
+    Build the stock quotes of `size` distinct symbols.
+
+    Parameters
+    ----------
+    size : int
+        Number of symbols.
+
+    Returns
+    -------
+    list[StockQuote]
+        One stock quote per symbol.
+    """
+    return [StockQuote(**adapt_quote(payload)) for payload in make_payloads(size)]
+
+
+def bench_json_decode(size: int) -> Callable[[], object]:
+    """Decode one raw response body per symbol with the fastest JSON decoder."""
+    bodies = [json.dumps(payload).encode() for payload in make_payloads(size)]
+    decode = get_json_decoder().decode
+    return lambda: [decode(body) for body in bodies]
+
+
+def bench_adapt(size: int) -> Callable[[], object]:
+    """Map and parse the provider fields of one decoded payload per symbol."""
+    payloads = make_payloads(size)
+    return lambda: [adapt_quote(payload) for payload in payloads]
+
+
+def bench_build(size: int) -> Callable[[], object]:
+    """Build one StockQuote per symbol from its adapted fields."""
+    stock_data = [adapt_quote(payload) for payload in make_payloads(size)]
+    return lambda: [StockQuote(**data) for data in stock_data]
+
+
+def bench_model_update(size: int) -> Callable[[], object]:
+    """Upsert every quote into a fresh model and pop the change set."""
+    stock_quotes = make_stock_quotes(size)
+
+    def update() -> object:
+        model = Model()
+        for stock_quote in stock_quotes:
+            model.upsert_stock_quote(stock_quote=stock_quote)
+        return model.pop_changes()
+
+    return update
+
+
+class _NullFile(io.StringIO):
+    """Text file discarding everything written to it, with no file to close."""
+
+    def write(self, text: str) -> int:
+        """Discard `text`, reporting it as written."""
+        return len(text)
+
+
+def bench_render(size: int) -> Callable[[], object]:
+    """Render the quotes table of every symbol to a null console."""
+    stock_quotes = make_stock_quotes(size)
+    view = View()
+    view.console = Console(file=_NullFile(), width=120)
+
+    def render() -> None:
+        view.show_stock_quotes(stock_quotes)
+
+    return render
+
+
+BENCHMARKS: Mapping[str, Benchmark] = MappingProxyType(
+    {
+        "json_decode": bench_json_decode,
+        "adapt": bench_adapt,
+        "build": bench_build,
+        "model_update": bench_model_update,
+        "render": bench_render,
+    }
+)
@@ -0,0 +1,263 @@
+"""Standalone runner of the pipeline benchmarks, with baseline comparison.
+
+Each benchmark is timed at every requested size. The results are written as JSON and,
+when a baseline file exists, compared with it; the run fails if a benchmark got slower
+than the baseline by more than the tolerance:
+
+    python -m benchmarks.runner                      # compare with the baseline
+    python -m benchmarks.runner --save-baseline      # record a new baseline
+    python -m benchmarks.runner --sizes 10 --stages adapt,build
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import sys
+import timeit
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Optional
+
+from toolkit.serialization import get_json_decoder
+
+from .pipeline import BENCHMARKS, Benchmark
+
+DEFAULT_SIZES = (10, 1_000, 10_000)
+RESULTS_DIR = Path(__file__).parent / "results"
+
+
+@dataclass(frozen=True)
+class BenchmarkResult:
+    """Dataclass representing the timings of one benchmark at one size."""
+
+    stage: str
+    size: int
+    loops: int
+    best: float
+    median: float
+
+    @property
+    def key(self) -> str:
+        """Identifier of the benchmark, e.g. `adapt[1000]`."""
+        return f"{self.stage}[{self.size}]"
+
+    @property
+    def per_symbol(self) -> float:
+        """Median time per symbol, in seconds."""
+        return self.median / self.size
+
+
+@dataclass(frozen=True)
+class Comparison:
+    """Dataclass representing a benchmark result compared with its baseline."""
+
+    key: str
+    baseline: float
+    current: float
+
+    @property
+    def ratio(self) -> float:
+        """Current median time over the baseline one."""
+        return self.current / self.baseline
+
+
+def run_benchmark(
+    stage: str, benchmark: Benchmark, size: int, repeat: int = 5
+) -> BenchmarkResult:
+    """
+    Time a benchmark at one size.
+
+    The number of loops per repetition is calibrated so that one repetition lasts at
+    least 0.2 seconds; the best and median times per loop are kept.
+
+    Parameters
+    ----------
+    stage : str
+        Name of the benchmark.
+    benchmark : Benchmark
+        Factory of the callable to time.
+    size : int
+        Number of symbols.
+    repeat : int, optional
+        Number of timed repetitions.
+
+    Returns
+    -------
+    BenchmarkResult
+        The timings per loop, in seconds.
+
+    Raises
+    ------
+    ValueError
+        If `size` is not positive.
+    """
+    if size < 1:
+        raise ValueError("`size` must be at least 1.")
+
+    timer = timeit.Timer(benchmark(size))
+    loops, _ = timer.autorange()
+    timings = [total / loops for total in timer.repeat(repeat=repeat, number=loops)]
+    return BenchmarkResult(
+        stage=stage,
+        size=size,
+        loops=loops,
+        best=min(timings),
+        median=statistics.median(timings),
+    )
+
+
+def compare(
+    results: Iterable[BenchmarkResult], baseline: Mapping[str, Any]
+) -> list[Comparison]:
+    """
+    Compare median timings with the ones of a baseline run.
+
+    Parameters
+    ----------
+    results : Iterable[BenchmarkResult]
+        The current results.
+    baseline : Mapping[str, Any]
+        A results document written by `to_document`.
+
+    Returns
+    -------
+    list[Comparison]
+        One comparison per result also present in the baseline.
+    """
+    baseline_results = baseline.get("results", {})
+    return [
+        Comparison(
+            key=result.key,
+            baseline=baseline_results[result.key]["median"],
+            current=result.median,
+        )
+        for result in results
+        if result.key in baseline_results
+    ]
+
+
+def to_document(results: Iterable[BenchmarkResult]) -> dict[str, Any]:
+    """
+    Build the JSON document recording the results and the environment of a run.
+
+    Parameters
+    ----------
+    results : Iterable[BenchmarkResult]
+        The results of the run.
+
+    Returns
+    -------
+    dict[str, Any]
+        The document.
+    """
+    return {
+        "meta": {
+            "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "json_decoder": get_json_decoder().name,
+        },
+        "results": {result.key: asdict(result) for result in results},
+    }
+
+
+def _format_result(result: BenchmarkResult, comparison: Optional[Comparison]) -> str:
+    """Format one result as a line of the report."""
+    line = (
+        f"{result.key:<22} {result.median * 1000:>10.3f} ms "
+        f"{result.per_symbol * 1e6:>9.2f} us/symbol"
+    )
+    if comparison is not None:
+        line += f"  x{comparison.ratio:.2f} vs baseline"
+    return line
+
+
+def _parse_args(argv: Optional[Sequence[str]]) -> argparse.Namespace:
+    """Parse the command line arguments of the runner."""
+    parser = argparse.ArgumentParser(description="Benchmark the quotes pipeline.")
+    parser.add_argument(
+        "--sizes",
+        type=lambda value: [int(size) for size in value.split(",")],
+        default=list(DEFAULT_SIZES),
+        help="comma-separated numbers of symbols (default: 10,1000,10000)",
+    )
+    parser.add_argument(
+        "--stages",
+        type=lambda value: value.split(","),
+        default=list(BENCHMARKS),
+        help=f"comma-separated stages among {','.join(BENCHMARKS)}",
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="timed repetitions")
+    parser.add_argument(
+        "--output", type=Path, default=RESULTS_DIR / "latest.json", help="results file"
+    )
+    parser.add_argument("--baseline", type=Path, default=RESULTS_DIR / "baseline.json")
+    parser.add_argument(
+        "--save-baseline",
+        action="store_true",
+        help="write the results to the baseline file instead of comparing with it",
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.25,
+        help="slowdown over the baseline reported as a regression (default: 0.25)",
+    )
+    args = parser.parse_args(argv)
+    if min(args.sizes) < 1:
+        parser.error("--sizes must all be at least 1")
+    unknown = set(args.stages) - BENCHMARKS.keys()
+    if unknown:
+        parser.error(f"unknown stages: {', '.join(sorted(unknown))}")
+    return args
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """
+    Run the benchmarks, write their results and compare them with the baseline.
+
+    Parameters
+    ----------
+    argv : Sequence[str], optional
+        The arguments to parse. Defaults to `sys.argv[1:]`.
+
+    Returns
+    -------
+    int
+        The exit status: 1 if a benchmark regressed, 0 otherwise.
+    """
+    args = _parse_args(argv)
+    baseline = None
+    if not args.save_baseline and args.baseline.exists():
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+
+    results = []
+    for stage in args.stages:
+        for size in args.sizes:
+            result = run_benchmark(stage, BENCHMARKS[stage], size, repeat=args.repeat)
+            comparisons = compare([result], baseline) if baseline else []
+            print(_format_result(result, comparisons[0] if comparisons else None))
+            results.append(result)
+
+    output = args.baseline if args.save_baseline else args.output
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(to_document(results), indent=2), encoding="utf-8")
+    print(f"Results written to {output}")
+
+    if baseline is None:
+        return 0
+    regressions = [
+        comparison
+        for comparison in compare(results, baseline)
+        if comparison.ratio > 1 + args.tolerance
+    ]
+    for comparison in regressions:
+        print(f"REGRESSION {comparison.key}: x{comparison.ratio:.2f} vs baseline")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":  # pragma: no cover
+    sys.exit(main())
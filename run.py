@@ -5,8 +5,8 @@ This script serves as the entry point for the application.
 
 Notes
 -----
-This script configures logging, imports the main module, and runs the main asynchronous
-function using asyncio.
+This script configures logging, parses the command line options, imports the main
+module, and runs the main asynchronous function using asyncio.
 """
 
 import asyncio
@@ -14,7 +14,9 @@ from pathlib import Path
 
 from config import setup_logging
 from src import main
+from src.cli import parse_args
 
 if __name__ == "__main__":
+    options = parse_args()
     setup_logging(Path("logging.toml"))
-    asyncio.run(main())
+    asyncio.run(main(options))
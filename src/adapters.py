@@ -0,0 +1,245 @@
+"""Module adapting AlphaVantage quote payloads to StockQuote fields.
+
+Each supported response schema is described once, at import, by a QuoteSchema: where
+the quote record sits in the payload and which provider field maps to which StockQuote
+attribute. The mappings are validated against StockQuote when the module is imported,
+so converting a payload is a plain dictionary lookup per field. New provider endpoints
+are supported by registering another schema rather than by reshaping payloads.
+
+Provider values are strings; they are parsed into the typed StockQuote fields here, at
+ingestion, and never again afterwards.
+"""
+
+import logging
+from collections.abc import Mapping
+from dataclasses import dataclass, field, fields
+from datetime import date
+from types import MappingProxyType
+from typing import Any, Callable, Optional
+
+from .enums import AlphaVantageResponseKeys as AVResponseKeys
+from .model import StockQuote
+
+logger = logging.getLogger(__name__)
+
+STOCK_QUOTE_FIELDS = frozenset(quote_field.name for quote_field in fields(StockQuote))
+
+
+def _parse_percent(value: Any) -> float:
+    """Parse a percentage such as `"+0.45%"` or `"0.45"` to `0.45`."""
+    text = str(value).strip()
+    return float(text[:-1] if text.endswith("%") else text)
+
+
+def _parse_date(value: Any) -> date:
+    """Parse an ISO formatted date such as `"2024-03-15"`."""
+    return value if isinstance(value, date) else date.fromisoformat(str(value))
+
+
+FIELD_PARSERS: Mapping[str, Callable[[Any], Any]] = MappingProxyType(
+    {
+        "symbol": str,
+        "open": float,
+        "high": float,
+        "low": float,
+        "price": float,
+        "volume": int,
+        "latest_trading_day": _parse_date,
+        "previous_close": float,
+        "change": float,
+        "change_percent": _parse_percent,
+    }
+)
+if FIELD_PARSERS.keys() != STOCK_QUOTE_FIELDS:
+    raise ValueError("`FIELD_PARSERS` must define one parser per StockQuote field.")
+
+
+class QuoteSchemaError(ValueError):
+    """Raised when a payload does not match any known quote schema."""
+
+    def __init__(
+        self, message: str, missing_fields: frozenset[str] = frozenset()
+    ) -> None:
+        """
+        Initialize the QuoteSchemaError.
+
+        Parameters
+        ----------
+        message : str
+            Description of the mismatch.
+        missing_fields : frozenset[str], optional
+            StockQuote attributes the payload does not provide.
+        """
+        super().__init__(message)
+        self.missing_fields = missing_fields
+
+
+@dataclass(frozen=True)
+class QuoteSchema:
+    """Description of one provider response schema carrying a single quote."""
+
+    version: str
+    detect_key: str
+    field_map: Mapping[str, str]
+    container_key: Optional[str] = None
+    converters: Mapping[str, Callable[[Any], Any]] = field(
+        default_factory=lambda: MappingProxyType({})
+    )
+
+    def __post_init__(self) -> None:
+        """
+        Validate the field mapping against the StockQuote attributes.
+
+        Raises
+        ------
+        ValueError
+            If the mapping does not cover every StockQuote attribute exactly once, or
+            a converter targets an unknown attribute.
+        """
+        attributes = list(self.field_map.values())
+        duplicated = {name for name in attributes if attributes.count(name) > 1}
+        unknown = set(attributes) - STOCK_QUOTE_FIELDS
+        missing = STOCK_QUOTE_FIELDS - set(attributes)
+        if duplicated or unknown or missing:
+            raise ValueError(
+                f"Invalid field map for schema {self.version!r}: "
+                f"duplicated={sorted(duplicated)}, unknown={sorted(unknown)}, "
+                f"missing={sorted(missing)}."
+            )
+        if not set(self.converters) <= STOCK_QUOTE_FIELDS:
+            raise ValueError(f"Invalid converters for schema {self.version!r}.")
+
+    def matches(self, payload: Mapping[str, Any]) -> bool:
+        """
+        Tell whether the payload follows this schema.
+
+        Parameters
+        ----------
+        payload : Mapping[str, Any]
+            The provider payload of a single quote.
+
+        Returns
+        -------
+        bool
+            Whether the payload carries this schema's `detect_key`.
+        """
+        return self.detect_key in payload
+
+    def adapt(self, payload: Mapping[str, Any]) -> dict[str, Any]:
+        """
+        Convert a payload of this schema to typed StockQuote keyword arguments.
+
+        Provider fields absent from the mapping are logged and ignored. Values go
+        through the schema's converters, then through the `FIELD_PARSERS`.
+
+        Parameters
+        ----------
+        payload : Mapping[str, Any]
+            The provider payload of a single quote.
+
+        Returns
+        -------
+        dict[str, Any]
+            The StockQuote attributes.
+
+        Raises
+        ------
+        QuoteSchemaError
+            If the payload lacks fields needed by StockQuote.
+        ValueError
+            If a value can not be parsed to the type of its StockQuote field.
+        """
+        record = payload if self.container_key is None else payload[self.container_key]
+        field_map = self.field_map
+        stock_data = {
+            field_map[key]: value for key, value in record.items() if key in field_map
+        }
+        if len(stock_data) != len(STOCK_QUOTE_FIELDS):
+            missing = STOCK_QUOTE_FIELDS - stock_data.keys()
+            raise QuoteSchemaError(
+                f"Quote payload of schema {self.version!r} lacks {sorted(missing)}.",
+                missing_fields=frozenset(missing),
+            )
+        if len(record) != len(field_map):
+            logger.warning(
+                "Ignoring unknown fields of schema %r: %s",
+                self.version,
+                sorted(record.keys() - field_map.keys()),
+            )
+        for name, converter in self.converters.items():
+            stock_data[name] = converter(stock_data[name])
+        return {name: FIELD_PARSERS[name](value) for name, value in stock_data.items()}
+
+
+GLOBAL_QUOTE_V1 = QuoteSchema(
+    version="global_quote/v1",
+    detect_key=AVResponseKeys.GLOBAL_QUOTE,
+    container_key=AVResponseKeys.GLOBAL_QUOTE,
+    field_map=MappingProxyType(
+        {
+            "01. symbol": "symbol",
+            "02. open": "open",
+            "03. high": "high",
+            "04. low": "low",
+            "05. price": "price",
+            "06. volume": "volume",
+            "07. latest trading day": "latest_trading_day",
+            "08. previous close": "previous_close",
+            "09. change": "change",
+            "10. change percent": "change_percent",
+        }
+    ),
+)
+
+REALTIME_BULK_QUOTE_V1 = QuoteSchema(
+    version="realtime_bulk_quote/v1",
+    detect_key="timestamp",
+    field_map=MappingProxyType(
+        {
+            "symbol": "symbol",
+            "open": "open",
+            "high": "high",
+            "low": "low",
+            "close": "price",
+            "volume": "volume",
+            "timestamp": "latest_trading_day",
+            "previous_close": "previous_close",
+            "change": "change",
+            "change_percent": "change_percent",
+        }
+    ),
+    converters=MappingProxyType({"latest_trading_day": lambda value: str(value)[:10]}),
+)
+
+QUOTE_SCHEMAS: tuple[QuoteSchema, ...] = (GLOBAL_QUOTE_V1, REALTIME_BULK_QUOTE_V1)
+
+
+def adapt_quote(payload: Any) -> dict[str, Any]:
+    """
+    Convert the provider payload of a single quote to typed StockQuote arguments.
+
+    Parameters
+    ----------
+    payload : Any
+        The provider payload, in any of the `QUOTE_SCHEMAS`.
+
+    Returns
+    -------
+    dict[str, Any]
+        The StockQuote attributes.
+
+    Raises
+    ------
+    QuoteSchemaError
+        If the payload does not match any known schema or lacks required fields.
+    ValueError
+        If a value can not be parsed to the type of its StockQuote field.
+    """
+    if isinstance(payload, Mapping):
+        for schema in QUOTE_SCHEMAS:
+            if schema.matches(payload):
+                return schema.adapt(payload)
+        keys = sorted(payload)
+    else:
+        keys = []
+    raise QuoteSchemaError(f"Unknown quote payload with keys {keys}.")
@@ -0,0 +1,271 @@
+"""Module providing screening analytics over the quotes of a QuoteStore.
+
+The screens read snapshots of the numeric columns of the store. When NumPy is
+installed, the snapshots are wrapped as NumPy arrays without further copies and
+screened with vectorized operations; otherwise a pure-Python implementation giving the
+same results is used.
+"""
+
+import heapq
+import importlib
+import math
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from .model import QuoteStore
+
+try:
+    _np: Optional[Any] = importlib.import_module("numpy")
+except ImportError:  # pragma: no cover - depends on the environment
+    _np = None
+
+
+@dataclass(frozen=True)
+class SectorAggregate:
+    """Dataclass representing the aggregated quotes of the symbols of a sector."""
+
+    count: int
+    mean_change_percent: float
+    total_volume: int
+
+
+def top_movers(
+    store: QuoteStore, n: int = 10, descending: bool = True
+) -> list[tuple[str, float]]:
+    """
+    Rank the symbols by change percent.
+
+    Parameters
+    ----------
+    store : QuoteStore
+        The quotes to screen.
+    n : int, optional
+        Number of symbols to return.
+    descending : bool, optional
+        Whether to return the top gainers rather than the top losers.
+
+    Returns
+    -------
+    list[tuple[str, float]]
+        The `(symbol, change_percent)` pairs of the `n` top movers, best first.
+    """
+    if n < 1 or not len(store):
+        return []
+    if _np is None:
+        return _top_movers_python(store, n, descending)
+    return _top_movers_numpy(_np, store, n, descending)
+
+
+def gap_ups(store: QuoteStore, min_gap_percent: float = 2.0) -> list[tuple[str, float]]:
+    """
+    Find the symbols which opened above their previous close by at least a margin.
+
+    Symbols without a positive previous close are left out.
+
+    Parameters
+    ----------
+    store : QuoteStore
+        The quotes to screen.
+    min_gap_percent : float, optional
+        Minimum gap between the open and the previous close, in percent.
+
+    Returns
+    -------
+    list[tuple[str, float]]
+        The `(symbol, gap_percent)` pairs of the matching symbols, largest gap first.
+    """
+    if _np is None:
+        return _gap_ups_python(store, min_gap_percent)
+    return _gap_ups_numpy(_np, store, min_gap_percent)
+
+
+def volume_anomalies(
+    store: QuoteStore, threshold: float = 3.0
+) -> list[tuple[str, float]]:
+    """
+    Find the symbols whose volume z-score is at least the threshold.
+
+    Parameters
+    ----------
+    store : QuoteStore
+        The quotes to screen.
+    threshold : float, optional
+        Minimum number of standard deviations above the mean volume.
+
+    Returns
+    -------
+    list[tuple[str, float]]
+        The `(symbol, z_score)` pairs of the anomalous symbols, highest first. Empty
+        when all the volumes are equal.
+    """
+    if len(store) < 2:
+        return []
+    if _np is None:
+        return _volume_anomalies_python(store, threshold)
+    return _volume_anomalies_numpy(_np, store, threshold)
+
+
+def sector_aggregates(
+    store: QuoteStore, sectors: Mapping[str, str]
+) -> dict[str, SectorAggregate]:
+    """
+    Aggregate the quotes of the symbols of each sector.
+
+    Parameters
+    ----------
+    store : QuoteStore
+        The quotes to aggregate.
+    sectors : Mapping[str, str]
+        The sector of each symbol. Symbols without a sector are left out.
+
+    Returns
+    -------
+    dict[str, SectorAggregate]
+        The aggregate of every sector with at least one quote.
+    """
+    if _np is None:
+        return _sector_aggregates_python(store, sectors)
+    return _sector_aggregates_numpy(_np, store, sectors)
+
+
+def _by_value(matches: list[tuple[str, float]]) -> list[tuple[str, float]]:
+    """Sort `(symbol, value)` pairs by decreasing value, keeping ties in row order."""
+    return sorted(matches, key=lambda match: match[1], reverse=True)
+
+
+def _top_movers_python(
+    store: QuoteStore, n: int, descending: bool
+) -> list[tuple[str, float]]:
+    """Rank the symbols by change percent with a partial sort."""
+    symbols = store.symbols
+    changes = store.column("change_percent")
+    select = heapq.nlargest if descending else heapq.nsmallest
+    rows = select(n, range(len(symbols)), key=changes.__getitem__)
+    return [(symbols[row], changes[row]) for row in rows]
+
+
+def _top_movers_numpy(
+    np: Any, store: QuoteStore, n: int, descending: bool
+) -> list[tuple[str, float]]:
+    """Rank the symbols by change percent with a vectorized partial sort."""
+    changes = np.frombuffer(store.column("change_percent"), dtype=np.float64)
+    keys = -changes if descending else changes
+    if n < len(keys):
+        candidates = np.argpartition(keys, n - 1)[:n]
+        rows = candidates[np.argsort(keys[candidates], kind="stable")]
+    else:
+        rows = np.argsort(keys, kind="stable")
+    symbols = store.symbols
+    return [(symbols[row], float(changes[row])) for row in rows.tolist()]
+
+
+def _gap_ups_python(
+    store: QuoteStore, min_gap_percent: float
+) -> list[tuple[str, float]]:
+    """Find the gap-ups with a loop over the open and previous close columns."""
+    matches = []
+    for symbol, open_, close in zip(
+        store.symbols, store.column("open"), store.column("previous_close")
+    ):
+        if close > 0 and (gap := (open_ - close) / close * 100) >= min_gap_percent:
+            matches.append((symbol, gap))
+    return _by_value(matches)
+
+
+def _gap_ups_numpy(
+    np: Any, store: QuoteStore, min_gap_percent: float
+) -> list[tuple[str, float]]:
+    """Find the gap-ups with vectorized arithmetic over the columns."""
+    opens = np.frombuffer(store.column("open"), dtype=np.float64)
+    closes = np.frombuffer(store.column("previous_close"), dtype=np.float64)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        gaps = (opens - closes) / closes * 100
+    rows = np.flatnonzero((closes > 0) & (gaps >= min_gap_percent))
+    rows = rows[np.argsort(-gaps[rows], kind="stable")]
+    symbols = store.symbols
+    return [(symbols[row], float(gaps[row])) for row in rows.tolist()]
+
+
+def _volume_anomalies_python(
+    store: QuoteStore, threshold: float
+) -> list[tuple[str, float]]:
+    """Compute the volume z-scores with a loop over the volume column."""
+    volumes = store.column("volume")
+    mean = math.fsum(volumes) / len(volumes)
+    std = math.sqrt(
+        math.fsum((volume - mean) ** 2 for volume in volumes) / len(volumes)
+    )
+    if std == 0:
+        return []
+    matches = []
+    for symbol, volume in zip(store.symbols, volumes):
+        if (score := (volume - mean) / std) >= threshold:
+            matches.append((symbol, score))
+    return _by_value(matches)
+
+
+def _volume_anomalies_numpy(
+    np: Any, store: QuoteStore, threshold: float
+) -> list[tuple[str, float]]:
+    """Compute the volume z-scores with vectorized arithmetic over the column."""
+    volumes = np.frombuffer(store.column("volume"), dtype=np.int64).astype(np.float64)
+    std = volumes.std()
+    if std == 0:
+        return []
+    scores = (volumes - volumes.mean()) / std
+    rows = np.flatnonzero(scores >= threshold)
+    rows = rows[np.argsort(-scores[rows], kind="stable")]
+    symbols = store.symbols
+    return [(symbols[row], float(scores[row])) for row in rows.tolist()]
+
+
+def _sector_aggregates_python(
+    store: QuoteStore, sectors: Mapping[str, str]
+) -> dict[str, SectorAggregate]:
+    """Aggregate the sectors with a loop accumulating per-sector sums."""
+    sums: dict[str, tuple[int, float, int]] = {}
+    for symbol, change, volume in zip(
+        store.symbols, store.column("change_percent"), store.column("volume")
+    ):
+        sector = sectors.get(symbol)
+        if sector is not None:
+            count, change_sum, volume_sum = sums.get(sector, (0, 0.0, 0))
+            sums[sector] = (count + 1, change_sum + change, volume_sum + volume)
+    return {
+        sector: SectorAggregate(count, change_sum / count, volume_sum)
+        for sector, (count, change_sum, volume_sum) in sums.items()
+    }
+
+
+def _sector_aggregates_numpy(
+    np: Any, store: QuoteStore, sectors: Mapping[str, str]
+) -> dict[str, SectorAggregate]:
+    """Aggregate the sectors by binning the columns on per-row sector codes."""
+    codes_by_sector: dict[str, int] = {}
+    codes = np.array(
+        [
+            -1
+            if sector is None
+            else codes_by_sector.setdefault(sector, len(codes_by_sector))
+            for sector in map(sectors.get, store.symbols)
+        ],
+        dtype=np.int64,
+    )
+    mapped = codes >= 0
+    codes = codes[mapped]
+    size = len(codes_by_sector)
+    changes = np.frombuffer(store.column("change_percent"), dtype=np.float64)[mapped]
+    volumes = np.frombuffer(store.column("volume"), dtype=np.int64)[mapped]
+    counts = np.bincount(codes, minlength=size)
+    change_sums = np.bincount(codes, weights=changes, minlength=size)
+    volume_sums = np.zeros(size, dtype=np.int64)
+    np.add.at(volume_sums, codes, volumes)
+    return {
+        sector: SectorAggregate(
+            count=int(counts[code]),
+            mean_change_percent=float(change_sums[code] / counts[code]),
+            total_volume=int(volume_sums[code]),
+        )
+        for sector, code in codes_by_sector.items()
+    }
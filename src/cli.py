@@ -0,0 +1,207 @@
+"""Module defining the command line interface options of the application."""
+
+import argparse
+from collections.abc import Sequence
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+
+@dataclass(frozen=True)
+class CLIOptions:
+    """Dataclass representing the parsed command line options."""
+
+    watch: bool = False
+    symbols: tuple[str, ...] = ()
+    interval: float = 60.0
+    jitter: float = 5.0
+    use_bulk_quotes: bool = False
+    metrics_file: Optional[Path] = None
+    headless: bool = False
+    serve: bool = False
+    listen: tuple[str, int] = ("127.0.0.1", 9100)
+
+
+def parse_args(argv: Optional[Sequence[str]] = None) -> CLIOptions:
+    """
+    Parse the command line arguments.
+
+    Parameters
+    ----------
+    argv : Sequence[str], optional
+        The arguments to parse. Defaults to `sys.argv[1:]`.
+
+    Returns
+    -------
+    CLIOptions
+        The parsed command line options.
+    """
+    parser = _build_parser()
+    args = parser.parse_args(argv)
+
+    symbols = list(args.symbols or [])
+    if args.symbols_file is not None:
+        symbols.extend(read_symbols_file(path=args.symbols_file))
+
+    if args.watch + args.headless + args.serve > 1:
+        parser.error("--watch, --headless and --serve are mutually exclusive")
+    if args.watch and not symbols:
+        parser.error("--watch requires --symbols or --symbols-file")
+    if args.headless and not symbols:
+        parser.error("--headless requires --symbols or --symbols-file")
+    if args.interval <= 0:
+        parser.error("--interval must be positive")
+    if args.jitter < 0:
+        parser.error("--jitter must not be negative")
+
+    return CLIOptions(
+        watch=args.watch,
+        symbols=tuple(symbols),
+        interval=args.interval,
+        jitter=args.jitter,
+        use_bulk_quotes=args.bulk,
+        metrics_file=args.metrics_file,
+        headless=args.headless,
+        serve=args.serve,
+        listen=args.listen,
+    )
+
+
+def read_symbols_file(path: Path) -> list[str]:
+    """
+    Read stock symbols from a file.
+
+    Symbols may be separated by commas or new lines. Blank entries and lines starting
+    with `#` are ignored.
+
+    Parameters
+    ----------
+    path : Path
+        The path to the symbols file.
+
+    Returns
+    -------
+    list[str]
+        The stock symbols in file order.
+    """
+    symbols = []
+    for line in path.read_text(encoding="utf-8").splitlines():
+        if line.lstrip().startswith("#"):
+            continue
+        symbols.extend(_split_symbols(line))
+    return symbols
+
+
+def _split_symbols(symbols_string: str) -> list[str]:
+    """
+    Split a comma-separated string of symbols, dropping blank entries.
+
+    Parameters
+    ----------
+    symbols_string : str
+        Comma-separated string of stock symbols.
+
+    Returns
+    -------
+    list[str]
+        List of stock symbols.
+    """
+    return [symbol.strip() for symbol in symbols_string.split(",") if symbol.strip()]
+
+
+def _parse_address(address: str) -> tuple[str, int]:
+    """
+    Parse a `host:port` address, the host defaulting to every interface.
+
+    Parameters
+    ----------
+    address : str
+        The address, e.g. `127.0.0.1:9100` or `:9100`.
+
+    Returns
+    -------
+    tuple[str, int]
+        The host and the port.
+
+    Raises
+    ------
+    argparse.ArgumentTypeError
+        If the address has no valid port.
+    """
+    host, _, port = address.rpartition(":")
+    if not port.isdigit() or not 0 <= int(port) <= 65535:
+        raise argparse.ArgumentTypeError(f"invalid address: {address!r}")
+    return host.strip("[]") or "0.0.0.0", int(port)
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    """
+    Build the argument parser of the application.
+
+    Returns
+    -------
+    argparse.ArgumentParser
+        The argument parser.
+    """
+    parser = argparse.ArgumentParser(
+        description="Asynchronously check real-time stock prices."
+    )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="refresh the given symbols periodically instead of prompting for them",
+    )
+    parser.add_argument(
+        "--symbols",
+        type=_split_symbols,
+        help="comma-separated stock symbols to watch, e.g. AAPL,MSFT",
+    )
+    parser.add_argument(
+        "--symbols-file",
+        type=Path,
+        help="file with stock symbols to watch, comma or newline separated",
+    )
+    parser.add_argument(
+        "--interval",
+        type=float,
+        default=CLIOptions.interval,
+        help="seconds between two refreshes in watch mode (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--jitter",
+        type=float,
+        default=CLIOptions.jitter,
+        help="maximum random delay added to each refresh (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--bulk",
+        action="store_true",
+        help="fetch up to 100 symbols per request with the bulk quotes endpoint",
+    )
+    parser.add_argument(
+        "--metrics-file",
+        type=Path,
+        help="file the latency metrics are written to after every refresh, "
+        "in Prometheus text format for .prom and .txt files and JSON otherwise",
+    )
+    parser.add_argument(
+        "--headless",
+        action="store_true",
+        help="refresh the given symbols periodically without a terminal, serving "
+        "/metrics and /healthz over HTTP",
+    )
+    parser.add_argument(
+        "--serve",
+        action="store_true",
+        help="serve the stock quotes to other services over HTTP, "
+        "at GET /quotes?symbols=AAPL,MSFT",
+    )
+    parser.add_argument(
+        "--listen",
+        type=_parse_address,
+        default=CLIOptions.listen,
+        metavar="HOST:PORT",
+        help="address the headless and serve modes listen on "
+        "(default: 127.0.0.1:9100)",
+    )
+    return parser
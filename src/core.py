@@ -6,38 +6,206 @@ stock quotes.
 """
 
 import logging
+from typing import Callable, Optional
 
-from toolkit.api import AsyncAPIClient
+from toolkit.api import (
+    AsyncAPIClient,
+    CircuitBreaker,
+    RetryPolicy,
+    TokenBucketRateLimiter,
+)
+from toolkit.concurrency import run_periodically
+from toolkit.metrics import MetricsRegistry
 
+from .cli import CLIOptions
 from .config import get_api_key
+from .daemon import Daemon
 from .enums import AlphaVantageAPIConsts as AVAPIConsts
-from .fetcher import StockQuotesFetcher
+from .enums import AlphaVantageAPILimits as AVAPILimits
+from .fetcher import (
+    CachedStockQuotesFetcher,
+    CoalescingStockQuotesFetcher,
+    ConcurrencyLimitedStockQuotesFetcher,
+    StockQuotesFetcher,
+)
 from .model import Model
 from .presenter import Presenter
-from .view import View
+from .quote_service import QuoteService
+from .view import HeadlessView, LiveView, View, ViewInterface
 
 logger = logging.getLogger(__name__)
 
 
-async def main() -> None:  # pragma: no cover
+async def main(options: Optional[CLIOptions] = None) -> None:  # pragma: no cover
     """
     Initialize the main asynchronous function for the application.
 
     This function initializes the necessary components such as the model, view,
     API client, fetcher, and presenter. It then enters a loop where the model is updated
-    asynchronously, and the view is updated accordingly.
+    asynchronously, and the view is updated accordingly. In watch mode, the given
+    symbols are refreshed periodically instead of being prompted for. In headless
+    mode, they are refreshed without a terminal while metrics and health are served
+    over HTTP. In serve mode, the quotes are served to other services over HTTP.
+
+    Parameters
+    ----------
+    options : CLIOptions, optional
+        The command line options. Defaults to the interactive mode.
     """
+    options = options or CLIOptions()
+    metrics = (
+        MetricsRegistry()
+        if options.metrics_file is not None or options.headless
+        else None
+    )
     model = Model()
-    view = View()
+    view: ViewInterface
+    if options.headless or options.serve:
+        view = HeadlessView(symbols=options.symbols)
+    elif options.watch:
+        view = LiveView(metrics=metrics)
+    else:
+        view = View(metrics=metrics)
 
     api_key = get_api_key()
-    api_client = AsyncAPIClient(base_url=AVAPIConsts.BASE_URL)
-    fetcher = StockQuotesFetcher(api_client=api_client, api_key=api_key)
+    async with AsyncAPIClient(
+        base_url=AVAPIConsts.BASE_URL,
+        retry_policy=RetryPolicy(),
+        circuit_breaker_factory=CircuitBreaker,
+        metrics=metrics,
+    ) as api_client:
+        rate_limiter = TokenBucketRateLimiter(
+            rate=AVAPILimits.REQUESTS_PER_MINUTE / 60,
+            burst=AVAPILimits.BURST,
+            daily_budget=AVAPILimits.REQUESTS_PER_DAY,
+        )
+        cache = CachedStockQuotesFetcher(
+            fetcher=ConcurrencyLimitedStockQuotesFetcher(
+                fetcher=StockQuotesFetcher(
+                    api_client=api_client,
+                    api_key=api_key,
+                    rate_limiter=rate_limiter,
+                    metrics=metrics,
+                )
+            )
+        )
+        fetcher = CoalescingStockQuotesFetcher(fetcher=cache)
+
+        if options.serve:
+            logger.debug("Application Has been Started in serve mode.")
+            await QuoteService(fetcher=fetcher).run(*options.listen)
+            return
+
+        presenter = Presenter(
+            model=model,
+            view=view,
+            fetcher=fetcher,
+            use_bulk_quotes=options.use_bulk_quotes,
+            progressive=isinstance(view, LiveView),
+            metrics=metrics,
+        )
+
+        def write_metrics() -> None:
+            if metrics is not None and options.metrics_file is not None:
+                metrics.write(options.metrics_file)
+
+        if options.headless and metrics is not None:
+            daemon = Daemon(
+                presenter=presenter,
+                model=model,
+                symbols=list(options.symbols),
+                metrics=metrics,
+                interval=options.interval,
+                jitter=options.jitter,
+                cache=cache,
+                coalescer=fetcher,
+                rate_limiter=rate_limiter,
+                on_refresh=write_metrics,
+            )
+            logger.debug("Application Has been Started in headless mode.")
+            await daemon.run(*options.listen)
+        elif isinstance(view, LiveView):
+            await _watch(
+                presenter=presenter,
+                view=view,
+                options=options,
+                on_refresh=write_metrics,
+            )
+        elif isinstance(view, View):
+            await _interact(presenter=presenter, view=view, on_refresh=write_metrics)
 
-    presenter = Presenter(model=model, view=view, fetcher=fetcher)
 
+async def _interact(
+    presenter: Presenter, view: View, on_refresh: Callable[[], None]
+) -> None:  # pragma: no cover
+    """
+    Prompt for symbols and show their stock quotes, forever.
+
+    Parameters
+    ----------
+    presenter : Presenter
+        The application presenter.
+    view : View
+        The application view.
+    on_refresh : Callable[[], None]
+        Function called after every refresh of the view.
+    """
     view.welcome()
     logger.debug("Application Has been Started.")
     while True:
         await presenter.update_model()
         presenter.update_view()
+        _notify_refresh(on_refresh)
+
+
+async def _watch(
+    presenter: Presenter,
+    view: LiveView,
+    options: CLIOptions,
+    on_refresh: Callable[[], None],
+) -> None:  # pragma: no cover
+    """
+    Refresh the stock quotes of the watched symbols periodically, forever.
+
+    Parameters
+    ----------
+    presenter : Presenter
+        The application presenter.
+    view : LiveView
+        The live view the quotes are rendered to.
+    options : CLIOptions
+        The command line options holding the symbols and the refresh schedule.
+    on_refresh : Callable[[], None]
+        Function called after every refresh of the view.
+    """
+    symbols_list = list(options.symbols)
+
+    async def refresh() -> None:
+        await presenter.refresh_model(symbols_list=symbols_list)
+        presenter.update_view()
+        _notify_refresh(on_refresh)
+        if presenter.failed_symbols:
+            # Retry halfway to the next refresh, once throttling had time to clear.
+            await presenter.retry_failed_symbols(delay=options.interval / 2)
+            presenter.update_view()
+            _notify_refresh(on_refresh)
+
+    logger.debug("Application Has been Started in watch mode.")
+    with view:
+        await run_periodically(
+            refresh, interval=options.interval, jitter=options.jitter
+        )
+
+
+def _notify_refresh(on_refresh: Callable[[], None]) -> None:
+    """Call `on_refresh`, logging an OSError instead of ending the mode.
+
+    Parameters
+    ----------
+    on_refresh : Callable[[], None]
+        Function called after every refresh of the view.
+    """
+    try:
+        on_refresh()
+    except OSError as error:
+        logger.error("Refresh callback failed: %s", error)
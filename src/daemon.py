@@ -0,0 +1,259 @@
+"""Module defining the headless daemon mode of the application.
+
+The daemon refreshes a fixed list of symbols periodically, without a terminal, and
+serves its metrics and health over HTTP so it can be monitored and scraped.
+"""
+
+import json
+import logging
+import time
+from http import HTTPStatus
+from typing import Any, Callable, Optional
+
+from toolkit.api import TokenBucketRateLimiter
+from toolkit.concurrency import run_periodically
+from toolkit.metrics import PROMETHEUS_CONTENT_TYPE, MetricsRegistry
+from toolkit.server import JSON_CONTENT_TYPE, HTTPRequest, HTTPResponse, HTTPServer
+
+from .fetcher import CachedStockQuotesFetcher, CoalescingStockQuotesFetcher
+from .model import Model
+from .presenter import Presenter
+
+logger = logging.getLogger(__name__)
+
+
+class Daemon:
+    """
+    Headless refresher of a watchlist, serving `/metrics` and `/healthz`.
+
+    `/metrics` exposes the registry in the Prometheus text format. The cache, quota
+    and in-flight gauges are read from the fetchers and the rate limiter when they
+    are scraped, so they cost nothing between scrapes. `/healthz` answers 200 while
+    the watchlist has been refreshed recently, and 503 before the first refresh or
+    once refreshes stopped completing.
+    """
+
+    def __init__(
+        self,
+        presenter: Presenter,
+        model: Model,
+        symbols: list[str],
+        metrics: MetricsRegistry,
+        interval: float = 60.0,
+        jitter: float = 0.0,
+        cache: Optional[CachedStockQuotesFetcher] = None,
+        coalescer: Optional[CoalescingStockQuotesFetcher] = None,
+        rate_limiter: Optional[TokenBucketRateLimiter] = None,
+        stale_after: Optional[float] = None,
+        retry_delay: Optional[float] = None,
+        on_refresh: Optional[Callable[[], None]] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Initialize the Daemon.
+
+        Parameters
+        ----------
+        presenter : Presenter
+            The presenter refreshing the model, usually with a `HeadlessView`.
+        model : Model
+            The model holding the stock quotes.
+        symbols : list[str]
+            The symbols refreshed periodically.
+        metrics : MetricsRegistry
+            Registry shared with the pipeline and served on `/metrics`.
+        interval : float, optional
+            Seconds between two refreshes.
+        jitter : float, optional
+            Maximum random delay added to each refresh.
+        cache : CachedStockQuotesFetcher, optional
+            Cache whose hit ratio is exported.
+        coalescer : CoalescingStockQuotesFetcher, optional
+            Single-flight layer whose in-flight fetches are exported.
+        rate_limiter : TokenBucketRateLimiter, optional
+            Rate limiter whose remaining daily quota is exported.
+        stale_after : float, optional
+            Seconds since the last completed refresh after which the daemon is
+            unhealthy. Defaults to three refresh periods.
+        retry_delay : float, optional
+            Seconds to wait after a refresh before retrying the symbols that failed.
+            Defaults to half the interval, so that retries land between refreshes.
+        on_refresh : Callable[[], None], optional
+            Function called after every completed refresh, e.g. to write the metrics
+            to a file. An OSError it raises is logged.
+        clock : Callable[[], float], optional
+            Monotonic clock returning seconds.
+
+        Raises
+        ------
+        ValueError
+            If `stale_after` is not positive or `retry_delay` is negative.
+        """
+        if stale_after is None:
+            stale_after = 3 * (interval + jitter)
+        if stale_after <= 0:
+            raise ValueError("`stale_after` must be positive.")
+        if retry_delay is None:
+            retry_delay = interval / 2
+        if retry_delay < 0:
+            raise ValueError("`retry_delay` must not be negative.")
+
+        self.presenter = presenter
+        self.model = model
+        self.symbols = list(symbols)
+        self.metrics = metrics
+        self.interval = interval
+        self.jitter = jitter
+        self.cache = cache
+        self.coalescer = coalescer
+        self.rate_limiter = rate_limiter
+        self.stale_after = stale_after
+        self.retry_delay = retry_delay
+        self._on_refresh = on_refresh
+        self._clock = clock
+        self._last_refresh: Optional[float] = None
+        self._refreshes = metrics.counter(
+            "daemon_refreshes_total", "Completed refreshes of the watchlist."
+        )
+        self._refresh_time = metrics.histogram(
+            "daemon_refresh_duration_seconds",
+            "Wall time of refreshing the watchlist, retries excluded.",
+        )
+
+    async def refresh(self) -> None:
+        """
+        Refresh the watchlist once, then retry the symbols that failed.
+
+        The retry waits `retry_delay` seconds first, so that the throttling or open
+        circuit breaker behind the failures has time to clear.
+        """
+        with self._refresh_time.time():
+            await self.presenter.refresh_model(symbols_list=self.symbols)
+            self.presenter.update_view()
+        self._last_refresh = self._clock()
+        self._refreshes.inc()
+        self._notify_refresh()
+
+        if self.presenter.failed_symbols:
+            await self.presenter.retry_failed_symbols(delay=self.retry_delay)
+            self.presenter.update_view()
+            self._notify_refresh()
+
+    def _notify_refresh(self) -> None:
+        """Call `on_refresh`, logging an OSError instead of stopping the daemon."""
+        if self._on_refresh is None:
+            return
+        try:
+            self._on_refresh()
+        except OSError as error:
+            logger.error("Refresh callback failed: %s", error)
+
+    async def run(self, host: str = "127.0.0.1", port: int = 9100) -> None:
+        """
+        Serve the endpoints and refresh the watchlist periodically, forever.
+
+        Parameters
+        ----------
+        host : str, optional
+            Interface the HTTP server listens on.
+        port : int, optional
+            Port the HTTP server listens on.
+        """
+        async with HTTPServer(self.handle, host=host, port=port) as server:
+            logger.info("Serving /metrics and /healthz on %s.", server.url)
+            await run_periodically(
+                self.refresh, interval=self.interval, jitter=self.jitter
+            )
+
+    async def handle(self, request: HTTPRequest) -> HTTPResponse:
+        """
+        Answer an HTTP request to one of the endpoints.
+
+        Parameters
+        ----------
+        request : HTTPRequest
+            The request.
+
+        Returns
+        -------
+        HTTPResponse
+            The metrics, the health report, or a 404 or 405 error.
+        """
+        if request.path not in ("/metrics", "/healthz"):
+            return HTTPResponse(status=HTTPStatus.NOT_FOUND, body=b"Not Found")
+        if request.method != "GET":
+            return HTTPResponse(
+                status=HTTPStatus.METHOD_NOT_ALLOWED,
+                body=b"Method Not Allowed",
+                headers={"Allow": "GET"},
+            )
+
+        if request.path == "/metrics":
+            self.update_gauges()
+            return HTTPResponse(
+                body=self.metrics.to_prometheus().encode(),
+                content_type=PROMETHEUS_CONTENT_TYPE,
+            )
+        report = self.health()
+        return HTTPResponse(
+            status=HTTPStatus.OK
+            if report["status"] == "ok"
+            else HTTPStatus.SERVICE_UNAVAILABLE,
+            body=json.dumps(report).encode(),
+            content_type=JSON_CONTENT_TYPE,
+        )
+
+    def health(self) -> dict[str, Any]:
+        """
+        Report whether the watchlist is being refreshed.
+
+        Returns
+        -------
+        dict[str, Any]
+            The status, "starting" before the first refresh completed, "ok" if the
+            last one completed within `stale_after` seconds and "stale" otherwise,
+            with the age of the last refresh and the number of quotes held, stale
+            and waiting for a retry.
+        """
+        if self._last_refresh is None:
+            status, age = "starting", None
+        else:
+            age = self._clock() - self._last_refresh
+            status = "ok" if age <= self.stale_after else "stale"
+        return {
+            "status": status,
+            "last_refresh_age_seconds": age,
+            "symbols": len(self.symbols),
+            "quotes": len(self.model.store),
+            "stale_quotes": len(self.model.stale_symbols),
+            "failed_symbols": len(self.presenter.failed_symbols),
+        }
+
+    def update_gauges(self) -> None:
+        """Copy the state of the cache, coalescer and rate limiter into metrics."""
+        metrics = self.metrics
+        if self.cache is not None:
+            stats = self.cache.stats
+            for result, value in (("hit", stats.hits), ("miss", stats.misses)):
+                counter = metrics.counter(
+                    "quote_cache_lookups_total",
+                    "Stock quote cache lookups by result.",
+                    labels={"result": result},
+                )
+                counter.inc(value - counter.value)
+            metrics.gauge(
+                "quote_cache_hit_ratio",
+                "Fraction of stock quote lookups served from the cache.",
+            ).set(stats.hit_ratio)
+        if self.coalescer is not None:
+            metrics.gauge(
+                "quote_fetches_in_flight",
+                "Distinct stock quote fetches in flight, after coalescing.",
+            ).set(self.coalescer.in_flight)
+        if self.rate_limiter is not None:
+            remaining = self.rate_limiter.remaining_daily_budget
+            if remaining is not None:
+                metrics.gauge(
+                    "quota_remaining_daily_requests",
+                    "Requests left in today's API quota.",
+                ).set(remaining)
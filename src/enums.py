@@ -1,6 +1,6 @@
 """Module defining constants for the AlphaVantage API and messages for the app view."""
 
-from enum import StrEnum
+from enum import IntEnum, StrEnum
 
 
 class AlphaVantageAPIConsts(StrEnum):
@@ -9,6 +9,46 @@ class AlphaVantageAPIConsts(StrEnum):
     BASE_URL = "https://www.alphavantage.co"
     ENDPOINT = "/query"
     OPERATION = "GLOBAL_QUOTE"
+    BULK_OPERATION = "REALTIME_BULK_QUOTES"
+
+
+class AlphaVantageAPILimits(IntEnum):
+    """Request quotas enforced by the AlphaVantage API."""
+
+    REQUESTS_PER_MINUTE = 5
+    REQUESTS_PER_DAY = 25
+    BURST = 5
+    BULK_SYMBOLS_PER_REQUEST = 100
+    QUOTA_WINDOW_SECONDS = 60
+
+
+class AlphaVantageResponseKeys(StrEnum):
+    """Top-level keys of AlphaVantage API responses."""
+
+    GLOBAL_QUOTE = "Global Quote"
+    BULK_DATA = "data"
+    NOTE = "Note"
+    INFORMATION = "Information"
+    ERROR_MESSAGE = "Error Message"
+
+
+class FetchStatus(StrEnum):
+    """Outcomes of fetching the stock quote of a single symbol."""
+
+    SUCCESS = "success"
+    HTTP_ERROR = "http_error"
+    THROTTLED = "throttled"
+    PARSE_ERROR = "parse_error"
+    INTERNAL_ERROR = "internal_error"
+
+
+class QuoteChange(StrEnum):
+    """Kinds of change of the stock quote of a single symbol in the model."""
+
+    ADDED = "added"
+    UPDATED = "updated"
+    UNCHANGED = "unchanged"
+    REMOVED = "removed"
 
 
 class ViewMessages(StrEnum):
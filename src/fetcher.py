@@ -1,18 +1,88 @@
 """Asynchronous stock quotes fetching module.
 
-Asynchronous stock quotes fetching module with an abstract base class and a concrete
-implementation utilizing an AsyncAPIClient.
+Asynchronous stock quotes fetching module with an abstract base class, a concrete
+implementation utilizing an AsyncAPIClient, and caching, request coalescing and
+concurrency limiting decorators around any fetcher.
+
+AlphaVantage reports throttling and invalid calls with HTTP 200 responses carrying a
+`Note`, `Information` or `Error Message` key instead of data. The fetcher recognizes
+those payloads from their top-level keys and raises a typed exception, so they are
+never mistaken for quotes.
 """
 
+import asyncio
 import json
 import logging
 from abc import ABC, abstractmethod
-from typing import Any
+from collections.abc import Awaitable
+from functools import partial
+from typing import Any, Callable, Optional
+
+from toolkit.api import AsyncAPIClient, RateLimiterInterface, RateLimitExceededError
+from toolkit.cache import CacheStats, TTLCache
+from toolkit.concurrency import SingleFlight
+from toolkit.metrics import MetricsRegistry, timed
+from toolkit.serialization import JSONDecoderInterface, get_json_decoder
 
-from toolkit.api import AsyncAPIClient
+from .enums import AlphaVantageAPIConsts as AVAPIConsts
+from .enums import AlphaVantageAPILimits as AVAPILimits
+from .enums import AlphaVantageResponseKeys as AVResponseKeys
 
 logger = logging.getLogger(__name__)
 
+_THROTTLE_MARKERS = (
+    "per second",
+    "per minute",
+    "per day",
+    "rate limit",
+    "call frequency",
+)
+
+
+class AlphaVantageThrottledError(RateLimitExceededError):
+    """Raised when AlphaVantage answers with a throttle message instead of data."""
+
+    def __init__(self, message: str, daily: bool = False) -> None:
+        """
+        Initialize the AlphaVantageThrottledError.
+
+        Parameters
+        ----------
+        message : str
+            The throttle message sent by AlphaVantage.
+        daily : bool, optional
+            Whether the daily quota, rather than the per-minute one, is used up.
+        """
+        super().__init__(message)
+        self.daily = daily
+
+
+class AlphaVantageAPIError(ValueError):
+    """Raised when AlphaVantage answers with an error message instead of data."""
+
+
+class MissingQuoteError(Exception):
+    """Raised when a bulk fetch returns neither a quote nor an error for a symbol."""
+
+
+def _raise_cancellation(results: list[Any]) -> None:
+    """
+    Re-raise a cancellation collected by `asyncio.gather(..., return_exceptions=True)`.
+
+    Parameters
+    ----------
+    results : list[Any]
+        The gathered results.
+
+    Raises
+    ------
+    BaseException
+        The first result that is a `BaseException` but not an `Exception`.
+    """
+    for result in results:
+        if isinstance(result, BaseException) and not isinstance(result, Exception):
+            raise result
+
 
 class StockQuotesFetcherInterface(ABC):
     """Abstract base class for asynchronously fetching stock quotes."""
@@ -39,14 +109,94 @@ class StockQuotesFetcherInterface(ABC):
             A dictionary containing the fetched stock quote information.
         """
 
+    async def fetch_bulk_stock_quotes(
+        self, endpoint: str, symbols: list[str]
+    ) -> dict[str, Any]:
+        """
+        Asynchronously fetch the global quotes of several symbols.
+
+        The default implementation fetches one global quote per symbol; fetchers able
+        to query many symbols at once should override it. A symbol failing to fetch
+        does not affect the others.
+
+        Parameters
+        ----------
+        endpoint : str
+            The API endpoint.
+        symbols : list[str]
+            The stock symbols for which the quotes need to be fetched.
+
+        Returns
+        -------
+        dict[str, Any]
+            Mapping of each requested symbol to its quote payload, in any schema
+            supported by `src.adapters`, or to the exception raised while fetching it.
+        """
+        stock_quotes: dict[str, Any] = {}
+        for symbol in symbols:
+            try:
+                stock_quotes[symbol] = await self.fetch_stock_quote(
+                    endpoint=endpoint, operation=AVAPIConsts.OPERATION, symbol=symbol
+                )
+            except Exception as error:
+                stock_quotes[symbol] = error
+        return stock_quotes
+
 
 class StockQuotesFetcher(StockQuotesFetcherInterface):
     """Concrete implementation of StockQuotesFetcherInterface."""
 
-    def __init__(self, api_client: AsyncAPIClient, api_key: str) -> None:
-        """Initialize the StockQuotesFetcher with the provided AsyncAPIClient."""
+    def __init__(
+        self,
+        api_client: AsyncAPIClient,
+        api_key: str,
+        rate_limiter: Optional[RateLimiterInterface] = None,
+        json_decoder: Optional[JSONDecoderInterface] = None,
+        metrics: Optional[MetricsRegistry] = None,
+        max_concurrency: int = 10,
+    ) -> None:
+        """
+        Initialize the StockQuotesFetcher with the provided AsyncAPIClient.
+
+        Parameters
+        ----------
+        api_client : AsyncAPIClient
+            The client used for sending requests.
+        api_key : str
+            The Alpha Vantage API key.
+        rate_limiter : RateLimiterInterface, optional
+            Limiter awaited before every request attempt, retries included, to respect
+            the API quotas.
+        json_decoder : JSONDecoderInterface, optional
+            Decoder parsing the raw response bytes. Defaults to the fastest JSON
+            backend installed.
+        metrics : MetricsRegistry, optional
+            Registry receiving the JSON parse time and the throttled responses.
+        max_concurrency : int, optional
+            Maximum number of requests a bulk fetch sends at the same time, for its
+            chunks and its per-symbol fallbacks alike.
+
+        Raises
+        ------
+        ValueError
+            If `max_concurrency` is not positive.
+        """
+        if max_concurrency < 1:
+            raise ValueError("`max_concurrency` must be at least 1.")
+
         self._client = api_client
         self._api_key = api_key
+        self._rate_limiter = rate_limiter
+        self._json_decoder = json_decoder or get_json_decoder()
+        self._metrics = metrics
+        self._bulk_semaphore = asyncio.Semaphore(max_concurrency)
+        self._parse_time = (
+            metrics.histogram(
+                "quote_parse_duration_seconds", "Time spent decoding quote responses."
+            )
+            if metrics is not None
+            else None
+        )
 
     async def fetch_stock_quote(
         self, endpoint: str, operation: str, symbol: str
@@ -67,10 +217,197 @@ class StockQuotesFetcher(StockQuotesFetcherInterface):
         -------
         Any
             An object containing the fetched stock quote information.
+
+        Raises
+        ------
+        RateLimitExceededError
+            If the rate limiter's daily budget is exhausted.
+        AlphaVantageThrottledError
+            If AlphaVantage throttled the request.
+        AlphaVantageAPIError
+            If AlphaVantage rejected the request.
         """
         params = self._construct_params(operation=operation, symbol=symbol)
+        return await self._get_json(endpoint=endpoint, params=params)
+
+    async def fetch_bulk_stock_quotes(
+        self, endpoint: str, symbols: list[str]
+    ) -> dict[str, Any]:
+        """
+        Asynchronously fetch the global quotes of several symbols in batches.
+
+        Symbols are packed into `REALTIME_BULK_QUOTES` requests of at most
+        `BULK_SYMBOLS_PER_REQUEST` symbols each. Symbols missing from the bulk
+        responses, and those of chunks rejected by AlphaVantage, e.g. because the bulk
+        endpoint is premium, are fetched one by one with `GLOBAL_QUOTE`.
+
+        Every chunk and every fallback fetch fails on its own: the symbols it covers are
+        mapped to the raised exception, and the other symbols keep their quotes. At
+        most `max_concurrency` of those requests are in flight at the same time.
+
+        Parameters
+        ----------
+        endpoint : str
+            The API endpoint.
+        symbols : list[str]
+            The stock symbols for which the quotes need to be fetched.
+
+        Returns
+        -------
+        dict[str, Any]
+            Mapping of each requested symbol to its quote payload, in any schema
+            supported by `src.adapters`, or to the exception raised while fetching it.
+        """
+        unique_symbols = list(dict.fromkeys(symbols))
+        chunk_size = AVAPILimits.BULK_SYMBOLS_PER_REQUEST
+        chunks = [
+            unique_symbols[start : start + chunk_size]
+            for start in range(0, len(unique_symbols), chunk_size)
+        ]
+        responses = await asyncio.gather(
+            *(
+                self._bounded(
+                    partial(self._fetch_bulk_chunk, endpoint=endpoint, symbols=chunk)
+                )
+                for chunk in chunks
+            ),
+            return_exceptions=True,
+        )
+        _raise_cancellation(responses)
+
+        stock_quotes: dict[str, Any] = {}
+        for chunk, response in zip(chunks, responses):
+            if isinstance(response, AlphaVantageAPIError):
+                logger.warning(
+                    "Bulk quotes of %d symbols rejected, falling back to %s: %s",
+                    len(chunk),
+                    AVAPIConsts.OPERATION,
+                    response,
+                )
+            elif isinstance(response, BaseException):
+                logger.error(
+                    "Failed to fetch bulk quotes of %d symbols: %s",
+                    len(chunk),
+                    response,
+                )
+                stock_quotes.update(dict.fromkeys(chunk, response))
+            else:
+                stock_quotes.update(response)
+
+        missing_symbols = [
+            symbol for symbol in unique_symbols if symbol not in stock_quotes
+        ]
+        if missing_symbols:
+            logger.info(
+                "%d symbols missing from bulk quotes, falling back to %s",
+                len(missing_symbols),
+                AVAPIConsts.OPERATION,
+            )
+            fallback_quotes = await asyncio.gather(
+                *(
+                    self._bounded(
+                        partial(
+                            self.fetch_stock_quote,
+                            endpoint=endpoint,
+                            operation=AVAPIConsts.OPERATION,
+                            symbol=symbol,
+                        )
+                    )
+                    for symbol in missing_symbols
+                ),
+                return_exceptions=True,
+            )
+            _raise_cancellation(fallback_quotes)
+            stock_quotes.update(zip(missing_symbols, fallback_quotes))
+
+        return {symbol: stock_quotes[symbol] for symbol in unique_symbols}
+
+    async def _bounded(self, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Run one request of a bulk fetch once fewer than `max_concurrency` are running.
+
+        The request is created only once a slot is free, so a cancelled bulk fetch
+        leaves no waiting coroutine that was never awaited.
+
+        Parameters
+        ----------
+        fetch : Callable[[], Awaitable[Any]]
+            Function sending the request.
+
+        Returns
+        -------
+        Any
+            The result of the request.
+        """
+        async with self._bulk_semaphore:
+            return await fetch()
+
+    async def _fetch_bulk_chunk(
+        self, endpoint: str, symbols: list[str]
+    ) -> dict[str, Any]:
+        """
+        Fetch one `REALTIME_BULK_QUOTES` request and split it per symbol.
 
-        response = await self._client.get(endpoint=endpoint, params=params)
+        Parameters
+        ----------
+        endpoint : str
+            The API endpoint.
+        symbols : list[str]
+            At most `BULK_SYMBOLS_PER_REQUEST` stock symbols.
+
+        Returns
+        -------
+        dict[str, Any]
+            Mapping of the requested symbols present in the response to their bulk
+            quote entry.
+        """
+        params = self._construct_params(
+            operation=AVAPIConsts.BULK_OPERATION, symbol=",".join(symbols)
+        )
+        content = await self._get_json(endpoint=endpoint, params=params)
+
+        requested_symbols = {symbol.upper(): symbol for symbol in symbols}
+        stock_quotes: dict[str, Any] = {}
+        for bulk_quote in content.get(AVResponseKeys.BULK_DATA, []):
+            symbol = requested_symbols.get(str(bulk_quote.get("symbol", "")).upper())
+            if symbol is not None:
+                stock_quotes[symbol] = bulk_quote
+        return stock_quotes
+
+    async def _get_json(self, endpoint: str, params: dict[str, str]) -> Any:
+        """
+        Send a rate limited GET request and decode its JSON content.
+
+        Parameters
+        ----------
+        endpoint : str
+            The API endpoint.
+        params : dict[str, str]
+            The query params.
+
+        Returns
+        -------
+        Any
+            The decoded JSON content.
+
+        Raises
+        ------
+        RateLimitExceededError
+            If the rate limiter's daily budget is exhausted.
+        AlphaVantageThrottledError
+            If AlphaVantage throttled the request.
+        AlphaVantageAPIError
+            If AlphaVantage rejected the request.
+        """
+        # The limiter is acquired by the client before every attempt, so retries are
+        # paced and counted against the daily budget too.
+        response = await self._client.get(
+            endpoint=endpoint,
+            params=params,
+            before_attempt=(
+                self._rate_limiter.acquire if self._rate_limiter is not None else None
+            ),
+        )
         logger.info(
             "Successfully fetched API: %s %s",
             response.status_code,
@@ -78,7 +415,8 @@ class StockQuotesFetcher(StockQuotesFetcherInterface):
         )
 
         try:
-            return response.json()
+            with timed(self._parse_time):
+                content = self._json_decoder.decode(response.content)
         except json.JSONDecodeError as error:
             logger.error(
                 "Failed to parse JSON: error: %s, content: %s",
@@ -90,6 +428,83 @@ class StockQuotesFetcher(StockQuotesFetcherInterface):
             logger.critical("An unexpected error occurred: %s", error, exc_info=True)
             raise
 
+        try:
+            self._raise_for_payload(content)
+        except AlphaVantageThrottledError as error:
+            self._pause_requests(error)
+            raise
+        return content
+
+    @staticmethod
+    def _raise_for_payload(content: Any) -> None:
+        """
+        Raise if the decoded content is a throttle or error message instead of data.
+
+        Only the top-level keys are inspected, so data payloads pass through without
+        being walked.
+
+        Parameters
+        ----------
+        content : Any
+            The decoded JSON content.
+
+        Raises
+        ------
+        AlphaVantageThrottledError
+            If the content is a throttle message.
+        AlphaVantageAPIError
+            If the content is an error, or any message that is not a throttle.
+        """
+        if not isinstance(content, dict):
+            return
+        if (
+            AVResponseKeys.GLOBAL_QUOTE in content
+            or AVResponseKeys.BULK_DATA in content
+        ):
+            return
+
+        if AVResponseKeys.ERROR_MESSAGE in content:
+            raise AlphaVantageAPIError(content[AVResponseKeys.ERROR_MESSAGE])
+
+        message = content.get(AVResponseKeys.NOTE) or content.get(
+            AVResponseKeys.INFORMATION
+        )
+        if message is None:
+            return
+        lowered = str(message).lower()
+        # Only the quota wording marks a throttle: premium endpoint rejections,
+        # demo or invalid key notices and any unknown message are errors, which are
+        # not worth pausing every request for.
+        if not any(marker in lowered for marker in _THROTTLE_MARKERS):
+            raise AlphaVantageAPIError(message)
+        daily = "per day" in lowered and not (
+            "per minute" in lowered or "per second" in lowered
+        )
+        raise AlphaVantageThrottledError(message, daily=daily)
+
+    def _pause_requests(self, error: AlphaVantageThrottledError) -> None:
+        """
+        Hold back the next requests until AlphaVantage's quota window resets.
+
+        Parameters
+        ----------
+        error : AlphaVantageThrottledError
+            The throttle error raised for the last response.
+        """
+        logger.warning("AlphaVantage throttled the request: %s", error)
+        if self._metrics is not None:
+            self._metrics.counter(
+                "quote_throttled_total",
+                "Responses throttled by AlphaVantage, by exhausted quota.",
+                labels={"quota": "day" if error.daily else "minute"},
+            ).inc()
+        if self._rate_limiter is None:
+            return
+        if error.daily:
+            self._rate_limiter.exhaust_daily_budget()
+        else:
+            self._rate_limiter.pause(AVAPILimits.QUOTA_WINDOW_SECONDS)
+
     def _construct_params(self, operation: str, symbol: str) -> dict[str, str]:
         """
         Construct the parameters for the API request.
@@ -108,3 +523,332 @@ class StockQuotesFetcher(StockQuotesFetcherInterface):
         """
         params = {"apikey": self._api_key, "function": operation, "symbol": symbol}
         return params
+
+
+class CachedStockQuotesFetcher(StockQuotesFetcherInterface):
+    """
+    StockQuotesFetcherInterface decorator caching fetched quotes in memory.
+
+    Quotes are cached per `(endpoint, operation, symbol)` for `ttl` seconds, so
+    repeated lookups within that window return without any network I/O. Failed
+    fetches are not cached and their errors are raised, so the caller can keep the
+    last quote it has and flag it as stale.
+    """
+
+    def __init__(
+        self,
+        fetcher: StockQuotesFetcherInterface,
+        ttl: float = 60.0,
+        max_entries: int = 1024,
+    ) -> None:
+        """
+        Initialize the CachedStockQuotesFetcher around the provided fetcher.
+
+        Parameters
+        ----------
+        fetcher : StockQuotesFetcherInterface
+            The fetcher used on cache misses.
+        ttl : float, optional
+            Seconds a fetched quote stays valid.
+        max_entries : int, optional
+            Maximum number of cached quotes; least recently used ones are evicted.
+        """
+        self._fetcher = fetcher
+        self._cache: TTLCache[tuple[str, str, str], Any] = TTLCache(
+            ttl=ttl, max_entries=max_entries
+        )
+
+    @property
+    def stats(self) -> CacheStats:
+        """Hit, miss and eviction counters of the underlying cache."""
+        return self._cache.stats
+
+    async def fetch_stock_quote(
+        self, endpoint: str, operation: str, symbol: str
+    ) -> Any:
+        """
+        Return the cached stock quote for the symbol, fetching it on a miss.
+
+        Parameters
+        ----------
+        endpoint : str
+            The API endpoint.
+        operation : str
+            The function used in query params.
+        symbol : str
+            The stock symbol for which the quote needs to be fetched.
+
+        Returns
+        -------
+        Any
+            An object containing the fetched stock quote information.
+        """
+        key = (endpoint, operation, symbol)
+        stock_quote = self._cache.get(key)
+        if stock_quote is not None:
+            logger.debug("Cache hit for %s %s", operation, symbol)
+            return stock_quote
+
+        stock_quote = await self._fetcher.fetch_stock_quote(
+            endpoint=endpoint, operation=operation, symbol=symbol
+        )
+        self._cache.set(key, stock_quote)
+        return stock_quote
+
+    async def fetch_bulk_stock_quotes(
+        self, endpoint: str, symbols: list[str]
+    ) -> dict[str, Any]:
+        """
+        Return the cached global quotes, bulk fetching only the missing symbols.
+
+        Parameters
+        ----------
+        endpoint : str
+            The API endpoint.
+        symbols : list[str]
+            The stock symbols for which the quotes need to be fetched.
+
+        Returns
+        -------
+        dict[str, Any]
+            Mapping of each requested symbol to its quote payload, in any schema
+            supported by `src.adapters`, or to the exception raised while fetching it.
+        """
+        stock_quotes: dict[str, Any] = {}
+        missing_symbols = []
+        for symbol in dict.fromkeys(symbols):
+            stock_quote = self._cache.get((endpoint, AVAPIConsts.OPERATION, symbol))
+            if stock_quote is None:
+                missing_symbols.append(symbol)
+            else:
+                stock_quotes[symbol] = stock_quote
+
+        if missing_symbols:
+            fetched_quotes = await self._fetcher.fetch_bulk_stock_quotes(
+                endpoint=endpoint, symbols=missing_symbols
+            )
+            for symbol, stock_quote in fetched_quotes.items():
+                if not isinstance(stock_quote, Exception):
+                    key = (endpoint, AVAPIConsts.OPERATION, symbol)
+                    self._cache.set(key, stock_quote)
+            stock_quotes.update(fetched_quotes)
+
+        return stock_quotes
+
+
+class CoalescingStockQuotesFetcher(StockQuotesFetcherInterface):
+    """
+    StockQuotesFetcherInterface decorator deduplicating concurrent fetches.
+
+    Symbols are normalized (stripped and upper-cased), and concurrent fetches of the
+    same operation and normalized symbol share a single call to the wrapped fetcher.
+    Bulk fetches are coalesced per symbol: the symbols another bulk fetch is already
+    fetching join it, and only the others are fetched in a new bulk call.
+    """
+
+    def __init__(self, fetcher: StockQuotesFetcherInterface) -> None:
+        """
+        Initialize the CoalescingStockQuotesFetcher around the provided fetcher.
+
+        Parameters
+        ----------
+        fetcher : StockQuotesFetcherInterface
+            The fetcher whose calls are coalesced.
+        """
+        self._fetcher = fetcher
+        self._single_flight: SingleFlight[tuple[str, str, str], Any] = SingleFlight()
+
+    @property
+    def in_flight(self) -> int:
+        """Number of distinct fetches currently in flight."""
+        return self._single_flight.in_flight
+
+    async def fetch_stock_quote(
+        self, endpoint: str, operation: str, symbol: str
+    ) -> Any:
+        """
+        Fetch the stock quote, joining an identical fetch that is already in flight.
+
+        Parameters
+        ----------
+        endpoint : str
+            The API endpoint.
+        operation : str
+            The function used in query params.
+        symbol : str
+            The stock symbol for which the quote needs to be fetched.
+
+        Returns
+        -------
+        Any
+            An object containing the fetched stock quote information.
+        """
+        normalized_symbol = self._normalize_symbol(symbol)
+        key = (endpoint, operation, normalized_symbol)
+        return await self._single_flight.do(
+            key,
+            lambda: self._fetcher.fetch_stock_quote(
+                endpoint=endpoint, operation=operation, symbol=normalized_symbol
+            ),
+        )
+
+    async def fetch_bulk_stock_quotes(
+        self, endpoint: str, symbols: list[str]
+    ) -> dict[str, Any]:
+        """
+        Fetch the global quotes of the symbols not already being fetched in bulk.
+
+        Parameters
+        ----------
+        endpoint : str
+            The API endpoint.
+        symbols : list[str]
+            The stock symbols for which the quotes need to be fetched.
+
+        Returns
+        -------
+        dict[str, Any]
+            Mapping of each requested symbol, as given, to its quote or to the
+            exception raised while fetching it.
+        """
+        keys = {
+            symbol: (
+                endpoint,
+                AVAPIConsts.BULK_OPERATION,
+                self._normalize_symbol(symbol),
+            )
+            for symbol in symbols
+        }
+
+        async def fetch(
+            batch_keys: list[tuple[str, str, str]],
+        ) -> dict[tuple[str, str, str], Any]:
+            stock_quotes = await self._fetcher.fetch_bulk_stock_quotes(
+                endpoint=endpoint, symbols=[key[2] for key in batch_keys]
+            )
+            return {
+                key: stock_quotes[key[2]]
+                for key in batch_keys
+                if key[2] in stock_quotes
+            }
+
+        stock_quotes = await self._single_flight.do_many(keys.values(), fetch)
+        return {
+            symbol: stock_quotes[key]
+            for symbol, key in keys.items()
+            if key in stock_quotes
+        }
+
+    @staticmethod
+    def _normalize_symbol(symbol: str) -> str:
+        """
+        Normalize a stock symbol so that spelling variants share one fetch.
+
+        Parameters
+        ----------
+        symbol : str
+            The stock symbol as entered.
+
+        Returns
+        -------
+        str
+            The stripped, upper-cased stock symbol.
+        """
+        return symbol.strip().upper()
+
+
+class ConcurrencyLimitedStockQuotesFetcher(StockQuotesFetcherInterface):
+    """
+    StockQuotesFetcherInterface decorator bounding the number of concurrent fetches.
+
+    Fetches beyond `max_concurrency` wait for a slot, however many callers there are.
+    Placed under the cache and coalescing decorators, it bounds the requests sent
+    upstream without holding a slot for cache hits or coalesced callers.
+    """
+
+    def __init__(
+        self, fetcher: StockQuotesFetcherInterface, max_concurrency: int = 10
+    ) -> None:
+        """
+        Initialize the ConcurrencyLimitedStockQuotesFetcher around the fetcher.
+
+        Parameters
+        ----------
+        fetcher : StockQuotesFetcherInterface
+            The fetcher whose calls are bounded.
+        max_concurrency : int, optional
+            Maximum number of fetches running at the same time.
+
+        Raises
+        ------
+        ValueError
+            If `max_concurrency` is not positive.
+        """
+        if max_concurrency < 1:
+            raise ValueError("`max_concurrency` must be at least 1.")
+
+        self._fetcher = fetcher
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._in_flight = 0
+
+    @property
+    def in_flight(self) -> int:
+        """Number of fetches currently running, not counting the waiting ones."""
+        return self._in_flight
+
+    async def fetch_stock_quote(
+        self, endpoint: str, operation: str, symbol: str
+    ) -> Any:
+        """
+        Fetch the stock quote once a slot is free.
+
+        Parameters
+        ----------
+        endpoint : str
+            The API endpoint.
+        operation : str
+            The function used in query params.
+        symbol : str
+            The stock symbol for which the quote needs to be fetched.
+
+        Returns
+        -------
+        Any
+            An object containing the fetched stock quote information.
+        """
+        async with self._semaphore:
+            self._in_flight += 1
+            try:
+                return await self._fetcher.fetch_stock_quote(
+                    endpoint=endpoint, operation=operation, symbol=symbol
+                )
+            finally:
+                self._in_flight -= 1
+
+    async def fetch_bulk_stock_quotes(
+        self, endpoint: str, symbols: list[str]
+    ) -> dict[str, Any]:
+        """
+        Fetch the global quotes of several symbols once a slot is free.
+
+        Parameters
+        ----------
+        endpoint : str
+            The API endpoint.
+        symbols : list[str]
+            The stock symbols for which the quotes need to be fetched.
+
+        Returns
+        -------
+        dict[str, Any]
+            Mapping of each requested symbol to its quote payload, in any schema
+            supported by `src.adapters`, or to the exception raised while fetching it.
+        """
+        async with self._semaphore:
+            self._in_flight += 1
+            try:
+                return await self._fetcher.fetch_bulk_stock_quotes(
+                    endpoint=endpoint, symbols=symbols
+                )
+            finally:
+                self._in_flight -= 1
@@ -1,41 +1,749 @@
-"""Module defining the Model class and the StockQuote dataclass."""
+"""Module defining the Model and QuoteStore classes and the quote dataclasses.
 
+The Model stores the latest StockQuote of each symbol in a QuoteStore, optionally
+keeps a bounded QuoteHistory per symbol, and reports what changed since the last time
+it was asked as a ChangeSet. FetchResult describes the
+outcome of fetching the quote of one symbol.
+
+The QuoteStore keeps one typed `array.array` per numeric StockQuote field plus a symbol
+to row index dictionary, instead of one StockQuote object per symbol. Upserting a
+symbol writes its values in place, lookups by symbol are O(1), and sorting or filtering
+works on the contiguous numeric columns, with vectorized NumPy operations when NumPy is
+installed.
+"""
+
+import heapq
+import importlib
+import itertools
+import sys
+import time
+from array import array
+from collections.abc import Iterable
 from dataclasses import dataclass
+from datetime import date
+from typing import Any, Callable, Optional
 
+from toolkit.timeseries import RollingWindow
 
-@dataclass(frozen=True)
+from .enums import FetchStatus, QuoteChange
+
+try:
+    _np: Optional[Any] = importlib.import_module("numpy")
+except ImportError:  # pragma: no cover - depends on the environment
+    _np = None
+
+
+@dataclass(frozen=True, slots=True)
 class StockQuote:
-    """Dataclass representing a stock quote."""
+    """Dataclass representing a stock quote.
+
+    Numeric fields are parsed once, when the quote is built from the provider data, so
+    rendering and analytics work on numbers directly. `change_percent` is expressed in
+    percent, e.g. `0.5` for a 0.5% change.
+    """
 
     symbol: str
-    open: str
-    high: str
-    low: str
-    price: str
-    volume: str
-    latest_trading_day: str
-    previous_close: str
-    change: str
-    change_percent: str
+    open: float
+    high: float
+    low: float
+    price: float
+    volume: int
+    latest_trading_day: date
+    previous_close: float
+    change: float
+    change_percent: float
 
 
-class Model:
-    """Representing the model of the financial data fetching and presentation app."""
+@dataclass(frozen=True)
+class FetchResult:
+    """Dataclass representing the outcome of fetching the stock quote of a symbol."""
+
+    symbol: str
+    status: FetchStatus
+    stock_quote: Optional[StockQuote] = None
+    error: Optional[Exception] = None
+
+    @property
+    def ok(self) -> bool:
+        """Whether the stock quote has been fetched successfully."""
+        return self.status is FetchStatus.SUCCESS
+
+    @property
+    def retryable(self) -> bool:
+        """Whether fetching the stock quote again may succeed."""
+        return self.status in (FetchStatus.HTTP_ERROR, FetchStatus.THROTTLED)
+
+
+COLUMN_TYPECODES: dict[str, str] = {
+    "open": "d",
+    "high": "d",
+    "low": "d",
+    "price": "d",
+    "volume": "q",
+    "latest_trading_day": "q",
+    "previous_close": "d",
+    "change": "d",
+    "change_percent": "d",
+}
+
+
+class QuoteStore:
+    """
+    Columnar in-memory store of the latest stock quote of each symbol.
+
+    Rows are kept dense: removing a symbol moves the last row into its place, so the
+    row order is the insertion order only as long as nothing is removed. Trading days
+    are stored as proleptic Gregorian ordinals.
+
+    StockQuote objects are only built on demand. Once `quotes` has been called, the
+    built objects are kept and updated row by row, so later calls cost no rebuild.
+    """
 
     def __init__(self) -> None:
-        """Initialize the Model with an empty list of stock quotes."""
-        self.stock_quotes: list[StockQuote] = []
+        """Initialize an empty QuoteStore."""
+        self._symbols: list[str] = []
+        self._rows: dict[str, int] = {}
+        self._columns: dict[str, "array[Any]"] = {
+            name: array(typecode) for name, typecode in COLUMN_TYPECODES.items()
+        }
+        self._quotes: Optional[list[StockQuote]] = None
+
+    @property
+    def symbols(self) -> list[str]:
+        """The stored symbols, in row order."""
+        return list(self._symbols)
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate memory used by the stored rows, in bytes."""
+        columns = sum(
+            column.itemsize * column.buffer_info()[1]
+            for column in self._columns.values()
+        )
+        symbols = sys.getsizeof(self._symbols) + sum(map(sys.getsizeof, self._symbols))
+        return columns + symbols + sys.getsizeof(self._rows)
 
-    def add_stock_quote(self, stock_quote: StockQuote) -> None:
-        """Add a stock quote to the list of stock quotes.
+    def upsert(self, stock_quote: StockQuote) -> QuoteChange:
+        """
+        Insert the stock quote, or overwrite the row of its symbol in place.
+
+        A row holding the same values already is left untouched.
 
         Parameters
         ----------
         stock_quote : StockQuote
-            The stock quote to add.
+            The stock quote to store.
+
+        Returns
+        -------
+        QuoteChange
+            `ADDED`, `UPDATED` or `UNCHANGED`.
+        """
+        values = self._to_row(stock_quote)
+        row = self._rows.get(stock_quote.symbol)
+        if row is None:
+            row = len(self._symbols)
+            self._append_row(values)
+            self._symbols.append(stock_quote.symbol)
+            self._rows[stock_quote.symbol] = row
+            if self._quotes is not None:
+                self._quotes.append(self._to_stock_quote(row))
+            return QuoteChange.ADDED
+
+        columns = self._columns.values()
+        if all(column[row] == value for column, value in zip(columns, values)):
+            return QuoteChange.UNCHANGED
+        self._write_row(row, values)
+        if self._quotes is not None:
+            self._quotes[row] = self._to_stock_quote(row)
+        return QuoteChange.UPDATED
+
+    def get(self, symbol: str) -> Optional[StockQuote]:
+        """
+        Return the stock quote of a symbol.
+
+        Parameters
+        ----------
+        symbol : str
+            The stock symbol.
+
+        Returns
+        -------
+        StockQuote, optional
+            The stored stock quote, or None if the symbol is not in the store.
+        """
+        row = self._rows.get(symbol)
+        if row is None:
+            return None
+        if self._quotes is not None:
+            return self._quotes[row]
+        return self._to_stock_quote(row)
+
+    def remove(self, symbol: str) -> bool:
+        """
+        Remove the row of a symbol by moving the last row into its place.
+
+        Parameters
+        ----------
+        symbol : str
+            The stock symbol.
+
+        Returns
+        -------
+        bool
+            Whether the symbol was in the store.
+        """
+        row = self._rows.get(symbol)
+        if row is None:
+            return False
+
+        for column in self._columns.values():
+            column[row] = column[-1]
+            column.pop()
+        if self._quotes is not None:
+            self._quotes[row] = self._quotes[-1]
+            self._quotes.pop()
+        last_symbol = self._symbols.pop()
+        del self._rows[symbol]
+        if last_symbol != symbol:
+            self._symbols[row] = last_symbol
+            self._rows[last_symbol] = row
+        return True
+
+    def clear(self) -> None:
+        """Remove every row."""
+        for column in self._columns.values():
+            del column[:]
+        self._quotes = None
+        self._symbols.clear()
+        self._rows.clear()
+
+    def quotes(self) -> list[StockQuote]:
+        """
+        Return the stock quotes of every stored symbol.
+
+        Returns
+        -------
+        list[StockQuote]
+            The stored stock quotes, in row order.
+        """
+        if self._quotes is None:
+            self._quotes = [
+                self._to_stock_quote(row) for row in range(len(self._symbols))
+            ]
+        return list(self._quotes)
+
+    def column(self, name: str) -> memoryview:
+        """
+        Return a read-only snapshot of a numeric column.
+
+        The snapshot is a copy, so holding it does not lock the store against
+        upserts and removals.
+
+        Parameters
+        ----------
+        name : str
+            The StockQuote field name, one of `COLUMN_TYPECODES`.
+
+        Returns
+        -------
+        memoryview
+            The column values, in row order.
+
+        Raises
+        ------
+        ValueError
+            If `name` is not a numeric column.
+        """
+        return memoryview(self._get_column(name)[:]).toreadonly()
+
+    def sorted_symbols(
+        self, by: str, descending: bool = False, limit: Optional[int] = None
+    ) -> list[str]:
+        """
+        Return the symbols sorted by the values of a numeric column.
+
+        Parameters
+        ----------
+        by : str
+            The column to sort by.
+        descending : bool, optional
+            Whether to sort from the largest to the smallest value.
+        limit : int, optional
+            Return only the first `limit` symbols. Without NumPy, a partial sort is
+            used.
+
+        Returns
+        -------
+        list[str]
+            The sorted symbols.
+
+        Raises
+        ------
+        ValueError
+            If `by` is not a numeric column.
+        """
+        column = self._get_column(by)
+        if _np is not None:
+            if not column:
+                return []
+            values = _np.frombuffer(column, dtype=column.typecode)
+            ordered = _np.argsort(-values if descending else values, kind="stable")
+            return [self._symbols[row] for row in ordered[:limit].tolist()]
+
+        key = column.__getitem__
+        rows = range(len(self._symbols))
+        if limit is None:
+            ordered = sorted(rows, key=key, reverse=descending)
+        elif descending:
+            ordered = heapq.nlargest(limit, rows, key=key)
+        else:
+            ordered = heapq.nsmallest(limit, rows, key=key)
+        return [self._symbols[row] for row in ordered]
+
+    def filter_symbols(
+        self,
+        by: str,
+        min_value: Optional[float] = None,
+        max_value: Optional[float] = None,
+    ) -> list[str]:
         """
-        self.stock_quotes.append(stock_quote)
+        Return the symbols whose column value lies within the given bounds.
+
+        Parameters
+        ----------
+        by : str
+            The column to filter on.
+        min_value : float, optional
+            Inclusive lower bound. Unbounded if not given.
+        max_value : float, optional
+            Inclusive upper bound. Unbounded if not given.
+
+        Returns
+        -------
+        list[str]
+            The matching symbols, in row order.
+
+        Raises
+        ------
+        ValueError
+            If `by` is not a numeric column.
+        """
+        lower = float("-inf") if min_value is None else min_value
+        upper = float("inf") if max_value is None else max_value
+        column = self._get_column(by)
+        if _np is not None:
+            if not column:
+                return []
+            values = _np.frombuffer(column, dtype=column.typecode)
+            rows = _np.flatnonzero((values >= lower) & (values <= upper))
+            return [self._symbols[row] for row in rows.tolist()]
+
+        selectors = (lower <= value <= upper for value in column)
+        return list(itertools.compress(self._symbols, selectors))
+
+    def _get_column(self, name: str) -> "array[Any]":
+        """Return the column of a StockQuote field, or raise ValueError."""
+        try:
+            return self._columns[name]
+        except KeyError:
+            raise ValueError(f"Unknown numeric column: {name!r}.") from None
+
+    def _append_row(self, values: tuple[Any, ...]) -> None:
+        """Append a row to every column, or to none of them if an append fails."""
+        columns = list(self._columns.values())
+        for index, (column, value) in enumerate(zip(columns, values)):
+            try:
+                column.append(value)
+            except BaseException:
+                for appended_column in columns[:index]:
+                    appended_column.pop()
+                raise
+
+    def _write_row(self, row: int, values: tuple[Any, ...]) -> None:
+        """Overwrite a row in every column, restoring it if a write fails."""
+        columns = list(self._columns.values())
+        previous_values = [column[row] for column in columns]
+        try:
+            for column, value in zip(columns, values):
+                column[row] = value
+        except BaseException:
+            for column, previous_value in zip(columns, previous_values):
+                column[row] = previous_value
+            raise
+
+    @staticmethod
+    def _to_row(stock_quote: StockQuote) -> tuple[Any, ...]:
+        """Return the column values of a stock quote, in `COLUMN_TYPECODES` order."""
+        return (
+            stock_quote.open,
+            stock_quote.high,
+            stock_quote.low,
+            stock_quote.price,
+            stock_quote.volume,
+            stock_quote.latest_trading_day.toordinal(),
+            stock_quote.previous_close,
+            stock_quote.change,
+            stock_quote.change_percent,
+        )
+
+    def _to_stock_quote(self, row: int) -> StockQuote:
+        """Build the stock quote stored at the given row."""
+        columns = self._columns
+        return StockQuote(
+            symbol=self._symbols[row],
+            open=columns["open"][row],
+            high=columns["high"][row],
+            low=columns["low"][row],
+            price=columns["price"][row],
+            volume=columns["volume"][row],
+            latest_trading_day=date.fromordinal(columns["latest_trading_day"][row]),
+            previous_close=columns["previous_close"][row],
+            change=columns["change"][row],
+            change_percent=columns["change_percent"][row],
+        )
+
+    def __contains__(self, symbol: object) -> bool:
+        """Return whether the symbol is in the store."""
+        return symbol in self._rows
+
+    def __len__(self) -> int:
+        """Return the number of stored symbols."""
+        return len(self._symbols)
+
+    def __repr__(self) -> str:
+        """Return an unambiguous string representation of the store."""
+        return f"QuoteStore(symbols={len(self._symbols)})"
+
+
+@dataclass(frozen=True)
+class ChangeSet:
+    """Dataclass representing what changed in the model since the last change set.
+
+    A symbol is listed in at most one of `added`, `updated`, `unchanged` and
+    `removed`. `stale` lists the symbols whose quote is stale now; they may also be
+    listed in `added` or `updated`, but never in `unchanged`.
+    """
+
+    added: tuple[StockQuote, ...] = ()
+    updated: tuple[StockQuote, ...] = ()
+    unchanged: tuple[str, ...] = ()
+    stale: tuple[str, ...] = ()
+    removed: tuple[str, ...] = ()
+
+    @property
+    def changed(self) -> bool:
+        """Whether anything has to be redrawn."""
+        return bool(self.added or self.updated or self.stale or self.removed)
+
+
+class QuoteHistory:
+    """Price and volume history of a single symbol with rolling statistics.
+
+    AlphaVantage reports the volume traded since the open, so each price is weighted
+    by the volume traded since the previous sample of the same trading day. The
+    weighted mean of the window is then its volume weighted average price.
+    """
+
+    def __init__(self, capacity: int, ema_span: Optional[int] = None) -> None:
+        """Initialize an empty QuoteHistory.
+
+        Parameters
+        ----------
+        capacity : int
+            Maximum number of samples kept.
+        ema_span : int, optional
+            Span of the exponential moving average. Defaults to `capacity`.
+        """
+        self.window = RollingWindow(capacity=capacity, ema_span=ema_span)
+        self._last_volume: Optional[int] = None
+        self._last_trading_day: Optional[date] = None
+
+    @property
+    def sma(self) -> Optional[float]:
+        """Simple moving average of the prices in the window."""
+        return self.window.mean
+
+    @property
+    def ema(self) -> Optional[float]:
+        """Exponential moving average of the prices."""
+        return self.window.ema
+
+    @property
+    def low(self) -> Optional[float]:
+        """Lowest price in the window."""
+        return self.window.min
+
+    @property
+    def high(self) -> Optional[float]:
+        """Highest price in the window."""
+        return self.window.max
+
+    @property
+    def vwap(self) -> Optional[float]:
+        """Volume weighted average price over the window."""
+        return self.window.weighted_mean
+
+    def record(self, timestamp: float, stock_quote: StockQuote) -> None:
+        """Record the price of a stock quote and the volume traded since the last one.
+
+        Parameters
+        ----------
+        timestamp : float
+            Time the stock quote was observed.
+        stock_quote : StockQuote
+            The observed stock quote.
+        """
+        if self._last_volume is None:
+            traded_volume = 0
+        elif stock_quote.latest_trading_day != self._last_trading_day:
+            traded_volume = stock_quote.volume
+        else:
+            traded_volume = max(stock_quote.volume - self._last_volume, 0)
+        self._last_volume = stock_quote.volume
+        self._last_trading_day = stock_quote.latest_trading_day
+        self.window.push(
+            timestamp=timestamp, value=stock_quote.price, weight=traded_volume
+        )
+
+    def __len__(self) -> int:
+        """Return the number of recorded samples."""
+        return len(self.window)
+
+
+class Model:
+    """Representing the model of the financial data fetching and presentation app.
+
+    Quotes are upserted by symbol, so a refresh only touches the symbols whose data
+    changed. A symbol whose refresh failed keeps its last quote, flagged as stale.
+    """
+
+    def __init__(
+        self, clock: Callable[[], float] = time.time, history_size: int = 0
+    ) -> None:
+        """Initialize the Model with an empty store of stock quotes.
+
+        Parameters
+        ----------
+        clock : Callable[[], float], optional
+            Clock returning the current time in seconds, used for timestamps.
+        history_size : int, optional
+            Number of price samples kept per symbol for rolling statistics. No
+            history is kept if zero.
+        """
+        self.store = QuoteStore()
+        self.history_size = history_size
+        self._histories: dict[str, QuoteHistory] = {}
+        self._clock = clock
+        self._updated_at: dict[str, float] = {}
+        self._stale_symbols: set[str] = set()
+        self._pending_changes: dict[str, QuoteChange] = {}
+
+    @property
+    def stock_quotes(self) -> list[StockQuote]:
+        """The latest stock quote of every symbol."""
+        return self.store.quotes()
+
+    @property
+    def stale_symbols(self) -> list[str]:
+        """The symbols whose last refresh failed."""
+        return sorted(self._stale_symbols)
+
+    def get_stock_quote(self, symbol: str) -> Optional[StockQuote]:
+        """Get the latest stock quote of a symbol.
+
+        Parameters
+        ----------
+        symbol : str
+            The stock symbol.
+
+        Returns
+        -------
+        StockQuote, optional
+            The stock quote, or None if the symbol has no quote.
+        """
+        return self.store.get(symbol)
+
+    def history(self, symbol: str) -> Optional[QuoteHistory]:
+        """Get the price history of a symbol.
+
+        Parameters
+        ----------
+        symbol : str
+            The stock symbol.
+
+        Returns
+        -------
+        QuoteHistory, optional
+            The history, or None if the symbol has no history.
+        """
+        return self._histories.get(symbol)
+
+    def last_updated(self, symbol: str) -> Optional[float]:
+        """Get the time the quote of a symbol was last fetched successfully.
+
+        Parameters
+        ----------
+        symbol : str
+            The stock symbol.
+
+        Returns
+        -------
+        float, optional
+            The time in seconds, as returned by the clock, or None if unknown.
+        """
+        return self._updated_at.get(symbol)
+
+    def is_stale(self, symbol: str) -> bool:
+        """Tell whether the last refresh of a symbol failed.
+
+        Parameters
+        ----------
+        symbol : str
+            The stock symbol.
+
+        Returns
+        -------
+        bool
+            Whether the symbol's quote is stale.
+        """
+        return symbol in self._stale_symbols
+
+    def upsert_stock_quote(self, stock_quote: StockQuote) -> QuoteChange:
+        """Insert or update the stock quote of its symbol and mark it fresh.
+
+        When a history is kept, quotes that changed are recorded in it as well.
+
+        Parameters
+        ----------
+        stock_quote : StockQuote
+            The fetched stock quote.
+
+        Returns
+        -------
+        QuoteChange
+            `ADDED`, `UPDATED` or `UNCHANGED`.
+        """
+        symbol = stock_quote.symbol
+        change = self.store.upsert(stock_quote)
+        now = self._clock()
+        self._updated_at[symbol] = now
+        self._stale_symbols.discard(symbol)
+        if self.history_size and change is not QuoteChange.UNCHANGED:
+            history = self._histories.get(symbol)
+            if history is None:
+                history = self._histories[symbol] = QuoteHistory(self.history_size)
+            history.record(timestamp=now, stock_quote=stock_quote)
+        self._record_change(symbol, change)
+        return change
+
+    def mark_stale(self, symbol: str) -> bool:
+        """Flag the quote of a symbol as stale after a failed refresh.
+
+        Symbols are matched case-insensitively, since the provider may return them in
+        another case than requested.
+
+        Parameters
+        ----------
+        symbol : str
+            The requested stock symbol.
+
+        Returns
+        -------
+        bool
+            Whether a quote has just become stale.
+        """
+        stored_symbol = self._find_symbol(symbol)
+        if stored_symbol is None or stored_symbol in self._stale_symbols:
+            return False
+        self._stale_symbols.add(stored_symbol)
+        self._pending_changes.setdefault(stored_symbol, QuoteChange.UNCHANGED)
+        return True
+
+    def retain_symbols(self, symbols: Iterable[str]) -> list[str]:
+        """Remove the quotes of every symbol not in the given ones.
+
+        Symbols are matched case-insensitively.
+
+        Parameters
+        ----------
+        symbols : Iterable[str]
+            The requested stock symbols to keep.
+
+        Returns
+        -------
+        list[str]
+            The removed symbols.
+        """
+        kept = {symbol.strip().upper() for symbol in symbols}
+        removed = [
+            symbol for symbol in self.store.symbols if symbol.upper() not in kept
+        ]
+        for symbol in removed:
+            self.store.remove(symbol)
+            self._histories.pop(symbol, None)
+            self._updated_at.pop(symbol, None)
+            self._stale_symbols.discard(symbol)
+            self._record_change(symbol, QuoteChange.REMOVED)
+        return removed
+
+    def pop_changes(self) -> ChangeSet:
+        """Return what changed since the last call, and start recording anew.
+
+        Returns
+        -------
+        ChangeSet
+            The changes of every symbol touched since the last call.
+        """
+        added, updated, unchanged, stale, removed = [], [], [], [], []
+        for symbol, change in self._pending_changes.items():
+            if change is QuoteChange.REMOVED:
+                removed.append(symbol)
+                continue
+            if symbol in self._stale_symbols:
+                stale.append(symbol)
+            if change is QuoteChange.UNCHANGED:
+                if symbol not in self._stale_symbols:
+                    unchanged.append(symbol)
+                continue
+            stock_quote = self.store.get(symbol)
+            if stock_quote is None:
+                continue
+            if change is QuoteChange.ADDED:
+                added.append(stock_quote)
+            else:
+                updated.append(stock_quote)
+        self._pending_changes.clear()
+        return ChangeSet(
+            added=tuple(added),
+            updated=tuple(updated),
+            unchanged=tuple(unchanged),
+            stale=tuple(stale),
+            removed=tuple(removed),
+        )
+
+    def _record_change(self, symbol: str, change: QuoteChange) -> None:
+        """Merge a change of a symbol into the changes pending since the last pop."""
+        previous = self._pending_changes.get(symbol)
+        if previous is QuoteChange.ADDED and change is QuoteChange.REMOVED:
+            del self._pending_changes[symbol]
+            return
+        if previous is QuoteChange.REMOVED and change is QuoteChange.ADDED:
+            change = QuoteChange.UPDATED
+        elif previous in (QuoteChange.ADDED, QuoteChange.UPDATED) and (
+            change is not QuoteChange.REMOVED
+        ):
+            change = previous
+        self._pending_changes[symbol] = change
 
-    def remove_all_stock_quotes(self) -> None:
-        """Remove all stock quotes from the list."""
-        self.stock_quotes.clear()
+    def _find_symbol(self, symbol: str) -> Optional[str]:
+        """Return the stored symbol matching the requested one, if any."""
+        if symbol in self.store:
+            return symbol
+        normalized = symbol.strip().upper()
+        if normalized in self.store:
+            return normalized
+        for stored_symbol in self.store.symbols:
+            if stored_symbol.upper() == normalized:
+                return stored_symbol
+        return None
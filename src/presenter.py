@@ -1,133 +1,413 @@
-"""Module defining the Presenter class.
+"""Module defining the StockQuotesStreamer and Presenter classes.
 
-This module includes the Presenter class, which handles the updating of the model and
-view based on user input and external data fetching.
+This module includes the StockQuotesStreamer class, which fans the fetches of a list of
+symbols out to a fetcher and yields their outcomes, and the Presenter class, which
+handles the updating of the model and view based on user input and external data
+fetching.
 """
 
 import asyncio
 import logging
-from typing import Any
+from collections.abc import AsyncIterator
+from typing import Any, Optional
 
+import httpx
+
+from toolkit.api import CircuitOpenError, RateLimitExceededError
+from toolkit.metrics import MetricsRegistry, timed
+
+from .adapters import adapt_quote
 from .enums import AlphaVantageAPIConsts as AVAPIConsts
-from .fetcher import StockQuotesFetcher
-from .model import Model, StockQuote
-from .view import View
+from .enums import FetchStatus, QuoteChange
+from .fetcher import MissingQuoteError, StockQuotesFetcherInterface
+from .model import FetchResult, Model, StockQuote
+from .view import ViewInterface
 
 logger = logging.getLogger(__name__)
 
 
-class Presenter:
+class StockQuotesStreamer:
+    """Fan-out of stock quote fetches yielding each outcome as it completes.
+
+    It only fetches and parses quotes: callers decide what to do with each result, so
+    it needs no model nor view.
+    """
+
+    def __init__(
+        self,
+        fetcher: StockQuotesFetcherInterface,
+        max_concurrency: int = 10,
+        use_bulk_quotes: bool = False,
+    ) -> None:
+        """Initialize the StockQuotesStreamer with the fetcher to fan out to.
+
+        Parameters
+        ----------
+        fetcher : StockQuotesFetcherInterface
+            The fetcher for stock quotes.
+        max_concurrency : int, optional
+            Maximum number of stock quotes fetched at the same time.
+        use_bulk_quotes : bool, optional
+            Whether to fetch many symbols per request with the bulk quotes endpoint.
+
+        Raises
+        ------
+        ValueError
+            If `max_concurrency` is not positive.
+        """
+        if max_concurrency < 1:
+            raise ValueError("`max_concurrency` must be at least 1.")
+
+        self._fetcher = fetcher
+        self._max_concurrency = max_concurrency
+        self._use_bulk_quotes = use_bulk_quotes
+
+    async def stream_stock_quotes(
+        self, symbols_list: list[str]
+    ) -> AsyncIterator[FetchResult]:
+        """Fetch stock quotes for the given symbols, yielding each one as it completes.
+
+        A pool of at most `max_concurrency` workers drains a queue of symbols, so the
+        number of in-flight requests stays bounded however long the list is. In bulk
+        mode, the symbols are instead fetched in batches by the fetcher.
+
+        Parameters
+        ----------
+        symbols_list : list
+            List of stock symbols.
+
+        Yields
+        ------
+        FetchResult
+            The outcome of fetching each symbol, in completion order.
+        """
+        if self._use_bulk_quotes:
+            try:
+                stock_data = await self._fetcher.fetch_bulk_stock_quotes(
+                    endpoint=AVAPIConsts.ENDPOINT, symbols=symbols_list
+                )
+            except Exception as error:
+                logger.error("Failed to fetch bulk stock quotes: %s", error)
+                stock_data = {symbol: error for symbol in symbols_list}
+            for symbol in symbols_list:
+                json_stock_quote = stock_data.get(symbol)
+                if json_stock_quote is None:
+                    json_stock_quote = MissingQuoteError(
+                        f"No quote returned for {symbol}."
+                    )
+                yield self._build_fetch_result(symbol, json_stock_quote)
+            return
+
+        symbols: asyncio.Queue[str] = asyncio.Queue()
+        for symbol in symbols_list:
+            symbols.put_nowait(symbol)
+
+        results: asyncio.Queue[tuple[str, Any]] = asyncio.Queue()
+        worker_count = min(self._max_concurrency, len(symbols_list))
+        workers = [
+            asyncio.create_task(self._fetch_worker(symbols=symbols, results=results))
+            for _ in range(worker_count)
+        ]
+        try:
+            for _ in range(len(symbols_list)):
+                symbol, json_stock_quote = await results.get()
+                yield self._build_fetch_result(symbol, json_stock_quote)
+        finally:
+            for worker in workers:
+                worker.cancel()
+
+    async def _fetch_worker(
+        self, symbols: asyncio.Queue[str], results: asyncio.Queue[tuple[str, Any]]
+    ) -> None:
+        """Fetch stock quotes for symbols taken from the queue until it is empty.
+
+        Parameters
+        ----------
+        symbols : asyncio.Queue
+            Queue of symbols still to be fetched.
+        results : asyncio.Queue
+            Queue receiving `(symbol, data)` pairs, where data is the fetched stock
+            quote data or the exception raised while fetching it.
+        """
+        while True:
+            try:
+                symbol = symbols.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            try:
+                json_stock_quote: Any = await self._fetcher.fetch_stock_quote(
+                    endpoint=AVAPIConsts.ENDPOINT,
+                    operation=AVAPIConsts.OPERATION,
+                    symbol=symbol,
+                )
+            except Exception as error:
+                logger.error("Failed to fetch stock quote of %s: %s", symbol, error)
+                json_stock_quote = error
+            results.put_nowait((symbol, json_stock_quote))
+
+    def _build_fetch_result(self, symbol: str, json_stock_quote: Any) -> FetchResult:
+        """Build the FetchResult of a symbol from its fetched stock quote data.
+
+        Parameters
+        ----------
+        symbol : str
+            The stock symbol.
+        json_stock_quote : Any
+            The fetched stock quote data, or the exception raised while fetching it.
+
+        Returns
+        -------
+        FetchResult
+            The stock quote on success, otherwise the classified error.
+        """
+        if isinstance(json_stock_quote, Exception):
+            return FetchResult(
+                symbol=symbol,
+                status=self._classify_error(json_stock_quote),
+                error=json_stock_quote,
+            )
+        try:
+            stock_quote = StockQuote(**self._prepare_stock_data(json_stock_quote))
+        except Exception as error:
+            return FetchResult(
+                symbol=symbol, status=self._classify_error(error), error=error
+            )
+        return FetchResult(
+            symbol=symbol, status=FetchStatus.SUCCESS, stock_quote=stock_quote
+        )
+
+    @staticmethod
+    def _classify_error(error: Exception) -> FetchStatus:
+        """Classify the error raised while fetching or parsing a stock quote.
+
+        Parameters
+        ----------
+        error : Exception
+            The raised error.
+
+        Returns
+        -------
+        FetchStatus
+            The failed fetch status matching the error.
+        """
+        if isinstance(error, (httpx.HTTPError, CircuitOpenError, MissingQuoteError)):
+            return FetchStatus.HTTP_ERROR
+        if isinstance(error, RateLimitExceededError):
+            return FetchStatus.THROTTLED
+        if isinstance(error, (TypeError, ValueError, KeyError)):
+            return FetchStatus.PARSE_ERROR
+        return FetchStatus.INTERNAL_ERROR
+
+    def _prepare_stock_data(self, stock_data: dict[str, Any]) -> dict[str, Any]:
+        """Prepare stock data by extracting relevant information.
+
+        Parameters
+        ----------
+        stock_data : dict
+            Dictionary containing raw stock data, in any supported quote schema.
+
+        Returns
+        -------
+        dict
+            Dictionary containing processed stock data.
+
+        Raises
+        ------
+        QuoteSchemaError
+            If the stock data does not match any known schema or lacks fields.
+        """
+        return adapt_quote(stock_data)
+
+
+class Presenter(StockQuotesStreamer):
     """Presenter for the financial data fetching and presentation application."""
 
-    def __init__(self, view: View, model: Model, fetcher: StockQuotesFetcher) -> None:
+    def __init__(
+        self,
+        view: ViewInterface,
+        model: Model,
+        fetcher: StockQuotesFetcherInterface,
+        max_concurrency: int = 10,
+        use_bulk_quotes: bool = False,
+        progressive: bool = False,
+        metrics: Optional[MetricsRegistry] = None,
+    ) -> None:
         """Initialize the Presenter with references to the View, Model, and Fetcher.
 
         Parameters
         ----------
-        view : View
+        view : ViewInterface
             The application view.
         model : Model
             The application model.
-        fetcher : StockQuotesFetcher
+        fetcher : StockQuotesFetcherInterface
             The fetcher for stock quotes.
+        max_concurrency : int, optional
+            Maximum number of stock quotes fetched at the same time.
+        use_bulk_quotes : bool, optional
+            Whether to fetch many symbols per request with the bulk quotes endpoint.
+        progressive : bool, optional
+            Whether to update the view after every fetched stock quote.
+        metrics : MetricsRegistry, optional
+            Registry receiving the wall time of fetching a list of symbols and the
+            outcome of every fetch.
+
+        Raises
+        ------
+        ValueError
+            If `max_concurrency` is not positive.
         """
+        super().__init__(
+            fetcher=fetcher,
+            max_concurrency=max_concurrency,
+            use_bulk_quotes=use_bulk_quotes,
+        )
         self._view = view
         self._model = model
-        self._fetcher = fetcher
+        self._progressive = progressive
+        self._failed_symbols: list[str] = []
+        self._metrics = metrics
+        self._fanout_time = (
+            metrics.histogram(
+                "presenter_fanout_duration_seconds",
+                "Wall time of fetching the stock quotes of a list of symbols.",
+            )
+            if metrics is not None
+            else None
+        )
+
+    @property
+    def failed_symbols(self) -> list[str]:
+        """Symbols whose last fetch failed with an error worth retrying."""
+        return list(self._failed_symbols)
 
     async def update_model(self) -> None:
         """Update the model based on user input and external data fetching.
 
         This method retrieves user input for stock symbols, fetches stock quotes
-        asynchronously, and updates the model accordingly.
+        asynchronously, and updates the model accordingly. The input is read in a
+        worker thread, so the event loop keeps running while waiting for the user.
         """
-        symbols_string = self._view.get_symbols()
+        symbols_string = await asyncio.to_thread(self._view.get_symbols)
         symbols_list = self._split_symbols(symbols_string=symbols_string)
-        stock_data = await self._fetch_stock_quotes(symbols_list=symbols_list)
-        self._handle_stock_quote_addition(stock_data=stock_data)
-
-    def update_view(self) -> None:
-        """Update the view based on the current state of the model.
+        await self.refresh_model(symbols_list=symbols_list)
 
-        This method updates the view with the latest stock quotes from the model.
-        """
-        stock_quotes = self._model.stock_quotes
-        self._view.show_stock_quotes(stock_quotes=stock_quotes)
+    async def refresh_model(self, symbols_list: list[str]) -> None:
+        """Fetch the stock quotes of the given symbols and update the model.
 
-    async def _fetch_stock_quotes(self, symbols_list: list[str]) -> Any:
-        """Fetch stock quotes asynchronously for the given list of symbols.
+        Quotes are upserted into the model as soon as each one is fetched, and the
+        symbols no longer requested are removed. A symbol that fails keeps its last
+        quote, flagged as stale. In progressive mode the view is updated after every
+        change as well, so the first rows show up as soon as the fastest symbol
+        returns.
 
         Parameters
         ----------
         symbols_list : list
             List of stock symbols.
+        """
+        self._model.retain_symbols(symbols=symbols_list)
+        await self._add_stock_quotes(symbols_list=symbols_list)
 
-        Returns
-        -------
-        Any
-            An object containing stock quote data.
+    async def retry_failed_symbols(self, delay: float = 0.0) -> None:
+        """Fetch again only the symbols whose last fetch failed with a retryable error.
+
+        The quotes fetched successfully are added to the model, next to the ones that
+        were already there.
+
+        Parameters
+        ----------
+        delay : float, optional
+            Seconds to wait before retrying, so that the throttling or open circuit
+            breaker behind the failures has time to clear. Nothing is awaited when no
+            symbol failed.
         """
-        tasks = [
-            self._fetcher.fetch_stock_quote(
-                endpoint=AVAPIConsts.ENDPOINT,
-                operation=AVAPIConsts.OPERATION,
-                symbol=symbol,
-            )
-            for symbol in symbols_list
-        ]
+        symbols_list = self._failed_symbols
+        if symbols_list:
+            if delay > 0:
+                logger.info(
+                    "Retrying %d failed symbols in %.1fs.", len(symbols_list), delay
+                )
+                await asyncio.sleep(delay)
+            logger.info("Retrying %d failed symbols.", len(symbols_list))
+            await self._add_stock_quotes(symbols_list=symbols_list)
 
-        return await asyncio.gather(*tasks)
+    async def _add_stock_quotes(self, symbols_list: list[str]) -> None:
+        """Stream the stock quotes of the given symbols into the model.
 
-    def _handle_stock_quote_addition(self, stock_data: list[dict[str, Any]]) -> None:
-        """Handle the addition of stock quotes to the model.
+        Parameters
+        ----------
+        symbols_list : list
+            List of stock symbols.
+        """
+        failed_symbols = []
+        with timed(self._fanout_time):
+            async for result in self.stream_stock_quotes(symbols_list=symbols_list):
+                self._count_fetch_result(result=result)
+                changed = self._handle_fetch_result(result=result)
+                if changed and self._progressive:
+                    self.update_view()
+                if result.retryable:
+                    failed_symbols.append(result.symbol)
+        self._failed_symbols = failed_symbols
 
-        This method processes the fetched stock data, creates StockQuote instances,
-        and adds them to the model.
+    def _count_fetch_result(self, result: FetchResult) -> None:
+        """Count the outcome of a fetch, if metrics are enabled.
 
         Parameters
         ----------
-        stock_data : list
-            List of dictionaries containing stock quote data.
+        result : FetchResult
+            The outcome of fetching the stock quote of a symbol.
         """
-        self._model.remove_all_stock_quotes()
-        for json_stock_quote in stock_data:
-            try:
-                json_stock_quote = self._prepare_stock_data(json_stock_quote)
-                stock_quote = StockQuote(**json_stock_quote)
-                self._model.add_stock_quote(stock_quote=stock_quote)
-            except (TypeError, ValueError) as error:
-                logger.error("Error creating StockQuote instance: %s", error)
-                self._view.show_external_service_error()
-            except Exception as error:
-                logger.critical("Unexpected error occurred: %s", error, exc_info=True)
-                self._view.show_internal_error()
+        if self._metrics is not None:
+            self._metrics.counter(
+                "presenter_fetch_results_total",
+                "Stock quote fetches by outcome.",
+                labels={"status": result.status},
+            ).inc()
 
-    def _prepare_stock_data(self, stock_data: dict[str, Any]) -> dict[str, Any]:
-        """Prepare stock data by extracting relevant information.
+    def update_view(self) -> None:
+        """Update the view based on the current state of the model.
+
+        This method hands the view the quotes changed since its last update.
+        """
+        changes = self._model.pop_changes()
+        self._view.show_quote_changes(changes=changes)
+
+    def _handle_fetch_result(self, result: FetchResult) -> bool:
+        """Handle the upsert of a fetched stock quote into the model.
+
+        Stock quotes are upserted into the model; errors are logged, reported through
+        the view, and flag the symbol's last quote as stale.
 
         Parameters
         ----------
-        stock_data : dict
-            Dictionary containing raw stock data.
+        result : FetchResult
+            The outcome of fetching the stock quote of a symbol.
 
         Returns
         -------
-        dict
-            Dictionary containing processed stock data.
+        bool
+            Whether the model has changed.
         """
-        try:
-            symbol_data = stock_data["Global Quote"]
-            valid_stock_data = {
-                key.split(". ")[1].replace(" ", "_"): value
-                for key, value in symbol_data.items()
-            }
-            return valid_stock_data
-        except KeyError as error:
+        if result.stock_quote is not None:
+            change = self._model.upsert_stock_quote(stock_quote=result.stock_quote)
+            return change is not QuoteChange.UNCHANGED
+
+        if result.status is FetchStatus.INTERNAL_ERROR:
+            logger.critical(
+                "Unexpected error occurred: %s", result.error, exc_info=result.error
+            )
+            self._view.show_internal_error()
+        else:
             logger.error(
-                "Global Quote is not present in the response, Error: %s", error
+                "Failed to fetch the stock quote of %s (%s): %s",
+                result.symbol,
+                result.status,
+                result.error,
             )
             self._view.show_external_service_error()
-            return {}
+        return self._model.mark_stale(symbol=result.symbol)
 
     def _split_symbols(self, symbols_string: str) -> list[str]:
         """Split a comma-separated string of symbols into a list.
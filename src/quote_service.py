@@ -0,0 +1,223 @@
+"""Module defining the HTTP/JSON quote service mode of the application.
+
+The service answers `GET /quotes?symbols=AAPL,MSFT` for other services, so they share
+one set of upstream fetches, and one API quota, instead of each calling AlphaVantage.
+"""
+
+import json
+import logging
+import re
+from dataclasses import fields
+from http import HTTPStatus
+from typing import Any, Optional
+
+from toolkit.metrics import MetricsRegistry, timed
+from toolkit.server import JSON_CONTENT_TYPE, HTTPRequest, HTTPResponse, HTTPServer
+
+from .fetcher import StockQuotesFetcherInterface
+from .model import StockQuote
+from .presenter import StockQuotesStreamer
+
+logger = logging.getLogger(__name__)
+
+SYMBOL_PATTERN = re.compile(r"[A-Z0-9][A-Z0-9.\-]{0,15}")
+
+_QUOTE_FIELDS = tuple(field.name for field in fields(StockQuote))
+
+
+class QuoteService:
+    """
+    HTTP service answering `GET /quotes?symbols=...` with the quotes as JSON.
+
+    Every request is fanned out through the shared fetcher. Wrapped in the cache and
+    coalescing decorators, any number of clients asking for a symbol within the
+    cache TTL are served from a single upstream fetch; the fetcher is expected to
+    bound the upstream concurrency itself, e.g. with
+    `ConcurrencyLimitedStockQuotesFetcher`, so the number of clients does not
+    matter upstream.
+
+    The response maps each normalized symbol to its quote under `quotes`, and to
+    the failed fetch status under `errors`. It is a 200 if any quote was fetched,
+    and a 502 if every symbol failed.
+    """
+
+    def __init__(
+        self,
+        fetcher: StockQuotesFetcherInterface,
+        max_symbols: int = 100,
+        max_concurrency: int = 10,
+        metrics: Optional[MetricsRegistry] = None,
+    ) -> None:
+        """
+        Initialize the QuoteService.
+
+        Parameters
+        ----------
+        fetcher : StockQuotesFetcherInterface
+            The fetcher shared by every request.
+        max_symbols : int, optional
+            Maximum number of symbols in a request.
+        max_concurrency : int, optional
+            Maximum number of symbols of one request fetched at the same time.
+        metrics : MetricsRegistry, optional
+            Registry receiving the duration and outcome of every request.
+
+        Raises
+        ------
+        ValueError
+            If `max_symbols` or `max_concurrency` is not positive.
+        """
+        if max_symbols < 1:
+            raise ValueError("`max_symbols` must be at least 1.")
+        if max_concurrency < 1:
+            raise ValueError("`max_concurrency` must be at least 1.")
+
+        self.max_symbols = max_symbols
+        self._streamer = StockQuotesStreamer(
+            fetcher=fetcher, max_concurrency=max_concurrency
+        )
+        self._metrics = metrics
+        self._request_time = (
+            metrics.histogram(
+                "quote_service_request_duration_seconds",
+                "Time spent answering a quotes request.",
+            )
+            if metrics is not None
+            else None
+        )
+
+    async def run(
+        self, host: str = "127.0.0.1", port: int = 8080, backlog: int = 1024
+    ) -> None:
+        """
+        Serve the quotes, forever.
+
+        Parameters
+        ----------
+        host : str, optional
+            Interface the HTTP server listens on.
+        port : int, optional
+            Port the HTTP server listens on.
+        backlog : int, optional
+            Maximum number of connections waiting to be accepted.
+        """
+        async with HTTPServer(
+            self.handle, host=host, port=port, backlog=backlog
+        ) as server:
+            logger.info("Serving /quotes on %s.", server.url)
+            await server.serve_forever()
+
+    async def handle(self, request: HTTPRequest) -> HTTPResponse:
+        """
+        Answer an HTTP request.
+
+        Parameters
+        ----------
+        request : HTTPRequest
+            The request.
+
+        Returns
+        -------
+        HTTPResponse
+            The quotes, or an error.
+        """
+        with timed(self._request_time):
+            response = await self._handle(request)
+        if self._metrics is not None:
+            self._metrics.counter(
+                "quote_service_requests_total",
+                "Quotes requests by response status.",
+                labels={"status": str(int(response.status))},
+            ).inc()
+        return response
+
+    async def _handle(self, request: HTTPRequest) -> HTTPResponse:
+        """Route the request and fetch the quotes it asks for."""
+        if request.path != "/quotes":
+            return self._error(HTTPStatus.NOT_FOUND, "Not found.")
+        if request.method != "GET":
+            return self._error(
+                HTTPStatus.METHOD_NOT_ALLOWED, "Method not allowed.", allow="GET"
+            )
+
+        symbols = self._parse_symbols(request.query.get("symbols", ""))
+        if not symbols:
+            return self._error(HTTPStatus.BAD_REQUEST, "No symbols requested.")
+        if len(symbols) > self.max_symbols:
+            return self._error(
+                HTTPStatus.BAD_REQUEST,
+                f"At most {self.max_symbols} symbols can be requested at once.",
+            )
+        invalid_symbols = [
+            symbol for symbol in symbols if not SYMBOL_PATTERN.fullmatch(symbol)
+        ]
+        if invalid_symbols:
+            return self._error(
+                HTTPStatus.BAD_REQUEST,
+                f"Invalid symbols: {', '.join(invalid_symbols)}.",
+            )
+
+        quotes: dict[str, dict[str, Any]] = {}
+        errors: dict[str, str] = {}
+        async for result in self._streamer.stream_stock_quotes(symbols_list=symbols):
+            if result.stock_quote is not None:
+                quotes[result.symbol] = self._serialize_quote(result.stock_quote)
+            else:
+                errors[result.symbol] = result.status
+        return HTTPResponse(
+            status=HTTPStatus.OK if quotes else HTTPStatus.BAD_GATEWAY,
+            body=json.dumps({"quotes": quotes, "errors": errors}).encode(),
+            content_type=JSON_CONTENT_TYPE,
+        )
+
+    @staticmethod
+    def _parse_symbols(symbols_string: str) -> list[str]:
+        """
+        Split the requested symbols, normalizing and deduplicating them.
+
+        Parameters
+        ----------
+        symbols_string : str
+            Comma-separated string of stock symbols.
+
+        Returns
+        -------
+        list[str]
+            The stripped, upper-cased symbols, in request order.
+        """
+        return list(
+            dict.fromkeys(
+                symbol.strip().upper()
+                for symbol in symbols_string.split(",")
+                if symbol.strip()
+            )
+        )
+
+    @staticmethod
+    def _serialize_quote(stock_quote: StockQuote) -> dict[str, Any]:
+        """
+        Convert a stock quote to a JSON-serializable dictionary.
+
+        Parameters
+        ----------
+        stock_quote : StockQuote
+            The stock quote.
+
+        Returns
+        -------
+        dict[str, Any]
+            The quote fields, with the trading day in ISO format.
+        """
+        quote = {name: getattr(stock_quote, name) for name in _QUOTE_FIELDS}
+        quote["latest_trading_day"] = stock_quote.latest_trading_day.isoformat()
+        return quote
+
+    @staticmethod
+    def _error(status: HTTPStatus, message: str, allow: str = "") -> HTTPResponse:
+        """Build a JSON error response."""
+        return HTTPResponse(
+            status=status,
+            body=json.dumps({"error": message}).encode(),
+            content_type=JSON_CONTENT_TYPE,
+            headers={"Allow": allow} if allow else {},
+        )
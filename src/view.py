@@ -1,22 +1,86 @@
 """Module defining the View class for the financial data fetching and presentation app.
 
 Module includes the View class, which is responsible for displaying information to the
-user using the rich library.
+user using the rich library, the LiveView class, which keeps the stock quotes table
+on screen and redraws it in place, and the HeadlessView class, which only logs.
 """
 
+import logging
+import threading
+from abc import ABC, abstractmethod
+from collections.abc import Collection
+from types import TracebackType
+from typing import Optional
+
 from rich.console import Console
+from rich.live import Live
 from rich.table import Table
 
+from toolkit.metrics import MetricsRegistry, timed
+
 from .enums import ViewMessages
-from .model import StockQuote
+from .model import ChangeSet, StockQuote
+
+logger = logging.getLogger(__name__)
+
+STALE_ROW_STYLE = "dim"
+
+
+class ViewInterface(ABC):
+    """Abstract base class for the views the presenter reports to."""
+
+    @abstractmethod
+    def show_quote_changes(self, changes: ChangeSet) -> None:
+        """Display the changes to the stock quotes since the last update.
+
+        Parameters
+        ----------
+        changes : ChangeSet
+            The changes since the last update.
+        """
+
+    @abstractmethod
+    def show_external_service_error(self) -> None:
+        """Report that the external service failed."""
+
+    @abstractmethod
+    def show_internal_error(self) -> None:
+        """Report that the application failed."""
+
+    @abstractmethod
+    def get_symbols(self) -> str:
+        """
+        Get the comma-separated stock symbols to fetch.
+
+        Returns
+        -------
+        str
+            The stock symbols, separated by commas.
+        """
 
 
-class View:
+class View(ViewInterface):
     """Class representing the view in the app."""
 
-    def __init__(self) -> None:
-        """Initialize the View class with a rich console."""
+    def __init__(self, metrics: Optional[MetricsRegistry] = None) -> None:
+        """Initialize the View class with a rich console.
+
+        Parameters
+        ----------
+        metrics : MetricsRegistry, optional
+            Registry receiving the time spent rendering the stock quotes table.
+        """
         self.console = Console()
+        self._quotes: dict[str, StockQuote] = {}
+        self._stale_symbols: set[str] = set()
+        self._render_time = (
+            metrics.histogram(
+                "view_render_duration_seconds",
+                "Time spent rendering the stock quotes table.",
+            )
+            if metrics is not None
+            else None
+        )
 
     def show_divider(self) -> None:
         """Display a divider line."""
@@ -28,14 +92,57 @@ class View:
         self.console.print(ViewMessages.WELCOME_MESSAGE)
         self.show_divider()
 
-    def show_stock_quotes(self, stock_quotes: list[StockQuote]) -> None:
+    def show_quote_changes(self, changes: ChangeSet) -> None:
+        """Apply the changes to the displayed quotes and display them all.
+
+        Parameters
+        ----------
+        changes : ChangeSet
+            The changes since the last update.
+        """
+        self._apply_changes(changes)
+        self.show_stock_quotes(
+            list(self._quotes.values()), stale_symbols=self._stale_symbols
+        )
+
+    def _apply_changes(self, changes: ChangeSet) -> None:
+        """Apply the changes to the quotes and stale symbols kept by the view."""
+        for symbol in changes.removed:
+            self._quotes.pop(symbol, None)
+            self._stale_symbols.discard(symbol)
+        for quote in (*changes.added, *changes.updated):
+            self._quotes[quote.symbol] = quote
+            self._stale_symbols.discard(quote.symbol)
+        self._stale_symbols.difference_update(changes.unchanged)
+        self._stale_symbols.update(changes.stale)
+
+    def show_stock_quotes(
+        self,
+        stock_quotes: list[StockQuote],
+        stale_symbols: Collection[str] = frozenset(),
+    ) -> None:
         """Display stock quotes in a rich table.
 
         Parameters
         ----------
         - stock_quotes : list[StockQuote]:
             List of StockQuote objects to display.
+        - stale_symbols : Collection[str], optional
+            Symbols whose quote is stale, displayed dimmed.
         """
+        with timed(self._render_time):
+            table = self._build_table()
+            for quote in stock_quotes:
+                style = STALE_ROW_STYLE if quote.symbol in stale_symbols else None
+                table.add_row(*self._format_row(quote), style=style)
+
+            self.console.clear()
+            self.console.print(table)
+        self.show_divider()
+
+    @staticmethod
+    def _build_table() -> Table:
+        """Build an empty stock quotes table with its columns."""
         table = Table(show_header=True, header_style="bold magenta")
         table.add_column("Symbol", style="cyan", justify="center")
         table.add_column("Open", style="green", justify="center")
@@ -47,30 +154,34 @@ class View:
         table.add_column("Previous Close", style="green", justify="center")
         table.add_column("Change", style="green", justify="center")
         table.add_column("Change Percent", style="green", justify="center")
+        return table
 
-        for quote in stock_quotes:
-            change_percent = (
-                float(quote.change_percent[:-1])
-                if quote.change_percent.endswith("%")
-                else float(quote.change_percent)
-            )
+    @staticmethod
+    def _format_row(quote: StockQuote) -> tuple[str, ...]:
+        """Format the cells of a stock quote table row.
 
-            table.add_row(
-                quote.symbol,
-                f"${float(quote.open):,.2f}",
-                f"${float(quote.high):,.2f}",
-                f"${float(quote.low):,.2f}",
-                f"${float(quote.price):,.2f}",
-                f"{int(quote.volume):,}",
-                f"{quote.latest_trading_day}",
-                f"${float(quote.previous_close):,.2f}",
-                f"${float(quote.change):,.2f}",
-                f"{float(change_percent):,.2f}%",
-            )
+        Parameters
+        ----------
+        quote : StockQuote
+            The stock quote to format.
 
-        self.console.clear()
-        self.console.print(table)
-        self.show_divider()
+        Returns
+        -------
+        tuple[str, ...]
+            The formatted cells, in column order.
+        """
+        return (
+            quote.symbol,
+            f"${quote.open:,.2f}",
+            f"${quote.high:,.2f}",
+            f"${quote.low:,.2f}",
+            f"${quote.price:,.2f}",
+            f"{quote.volume:,}",
+            quote.latest_trading_day.isoformat(),
+            f"${quote.previous_close:,.2f}",
+            f"${quote.change:,.2f}",
+            f"{quote.change_percent:,.2f}%",
+        )
 
     def show_external_service_error(self) -> None:
         """Display an external service error message."""
@@ -87,3 +198,229 @@ class View:
     def get_symbols(self) -> str:
         """Get user input for stock symbols."""
         return self.console.input(ViewMessages.SYMBOL_RETRIEVAL)
+
+
+class LiveView(View):
+    """
+    View keeping the stock quotes table live on screen instead of reprinting it.
+
+    Formatted rows are cached per symbol, so an update only formats the rows whose
+    quote changed and marks the table dirty. Given a change set, the view only visits
+    the symbols listed in it. The table itself is built lazily by `rich.live.Live`,
+    which asks for it at most `refresh_per_second` times per second and gets the
+    previous table back while nothing changed, so progressive updates are coalesced
+    however often they arrive.
+    """
+
+    def __init__(
+        self, refresh_per_second: float = 4, metrics: Optional[MetricsRegistry] = None
+    ) -> None:
+        """Initialize the LiveView with a rich console and a stopped live display.
+
+        Parameters
+        ----------
+        refresh_per_second : float, optional
+            Maximum number of redraws per second.
+        metrics : MetricsRegistry, optional
+            Registry receiving the time spent building the table asked for by the
+            live display, which draws it on its own refresh thread.
+        """
+        super().__init__(metrics=metrics)
+        self._rows: dict[str, tuple[StockQuote, bool, tuple[str, ...]]] = {}
+        self._caption: Optional[str] = None
+        self._error_reported = False
+        self._table = self._build_table()
+        self._dirty = False
+        # Guards the rows against the live display's refresh thread.
+        self._lock = threading.Lock()
+        self._live = Live(
+            get_renderable=self._get_renderable,
+            console=self.console,
+            refresh_per_second=refresh_per_second,
+            transient=False,
+        )
+
+    def start(self) -> None:
+        """Start the live display."""
+        self._live.start()
+
+    def stop(self) -> None:
+        """Stop the live display, leaving the last table on screen."""
+        self._live.stop()
+
+    def __enter__(self) -> "LiveView":
+        """Start the live display and return the view itself."""
+        self.start()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        """Stop the live display."""
+        self.stop()
+
+    def show_quote_changes(self, changes: ChangeSet) -> None:
+        """Update the live table with the rows listed in the change set only.
+
+        Parameters
+        ----------
+        changes : ChangeSet
+            The changes since the last update.
+        """
+        stale_symbols = set(changes.stale)
+        formatted = {
+            quote.symbol: (
+                quote,
+                quote.symbol in stale_symbols,
+                self._format_row(quote),
+            )
+            for quote in (*changes.added, *changes.updated)
+        }
+
+        with self._lock:
+            changed = bool(formatted)
+            for symbol in changes.removed:
+                changed |= self._rows.pop(symbol, None) is not None
+            self._rows.update(formatted)
+
+            for symbol in (*changes.unchanged, *changes.stale):
+                row = self._rows.get(symbol)
+                stale = symbol in stale_symbols
+                if row is not None and row[1] != stale:
+                    self._rows[symbol] = (row[0], stale, row[2])
+                    changed = True
+
+            self._finish_update(changed)
+
+    def show_stock_quotes(
+        self,
+        stock_quotes: list[StockQuote],
+        stale_symbols: Collection[str] = frozenset(),
+    ) -> None:
+        """Update the live table with the rows of changed stock quotes.
+
+        Parameters
+        ----------
+        - stock_quotes : list[StockQuote]:
+            List of StockQuote objects to display.
+        - stale_symbols : Collection[str], optional
+            Symbols whose quote is stale, displayed dimmed.
+        """
+        symbols = {quote.symbol for quote in stock_quotes}
+        with self._lock:
+            changed = False
+            for symbol in self._rows.keys() - symbols:
+                del self._rows[symbol]
+                changed = True
+
+            for quote in stock_quotes:
+                row = self._rows.get(quote.symbol)
+                stale = quote.symbol in stale_symbols
+                if row is None or row[0] != quote:
+                    self._rows[quote.symbol] = (quote, stale, self._format_row(quote))
+                    changed = True
+                elif row[1] != stale:
+                    self._rows[quote.symbol] = (quote, stale, row[2])
+                    changed = True
+
+            self._finish_update(changed)
+
+    def _finish_update(self, changed: bool) -> None:
+        """Mark the table dirty if anything changed, and clear an outdated caption.
+
+        Must be called with the lock held.
+        """
+        # Errors are reported before the quotes of the same refresh are shown, so the
+        # caption is kept until a refresh that reported no error.
+        if not self._error_reported and self._caption is not None:
+            self._caption = None
+            changed = True
+        self._error_reported = False
+        self._dirty |= changed
+
+    def show_external_service_error(self) -> None:
+        """Display an external service error message under the live table."""
+        self._show_error(ViewMessages.EXTERNAL_ERROR)
+
+    def show_internal_error(self) -> None:
+        """Display an internal error message under the live table."""
+        self._show_error(ViewMessages.INTERNAL_ERROR)
+
+    def _show_error(self, message: str) -> None:
+        """Set the error message shown as the table caption."""
+        caption = message.strip()
+        with self._lock:
+            self._error_reported = True
+            if caption != self._caption:
+                self._caption = caption
+                self._dirty = True
+
+    def _get_renderable(self) -> Table:
+        """Return the table for the live display, rebuilding it only if dirty.
+
+        Returns
+        -------
+        Table
+            A table built from the cached rows and the current caption.
+        """
+        with self._lock:
+            if self._dirty:
+                with timed(self._render_time):
+                    table = self._build_table()
+                    table.caption = self._caption
+                    for _, stale, cells in self._rows.values():
+                        table.add_row(*cells, style=STALE_ROW_STYLE if stale else None)
+                self._table = table
+                self._dirty = False
+            return self._table
+
+
+class HeadlessView(ViewInterface):
+    """
+    View for running without a terminal, logging the changes instead of showing them.
+
+    It keeps no quotes: the model is the only copy, and the logs only say how many
+    quotes changed, so a large watchlist costs nothing to "render". Its symbols are
+    given up front instead of being prompted for.
+    """
+
+    def __init__(self, symbols: Collection[str] = ()) -> None:
+        """Initialize the HeadlessView with the symbols it reports.
+
+        Parameters
+        ----------
+        symbols : Collection[str], optional
+            The stock symbols returned by `get_symbols`.
+        """
+        self.symbols = list(symbols)
+
+    def get_symbols(self) -> str:
+        """Return the symbols given up front, without prompting."""
+        return ",".join(self.symbols)
+
+    def show_quote_changes(self, changes: ChangeSet) -> None:
+        """Log how many stock quotes changed.
+
+        Parameters
+        ----------
+        changes : ChangeSet
+            The changes since the last update.
+        """
+        logger.debug(
+            "Quotes changed: %d added, %d updated, %d removed, %d stale.",
+            len(changes.added),
+            len(changes.updated),
+            len(changes.removed),
+            len(changes.stale),
+        )
+
+    def show_external_service_error(self) -> None:
+        """Log an external service error message."""
+        logger.warning("External service error.")
+
+    def show_internal_error(self) -> None:
+        """Log an internal error message."""
+        logger.warning("Internal error.")
@@ -0,0 +1,113 @@
+"""Module implementing a test suite for the fake AlphaVantage API."""
+
+import json
+import random
+from http import HTTPStatus
+from types import MappingProxyType
+
+import httpx
+import pytest
+
+from benchmarks.fake_alpha_vantage import (
+    FakeAlphaVantage,
+    constant_latency,
+    lognormal_latency,
+)
+from src.adapters import adapt_quote
+from toolkit.server import HTTPRequest
+
+
+async def _get(fake: FakeAlphaVantage, **params: str) -> httpx.Response:
+    """Send a query to the fake through its in-process transport."""
+    async with httpx.AsyncClient(
+        base_url="https://fake.test", transport=fake.transport()
+    ) as client:
+        return await client.get("/query", params=params)
+
+
+@pytest.mark.smoke
+@pytest.mark.asyncio
+async def test_global_quote_is_adaptable() -> None:
+    """Test that a generated global quote parses into StockQuote fields."""
+    response = await _get(
+        FakeAlphaVantage(seed=1), function="GLOBAL_QUOTE", symbol="ibm"
+    )
+
+    stock_data = adapt_quote(response.json())
+
+    assert response.status_code == HTTPStatus.OK
+    assert stock_data["symbol"] == "IBM"
+    assert stock_data["low"] <= stock_data["price"] <= stock_data["high"]
+
+
+@pytest.mark.asyncio
+async def test_bulk_quotes_are_adaptable() -> None:
+    """Test that generated bulk quotes hold one adaptable entry per symbol."""
+    response = await _get(
+        FakeAlphaVantage(seed=1), function="REALTIME_BULK_QUOTES", symbol="A,B,C"
+    )
+
+    data = response.json()["data"]
+
+    assert [adapt_quote(entry)["symbol"] for entry in data] == ["A", "B", "C"]
+
+
+@pytest.mark.asyncio
+async def test_error_and_throttle_rates() -> None:
+    """Test that errors and throttle payloads are answered at the configured rate."""
+    failing = FakeAlphaVantage(error_rate=1.0)
+    throttling = FakeAlphaVantage(throttle_rate=1.0)
+
+    error = await _get(failing, function="GLOBAL_QUOTE", symbol="IBM")
+    throttled = await _get(throttling, function="GLOBAL_QUOTE", symbol="IBM")
+
+    assert error.status_code == HTTPStatus.SERVICE_UNAVAILABLE
+    assert "per minute" in throttled.json()["Note"]
+    assert failing.responses == {"error": 1}
+    assert throttling.responses == {"throttled": 1}
+
+
+@pytest.mark.asyncio
+async def test_invalid_calls() -> None:
+    """Test that unknown functions and paths are rejected."""
+    fake = FakeAlphaVantage()
+
+    invalid = await _get(fake, function="TIME_SERIES_DAILY", symbol="IBM")
+    not_found = await fake.handle(HTTPRequest(method="GET", path="/other"))
+
+    assert "Error Message" in invalid.json()
+    assert not_found.status == HTTPStatus.NOT_FOUND
+
+
+@pytest.mark.asyncio
+async def test_handle_serves_json() -> None:
+    """Test answering a request received by an HTTPServer."""
+    request = HTTPRequest(
+        method="GET",
+        path="/query",
+        query=MappingProxyType({"function": "GLOBAL_QUOTE", "symbol": "IBM"}),
+    )
+
+    response = await FakeAlphaVantage().handle(request)
+
+    assert response.content_type == "application/json"
+    assert json.loads(response.body)["Global Quote"]["01. symbol"] == "IBM"
+
+
+@pytest.mark.exception
+def test_invalid_rates() -> None:
+    """Test that rates outside of [0, 1] or adding up to more than 1 are rejected."""
+    with pytest.raises(ValueError):
+        FakeAlphaVantage(error_rate=1.5)
+    with pytest.raises(ValueError):
+        FakeAlphaVantage(error_rate=0.6, throttle_rate=0.6)
+
+
+def test_latency_models() -> None:
+    """Test the constant and log-normal latency distributions."""
+    rng = random.Random(0)
+    samples = sorted(lognormal_latency(0.1, sigma=0.5)(rng) for _ in range(1001))
+
+    assert constant_latency(0.25)(rng) == 0.25
+    assert samples[500] == pytest.approx(0.1, rel=0.1)
+    assert samples[-1] > 2 * samples[500]
@@ -0,0 +1,66 @@
+"""Module implementing a test suite for the fetch pipeline load driver."""
+
+import pytest
+
+from benchmarks.fake_alpha_vantage import FakeAlphaVantage, constant_latency
+from benchmarks.load_driver import LoadReport, run_load
+from src.enums import FetchStatus
+from src.fetcher import StockQuotesFetcher
+from toolkit.api import AsyncAPIClient
+from toolkit.server import HTTPServer
+
+
+@pytest.mark.smoke
+@pytest.mark.asyncio
+async def test_run_load_in_process() -> None:
+    """Test that every fetch is timed and its outcome counted."""
+    fake = FakeAlphaVantage(error_rate=0.2, throttle_rate=0.1, seed=7)
+    async with AsyncAPIClient(
+        base_url="https://fake.test", transport=fake.transport()
+    ) as api_client:
+        fetcher = StockQuotesFetcher(api_client=api_client, api_key="demo")
+        report = await run_load(
+            fetcher, symbols=[f"S{index}" for index in range(50)], rounds=2
+        )
+
+    assert report.requests == 100
+    assert sum(report.statuses.values()) == 100
+    assert report.errors == fake.responses["error"] + fake.responses["throttled"]
+    assert report.statuses[FetchStatus.HTTP_ERROR] == fake.responses["error"]
+    assert report.statuses[FetchStatus.THROTTLED] == fake.responses["throttled"]
+
+
+@pytest.mark.asyncio
+async def test_run_load_reuses_connections() -> None:
+    """Test that the fetcher keeps at most one connection per concurrent fetch."""
+    fake = FakeAlphaVantage(latency=constant_latency(0.005))
+    async with HTTPServer(handler=fake.handle) as server:
+        async with AsyncAPIClient(base_url=server.url) as api_client:
+            fetcher = StockQuotesFetcher(api_client=api_client, api_key="demo")
+            report = await run_load(
+                fetcher, symbols=[f"S{index}" for index in range(40)], max_concurrency=4
+            )
+
+    assert report.statuses == {FetchStatus.SUCCESS: 40}
+    assert server.requests_served == 40
+    assert server.connections_opened <= 4
+    assert report.percentile(50) >= 0.005
+
+
+def test_report_statistics() -> None:
+    """Test the throughput, nearest-rank percentiles and error count of a report."""
+    report = LoadReport(
+        duration=2.0,
+        latencies=tuple(index / 100 for index in range(100, 0, -1)),
+        statuses={FetchStatus.SUCCESS: 97, FetchStatus.HTTP_ERROR: 3},
+        connections_opened=5,
+    )
+
+    assert report.requests_per_second == 50.0
+    assert report.percentile(50) == 0.5
+    assert report.percentile(99) == 0.99
+    assert report.percentile(100) == 1.0
+    assert report.errors == 3
+    assert "p95 950.0ms" in report.format()
+    assert "5 opened" in report.format()
+    assert LoadReport(duration=0.0, latencies=()).percentile(50) == 0.0
@@ -0,0 +1,66 @@
+"""Module implementing a test suite for the pipeline benchmarks runner."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from benchmarks.pipeline import BENCHMARKS
+from benchmarks.runner import (
+    BenchmarkResult,
+    compare,
+    main,
+    run_benchmark,
+    to_document,
+)
+
+
+@pytest.mark.parametrize("stage", list(BENCHMARKS))
+def test_benchmarks_run(stage: str) -> None:
+    """Test that every stage benchmark runs on a few symbols."""
+    BENCHMARKS[stage](3)()
+
+
+def test_compare_with_baseline() -> None:
+    """Test that results are compared with the baseline results of the same key."""
+    results = [
+        BenchmarkResult(stage="adapt", size=10, loops=1, best=1.0, median=3.0),
+        BenchmarkResult(stage="build", size=10, loops=1, best=1.0, median=1.0),
+    ]
+    baseline = to_document(results[:1])
+    baseline["results"]["adapt[10]"]["median"] = 2.0
+
+    (comparison,) = compare(results, baseline)
+
+    assert comparison.key == "adapt[10]"
+    assert comparison.ratio == 1.5
+
+
+def test_main_flags_regressions(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    """Test saving a baseline, then failing a run slower than it."""
+    baseline = tmp_path / "baseline.json"
+    output = tmp_path / "latest.json"
+    argv = ["--sizes", "2", "--stages", "build", "--repeat", "1"]
+    argv += ["--baseline", str(baseline), "--output", str(output)]
+
+    assert main([*argv, "--save-baseline"]) == 0
+    document = json.loads(baseline.read_text(encoding="utf-8"))
+    assert list(document["results"]) == ["build[2]"]
+
+    document["results"]["build[2]"]["median"] /= 100
+    baseline.write_text(json.dumps(document), encoding="utf-8")
+
+    assert main(argv) == 1
+    assert output.exists()
+    assert "REGRESSION build[2]" in capsys.readouterr().out
+
+
+@pytest.mark.exception
+def test_sizes_must_be_positive() -> None:
+    """Test that benchmarks on no symbol are rejected instead of dividing by zero."""
+    with pytest.raises(ValueError):
+        run_benchmark("build", BENCHMARKS["build"], 0)
+    with pytest.raises(SystemExit):
+        main(["--sizes", "10,0"])
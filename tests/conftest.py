@@ -0,0 +1,11 @@
+"""Fixtures shared by the whole test suite."""
+
+import pytest
+
+from tests.helpers import FakeClock
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    """Fixture providing a fresh FakeClock."""
+    return FakeClock()
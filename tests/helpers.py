@@ -0,0 +1,19 @@
+"""Helpers shared by the test modules."""
+
+
+class FakeClock:
+    """Manually advanced monotonic clock, advanced by the patched `asyncio.sleep`."""
+
+    def __init__(self) -> None:
+        """Initialize the clock at zero."""
+        self.now = 0.0
+        self.sleeps: list[float] = []
+
+    def __call__(self) -> float:
+        """Return the current fake time."""
+        return self.now
+
+    async def sleep(self, delay: float) -> None:
+        """Record the delay and advance the clock instead of sleeping."""
+        self.sleeps.append(delay)
+        self.now += delay
@@ -0,0 +1,115 @@
+"""Module implementing a test suite for the quote schema adapters."""
+
+from datetime import date
+from types import MappingProxyType
+from typing import Any
+
+import pytest
+
+from src.adapters import (
+    GLOBAL_QUOTE_V1,
+    QUOTE_SCHEMAS,
+    QuoteSchema,
+    QuoteSchemaError,
+    adapt_quote,
+)
+from src.model import StockQuote
+
+BULK_QUOTE = {
+    "symbol": "AAPL",
+    "timestamp": "2024-03-15 16:15:00.000",
+    "open": "149.75",
+    "high": "152.34",
+    "low": "149.25",
+    "close": "150.42",
+    "volume": "1000000",
+    "previous_close": "150.50",
+    "change": "0.70",
+    "change_percent": "0.50",
+    "extended_hours_quote": "150.60",
+}
+
+
+@pytest.mark.smoke
+def test_adapt_bulk_quote() -> None:
+    """Test that a bulk quote entry is mapped and converted to StockQuote fields."""
+    stock_quote = StockQuote(**adapt_quote(BULK_QUOTE))
+
+    assert stock_quote.price == 150.42
+    assert stock_quote.volume == 1000000
+    assert stock_quote.latest_trading_day == date(2024, 3, 15)
+    assert stock_quote.change_percent == 0.5
+
+
+def test_adapt_global_quote() -> None:
+    """Test that a global quote response is mapped and parsed to StockQuote fields."""
+    payload = {
+        "Global Quote": {
+            "01. symbol": "AAPL",
+            "02. open": "149.75",
+            "03. high": "152.34",
+            "04. low": "149.25",
+            "05. price": "150.42",
+            "06. volume": "1000000",
+            "07. latest trading day": "2024-03-15",
+            "08. previous close": "150.50",
+            "09. change": "-0.08",
+            "10. change percent": "-0.0532%",
+        }
+    }
+
+    stock_quote = StockQuote(**adapt_quote(payload))
+
+    assert stock_quote.change == -0.08
+    assert stock_quote.change_percent == -0.0532
+    assert stock_quote.latest_trading_day == date(2024, 3, 15)
+
+
+@pytest.mark.exception
+def test_adapt_quote_reports_unparsable_values() -> None:
+    """Test that a value not matching its field type raises ValueError."""
+    with pytest.raises(ValueError):
+        adapt_quote({**BULK_QUOTE, "volume": "n/a"})
+
+
+@pytest.mark.exception
+def test_adapt_quote_reports_missing_fields() -> None:
+    """Test that missing fields are reported instead of failing on construction."""
+    payload = {key: value for key, value in BULK_QUOTE.items() if key != "close"}
+
+    with pytest.raises(QuoteSchemaError) as exc_info:
+        adapt_quote(payload)
+
+    assert exc_info.value.missing_fields == {"price"}
+
+
+@pytest.mark.exception
+@pytest.mark.parametrize("payload", [{"unexpected": "payload"}, [], None])
+def test_adapt_quote_unknown_schema(payload: Any) -> None:
+    """Test that payloads of no known schema are rejected."""
+    with pytest.raises(QuoteSchemaError):
+        adapt_quote(payload)
+
+
+def test_registered_schemas_have_unique_versions() -> None:
+    """Test that every registered schema has its own version."""
+    versions = [schema.version for schema in QUOTE_SCHEMAS]
+
+    assert len(versions) == len(set(versions))
+
+
+@pytest.mark.exception
+@pytest.mark.parametrize(
+    "field_map",
+    [
+        {**GLOBAL_QUOTE_V1.field_map, "11. extra": "price"},
+        {**GLOBAL_QUOTE_V1.field_map, "11. extra": "unknown"},
+        {"01. symbol": "symbol"},
+    ],
+)
+def test_invalid_schema_is_rejected(field_map: dict[str, str]) -> None:
+    """Test that a field map not covering StockQuote exactly is rejected."""
+    with pytest.raises(ValueError):
+        QuoteSchema(
+            version="test/v1", detect_key="test", field_map=MappingProxyType(field_map)
+        )
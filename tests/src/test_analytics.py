@@ -0,0 +1,122 @@
+"""Module implementing a test suite for the quote screening analytics."""
+
+from datetime import date
+
+import pytest
+
+from src import analytics
+from src.analytics import (
+    SectorAggregate,
+    gap_ups,
+    sector_aggregates,
+    top_movers,
+    volume_anomalies,
+)
+from src.model import QuoteStore, StockQuote
+
+
+def _quote(
+    symbol: str,
+    change_percent: float = 0.0,
+    volume: int = 1000,
+    open_: float = 100.0,
+    previous_close: float = 100.0,
+) -> StockQuote:
+    """Build a StockQuote with the given screening values."""
+    return StockQuote(
+        symbol=symbol,
+        open=open_,
+        high=open_,
+        low=open_,
+        price=open_,
+        volume=volume,
+        latest_trading_day=date(2024, 3, 15),
+        previous_close=previous_close,
+        change=0.0,
+        change_percent=change_percent,
+    )
+
+
+@pytest.fixture(params=["python", "numpy"])
+def backend(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> str:
+    """Fixture function running a test with and without NumPy."""
+    if request.param == "numpy":
+        monkeypatch.setattr(analytics, "_np", pytest.importorskip("numpy"))
+    else:
+        monkeypatch.setattr(analytics, "_np", None)
+    return str(request.param)
+
+
+def _store(*stock_quotes: StockQuote) -> QuoteStore:
+    """Build a QuoteStore holding the given quotes."""
+    store = QuoteStore()
+    for stock_quote in stock_quotes:
+        store.upsert(stock_quote)
+    return store
+
+
+def test_top_movers(backend: str) -> None:
+    """Test ranking the symbols by change percent, in both directions."""
+    store = _store(
+        _quote("A", 1.5), _quote("B", -2.0), _quote("C", 4.0), _quote("D", 0.5)
+    )
+
+    assert top_movers(store, n=2) == [("C", 4.0), ("A", 1.5)]
+    assert top_movers(store, n=2, descending=False) == [("B", -2.0), ("D", 0.5)]
+    assert [symbol for symbol, _ in top_movers(store, n=10)] == ["C", "A", "D", "B"]
+
+
+def test_top_movers_empty(backend: str) -> None:
+    """Test that nothing is ranked in an empty store or for a non-positive `n`."""
+    assert top_movers(QuoteStore()) == []
+    assert top_movers(_store(_quote("A")), n=0) == []
+
+
+def test_gap_ups(backend: str) -> None:
+    """Test finding the symbols which opened above their previous close."""
+    store = _store(
+        _quote("A", open_=103.0),
+        _quote("B", open_=101.0),
+        _quote("C", open_=110.0),
+        _quote("D", open_=10.0, previous_close=0.0),
+    )
+
+    result = gap_ups(store, min_gap_percent=2.0)
+
+    assert [symbol for symbol, _ in result] == ["C", "A"]
+    assert result[0][1] == pytest.approx(10.0)
+    assert result[1][1] == pytest.approx(3.0)
+
+
+def test_volume_anomalies(backend: str) -> None:
+    """Test flagging the symbols whose volume z-score reaches the threshold."""
+    store = _store(*(_quote(f"S{i}", volume=1000) for i in range(9)))
+    store.upsert(_quote("SPIKE", volume=100_000))
+
+    result = volume_anomalies(store, threshold=2.0)
+
+    assert [symbol for symbol, _ in result] == ["SPIKE"]
+    assert result[0][1] == pytest.approx(3.0)
+
+
+def test_volume_anomalies_without_spread(backend: str) -> None:
+    """Test that no anomaly is reported when every volume is the same."""
+    assert volume_anomalies(_store(_quote("A"), _quote("B"))) == []
+    assert volume_anomalies(_store(_quote("A"))) == []
+
+
+def test_sector_aggregates(backend: str) -> None:
+    """Test aggregating the quotes per sector, leaving out unmapped symbols."""
+    store = _store(
+        _quote("AAPL", 2.0, volume=100),
+        _quote("MSFT", 1.0, volume=300),
+        _quote("XOM", -1.0, volume=50),
+        _quote("OTHER", 9.0, volume=999),
+    )
+    sectors = {"AAPL": "Tech", "MSFT": "Tech", "XOM": "Energy"}
+
+    assert sector_aggregates(store, sectors) == {
+        "Tech": SectorAggregate(count=2, mean_change_percent=1.5, total_volume=400),
+        "Energy": SectorAggregate(count=1, mean_change_percent=-1.0, total_volume=50),
+    }
+    assert sector_aggregates(QuoteStore(), sectors) == {}
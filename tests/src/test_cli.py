@@ -0,0 +1,105 @@
+"""Module implementing a test suite for the command line interface options."""
+
+from pathlib import Path
+
+import pytest
+
+from src.cli import CLIOptions, parse_args, read_symbols_file
+
+
+@pytest.mark.smoke
+def test_parse_args_defaults() -> None:
+    """Test that no arguments select the interactive mode."""
+    assert parse_args([]) == CLIOptions()
+
+
+def test_parse_args_watch_mode() -> None:
+    """Test parsing the watch mode options."""
+    options = parse_args(
+        ["--watch", "--symbols", "AAPL, MSFT,", "--interval", "30", "--jitter", "2"]
+    )
+
+    assert options == CLIOptions(
+        watch=True, symbols=("AAPL", "MSFT"), interval=30.0, jitter=2.0
+    )
+
+
+def test_parse_args_symbols_file(tmp_path: Path) -> None:
+    """
+    Test that symbols from a file are appended to the `--symbols` ones.
+
+    Parameters
+    ----------
+    tmp_path : Path
+        The temporary directory holding the symbols file.
+    """
+    symbols_file = tmp_path / "symbols.txt"
+    symbols_file.write_text("GOOGL\nAMZN, TSLA\n", encoding="utf-8")
+
+    options = parse_args(
+        ["--watch", "--symbols", "AAPL", "--symbols-file", str(symbols_file), "--bulk"]
+    )
+
+    assert options.symbols == ("AAPL", "GOOGL", "AMZN", "TSLA")
+    assert options.use_bulk_quotes
+
+
+def test_read_symbols_file(tmp_path: Path) -> None:
+    """
+    Test that blank entries and comment lines are ignored.
+
+    Parameters
+    ----------
+    tmp_path : Path
+        The temporary directory holding the symbols file.
+    """
+    symbols_file = tmp_path / "symbols.txt"
+    symbols_file.write_text("# watchlist\nAAPL\n\n  MSFT ,, IBM\n", encoding="utf-8")
+
+    assert read_symbols_file(path=symbols_file) == ["AAPL", "MSFT", "IBM"]
+
+
+@pytest.mark.exception
+def test_parse_args_metrics_file() -> None:
+    """Test parsing the file the metrics are written to."""
+    options = parse_args(["--metrics-file", "metrics.prom"])
+
+    assert options == CLIOptions(metrics_file=Path("metrics.prom"))
+
+
+def test_parse_args_headless_mode() -> None:
+    """Test parsing the headless mode and the address its endpoints listen on."""
+    options = parse_args(["--headless", "--symbols", "AAPL", "--listen", ":9200"])
+
+    assert options == CLIOptions(
+        headless=True, symbols=("AAPL",), listen=("0.0.0.0", 9200)
+    )
+    assert parse_args(["--listen", "[::1]:80"]).listen == ("::1", 80)
+    assert parse_args(["--serve"]) == CLIOptions(serve=True)
+
+
+@pytest.mark.parametrize(
+    "argv",
+    [
+        ["--watch"],
+        ["--headless"],
+        ["--headless", "--watch", "--symbols", "AAPL"],
+        ["--serve", "--headless", "--symbols", "AAPL"],
+        ["--listen", "localhost"],
+        ["--listen", "localhost:99999"],
+        ["--watch", "--symbols", " , "],
+        ["--interval", "0"],
+        ["--jitter", "-1"],
+    ],
+)
+def test_parse_args_invalid(argv: list[str]) -> None:
+    """
+    Test that invalid option combinations exit with a usage error.
+
+    Parameters
+    ----------
+    argv : list[str]
+        The invalid command line arguments.
+    """
+    with pytest.raises(SystemExit):
+        parse_args(argv)
@@ -0,0 +1,19 @@
+"""Module implementing a test suite for the helpers of the core module."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.core import _notify_refresh
+
+
+@pytest.mark.exception
+def test_notify_refresh_logs_os_errors() -> None:
+    """Test that an OSError raised by `on_refresh` is logged instead of raised."""
+    on_refresh = MagicMock(side_effect=OSError("disk full"))
+
+    with patch("src.core.logger") as mock_logger:
+        _notify_refresh(on_refresh)
+
+    on_refresh.assert_called_once_with()
+    mock_logger.error.assert_called_once()
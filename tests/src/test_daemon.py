@@ -0,0 +1,190 @@
+"""Module implementing a test suite for the headless Daemon class."""
+
+import json
+from collections.abc import AsyncIterator
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+import pytest_asyncio
+
+from benchmarks.fake_alpha_vantage import FakeAlphaVantage
+from src.daemon import Daemon
+from src.fetcher import (
+    CachedStockQuotesFetcher,
+    CoalescingStockQuotesFetcher,
+    StockQuotesFetcher,
+)
+from src.model import Model
+from src.presenter import Presenter
+from src.view import HeadlessView
+from tests.helpers import FakeClock
+from toolkit.api import AsyncAPIClient, TokenBucketRateLimiter
+from toolkit.metrics import PROMETHEUS_CONTENT_TYPE, MetricsRegistry
+from toolkit.server import HTTPRequest, HTTPServer
+
+
+@pytest_asyncio.fixture
+async def daemon(clock: FakeClock) -> AsyncIterator[Daemon]:
+    """Fixture providing a daemon fetching from a fake AlphaVantage API."""
+    metrics = MetricsRegistry()
+    rate_limiter = TokenBucketRateLimiter(rate=1000, burst=100, daily_budget=500)
+    async with AsyncAPIClient(
+        base_url="https://fake.test",
+        transport=FakeAlphaVantage().transport(),
+        metrics=metrics,
+    ) as api_client:
+        cache = CachedStockQuotesFetcher(
+            fetcher=StockQuotesFetcher(
+                api_client=api_client,
+                api_key="demo",
+                rate_limiter=rate_limiter,
+                metrics=metrics,
+            )
+        )
+        coalescer = CoalescingStockQuotesFetcher(fetcher=cache)
+        model = Model()
+        presenter = Presenter(
+            view=HeadlessView(), model=model, fetcher=coalescer, metrics=metrics
+        )
+        yield Daemon(
+            presenter=presenter,
+            model=model,
+            symbols=["AAPL", "MSFT", "IBM"],
+            metrics=metrics,
+            interval=10.0,
+            cache=cache,
+            coalescer=coalescer,
+            rate_limiter=rate_limiter,
+            clock=clock,
+        )
+
+
+@pytest.mark.smoke
+@pytest.mark.asyncio
+async def test_metrics_endpoint(daemon: Daemon) -> None:
+    """Test that the fetch latencies, cache, quota and in-flight gauges are served."""
+    await daemon.refresh()
+    await daemon.refresh()
+
+    response = await daemon.handle(HTTPRequest(method="GET", path="/metrics"))
+
+    lines = response.body.decode().splitlines()
+    assert response.status == 200
+    assert response.content_type == PROMETHEUS_CONTENT_TYPE
+    assert 'http_client_request_duration_seconds_count{phase="total"} 3' in lines
+    assert 'quote_cache_lookups_total{result="hit"} 3.0' in lines
+    assert 'quote_cache_lookups_total{result="miss"} 3.0' in lines
+    assert "quote_cache_hit_ratio 0.5" in lines
+    assert "quota_remaining_daily_requests 497.0" in lines
+    assert "quote_fetches_in_flight 0.0" in lines
+    assert "http_client_requests_in_flight 0.0" in lines
+    assert "daemon_refreshes_total 2.0" in lines
+
+
+@pytest.mark.asyncio
+async def test_healthz_endpoint(daemon: Daemon, clock: FakeClock) -> None:
+    """Test that the daemon is healthy only while refreshes keep completing."""
+    request = HTTPRequest(method="GET", path="/healthz")
+
+    starting = await daemon.handle(request)
+    await daemon.refresh()
+    clock.now = 30.0
+    healthy = await daemon.handle(request)
+    clock.now = 30.1
+    stale = await daemon.handle(request)
+
+    assert starting.status == 503
+    assert json.loads(starting.body)["status"] == "starting"
+    assert healthy.status == 200
+    assert json.loads(healthy.body) == {
+        "status": "ok",
+        "last_refresh_age_seconds": 30.0,
+        "symbols": 3,
+        "quotes": 3,
+        "stale_quotes": 0,
+        "failed_symbols": 0,
+    }
+    assert stale.status == 503
+    assert json.loads(stale.body)["status"] == "stale"
+
+
+@pytest.mark.asyncio
+async def test_refresh_defers_retries(daemon: Daemon) -> None:
+    """Test that failed symbols are retried after the retry delay, not at once."""
+    presenter = MagicMock(spec=Presenter)
+    presenter.failed_symbols = []
+    refresher = Daemon(
+        presenter=presenter,
+        model=daemon.model,
+        symbols=daemon.symbols,
+        metrics=MetricsRegistry(),
+        interval=10.0,
+    )
+
+    await refresher.refresh()
+    presenter.retry_failed_symbols.assert_not_awaited()
+
+    presenter.failed_symbols = ["IBM"]
+    await refresher.refresh()
+    presenter.retry_failed_symbols.assert_awaited_once_with(delay=5.0)
+    assert presenter.update_view.call_count == 3
+
+
+@pytest.mark.exception
+@pytest.mark.asyncio
+async def test_refresh_survives_failing_callback(daemon: Daemon) -> None:
+    """Test that an OSError raised by `on_refresh` does not stop the refreshes."""
+    on_refresh = MagicMock(side_effect=OSError("disk full"))
+    refresher = Daemon(
+        presenter=daemon.presenter,
+        model=daemon.model,
+        symbols=daemon.symbols,
+        metrics=daemon.metrics,
+        on_refresh=on_refresh,
+    )
+
+    await refresher.refresh()
+    await refresher.refresh()
+
+    assert on_refresh.call_count == 2
+    assert refresher.health()["status"] == "ok"
+
+
+@pytest.mark.exception
+@pytest.mark.asyncio
+async def test_unknown_routes(daemon: Daemon) -> None:
+    """Test that other paths and methods are rejected over a real connection."""
+    async with (
+        HTTPServer(handler=daemon.handle) as server,
+        httpx.AsyncClient(base_url=server.url) as client,
+    ):
+        missing = await client.get("/quotes")
+        not_allowed = await client.post("/metrics")
+        healthz = await client.get("/healthz")
+
+    assert missing.status_code == 404
+    assert not_allowed.status_code == 405
+    assert not_allowed.headers["allow"] == "GET"
+    assert healthz.headers["content-type"] == "application/json"
+
+
+@pytest.mark.exception
+def test_invalid_stale_after_and_retry_delay(daemon: Daemon) -> None:
+    """Test that the staleness threshold and the retry delay are validated."""
+    with pytest.raises(ValueError):
+        Daemon(
+            presenter=daemon.presenter,
+            model=daemon.model,
+            symbols=[],
+            metrics=daemon.metrics,
+            stale_after=0,
+        )
+    with pytest.raises(ValueError):
+        Daemon(
+            presenter=daemon.presenter,
+            model=daemon.model,
+            symbols=[],
+            metrics=daemon.metrics,
+            retry_delay=-1,
+        )
@@ -1,14 +1,32 @@
 """Module for fetching stock quotes asynchronously."""
 
+import asyncio
 import json
-from unittest.mock import AsyncMock, patch
+from typing import Any
+from unittest.mock import AsyncMock, Mock, patch
 
 import httpx
 import pytest
 
 from src.enums import AlphaVantageAPIConsts as AVAPIConsts
-from src.fetcher import StockQuotesFetcher
-from toolkit.api import AsyncAPIClient
+from src.enums import AlphaVantageAPILimits as AVAPILimits
+from src.fetcher import (
+    AlphaVantageAPIError,
+    AlphaVantageThrottledError,
+    CachedStockQuotesFetcher,
+    CoalescingStockQuotesFetcher,
+    ConcurrencyLimitedStockQuotesFetcher,
+    StockQuotesFetcher,
+)
+from toolkit.api import (
+    AsyncAPIClient,
+    CircuitOpenError,
+    RateLimiterInterface,
+    RateLimitExceededError,
+    RetryPolicy,
+)
+from toolkit.metrics import MetricsRegistry
+from toolkit.serialization import StdlibJSONDecoder
 
 
 @pytest.fixture
@@ -28,7 +46,9 @@ async def test_fetch_stock_quote_success(fetcher: StockQuotesFetcher) -> None:
         request=httpx.Request("get", AVAPIConsts.BASE_URL),
     )
 
-    async def mock_get(endpoint: str, params: dict[str, str]) -> httpx.Response:
+    async def mock_get(
+        endpoint: str, params: dict[str, str], **kwargs: Any
+    ) -> httpx.Response:
         return mock_response
 
     with patch.object(fetcher, "_client", new_callable=AsyncMock) as mock_client:
@@ -48,7 +68,9 @@ async def test_fetch_stock_quote_json_error(fetcher: StockQuotesFetcher) -> None
         request=httpx.Request("get", AVAPIConsts.BASE_URL),
     )
 
-    async def mock_get(endpoint: str, params: dict[str, str]) -> httpx.Response:
+    async def mock_get(
+        endpoint: str, params: dict[str, str], **kwargs: Any
+    ) -> httpx.Response:
         return mock_response
 
     with patch.object(fetcher, "_client", new_callable=AsyncMock) as mock_client:
@@ -67,3 +89,663 @@ def test_construct_params(fetcher: StockQuotesFetcher) -> None:
     assert (
         actual_params == expected_params
     ), f"expect `{expected_params}` params, got `{actual_params}`"
+
+
+@pytest.mark.asyncio
+async def test_fetch_stock_quote_waits_on_rate_limiter() -> None:
+    """Test that the fetcher acquires the rate limiter before each attempt."""
+    rate_limiter = AsyncMock(spec=RateLimiterInterface)
+    responses = iter([503, 200])
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(status_code=next(responses), json={"key": "value"})
+
+    fetcher = StockQuotesFetcher(
+        api_client=AsyncAPIClient(
+            base_url=AVAPIConsts.BASE_URL,
+            retry_policy=RetryPolicy(max_attempts=2, backoff_base=0),
+            transport=httpx.MockTransport(handler),
+        ),
+        api_key="api_key",
+        rate_limiter=rate_limiter,
+    )
+
+    content = await fetcher.fetch_stock_quote(
+        endpoint="/", operation="GLOBAL", symbol="A"
+    )
+
+    assert content == {"key": "value"}
+    assert rate_limiter.acquire.await_count == 2
+
+
+@pytest.mark.exception
+@pytest.mark.asyncio
+async def test_fetch_stock_quote_budget_exhausted() -> None:
+    """Test that no request is sent once the rate limiter refuses it."""
+    rate_limiter = AsyncMock(spec=RateLimiterInterface)
+    rate_limiter.acquire.side_effect = RateLimitExceededError("exhausted")
+    handler = Mock(return_value=httpx.Response(status_code=200, json={}))
+    fetcher = StockQuotesFetcher(
+        api_client=AsyncAPIClient(
+            base_url=AVAPIConsts.BASE_URL, transport=httpx.MockTransport(handler)
+        ),
+        api_key="api_key",
+        rate_limiter=rate_limiter,
+    )
+
+    with pytest.raises(RateLimitExceededError):
+        await fetcher.fetch_stock_quote(endpoint="/", operation="GLOBAL", symbol="A")
+    handler.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_cached_fetcher_returns_cached_quote() -> None:
+    """Test that repeated lookups within the TTL hit the wrapped fetcher once."""
+    inner_fetcher = AsyncMock(spec=StockQuotesFetcher)
+    inner_fetcher.fetch_stock_quote.return_value = {"test_key": "test_value"}
+    fetcher = CachedStockQuotesFetcher(fetcher=inner_fetcher, ttl=60)
+
+    for _ in range(3):
+        actual_content = await fetcher.fetch_stock_quote(
+            endpoint="/", operation="GLOBAL", symbol="AAPL"
+        )
+        assert actual_content == {"test_key": "test_value"}
+
+    inner_fetcher.fetch_stock_quote.assert_awaited_once_with(
+        endpoint="/", operation="GLOBAL", symbol="AAPL"
+    )
+    assert fetcher.stats.hits == 2
+    assert fetcher.stats.misses == 1
+
+
+@pytest.mark.asyncio
+async def test_cached_fetcher_keys_by_symbol() -> None:
+    """Test that different symbols are cached separately."""
+    inner_fetcher = AsyncMock(spec=StockQuotesFetcher)
+    inner_fetcher.fetch_stock_quote.return_value = {"test_key": "test_value"}
+    fetcher = CachedStockQuotesFetcher(fetcher=inner_fetcher)
+
+    await fetcher.fetch_stock_quote(endpoint="/", operation="GLOBAL", symbol="AAPL")
+    await fetcher.fetch_stock_quote(endpoint="/", operation="GLOBAL", symbol="MSFT")
+
+    assert inner_fetcher.fetch_stock_quote.await_count == 2
+
+
+@pytest.mark.exception
+@pytest.mark.asyncio
+async def test_cached_fetcher_does_not_cache_errors() -> None:
+    """Test that a failed fetch is retried on the next lookup."""
+    inner_fetcher = AsyncMock(spec=StockQuotesFetcher)
+    inner_fetcher.fetch_stock_quote.side_effect = [
+        json.JSONDecodeError("error", "", 0),
+        {"test_key": "test_value"},
+    ]
+    fetcher = CachedStockQuotesFetcher(fetcher=inner_fetcher)
+
+    with pytest.raises(json.JSONDecodeError):
+        await fetcher.fetch_stock_quote(endpoint="/", operation="GLOBAL", symbol="A")
+    actual_content = await fetcher.fetch_stock_quote(
+        endpoint="/", operation="GLOBAL", symbol="A"
+    )
+
+    assert actual_content == {"test_key": "test_value"}
+
+
+@pytest.mark.asyncio
+async def test_coalescing_fetcher_deduplicates_concurrent_symbols() -> None:
+    """Test that concurrent fetches of one normalized symbol share a single request."""
+    inner_fetcher = AsyncMock(spec=StockQuotesFetcher)
+
+    async def fetch_stock_quote(**kwargs: Any) -> dict[str, str]:
+        await asyncio.sleep(0)
+        return {"symbol": kwargs["symbol"]}
+
+    inner_fetcher.fetch_stock_quote.side_effect = fetch_stock_quote
+    fetcher = CoalescingStockQuotesFetcher(fetcher=inner_fetcher)
+
+    results = await asyncio.gather(
+        *(
+            fetcher.fetch_stock_quote(endpoint="/", operation="GLOBAL", symbol=symbol)
+            for symbol in ["AAPL", "aapl", " AAPL ", "MSFT"]
+        )
+    )
+
+    assert results == [{"symbol": "AAPL"}] * 3 + [{"symbol": "MSFT"}]
+    assert inner_fetcher.fetch_stock_quote.await_count == 2
+    inner_fetcher.fetch_stock_quote.assert_any_await(
+        endpoint="/", operation="GLOBAL", symbol="AAPL"
+    )
+
+
+@pytest.mark.asyncio
+async def test_coalescing_fetcher_keys_by_operation() -> None:
+    """Test that the same symbol with different operations is not coalesced."""
+    inner_fetcher = AsyncMock(spec=StockQuotesFetcher)
+    inner_fetcher.fetch_stock_quote.return_value = {}
+    fetcher = CoalescingStockQuotesFetcher(fetcher=inner_fetcher)
+
+    await asyncio.gather(
+        fetcher.fetch_stock_quote(endpoint="/", operation="GLOBAL", symbol="AAPL"),
+        fetcher.fetch_stock_quote(endpoint="/", operation="OTHER", symbol="AAPL"),
+    )
+
+    assert inner_fetcher.fetch_stock_quote.await_count == 2
+
+
+def _bulk_response(symbols: list[str]) -> httpx.Response:
+    """Build a REALTIME_BULK_QUOTES response containing the given symbols."""
+    return httpx.Response(
+        status_code=200,
+        json={
+            "endpoint": "Realtime Bulk Quotes",
+            "data": [
+                {
+                    "symbol": symbol,
+                    "timestamp": "2024-03-15 16:15:00.000",
+                    "open": "1.0",
+                    "high": "2.0",
+                    "low": "0.5",
+                    "close": "1.5",
+                    "volume": "100",
+                    "previous_close": "1.25",
+                    "change": "0.25",
+                    "change_percent": "20.0",
+                }
+                for symbol in symbols
+            ],
+        },
+        request=httpx.Request("get", AVAPIConsts.BASE_URL),
+    )
+
+
+@pytest.mark.asyncio
+async def test_fetch_bulk_stock_quotes_chunks_symbols(
+    fetcher: StockQuotesFetcher,
+) -> None:
+    """Test that symbols are packed into bulk requests of at most 100 symbols."""
+    symbols = [f"SYM{index}" for index in range(150)]
+
+    async def mock_get(
+        endpoint: str, params: dict[str, str], **kwargs: Any
+    ) -> httpx.Response:
+        assert params["function"] == AVAPIConsts.BULK_OPERATION
+        return _bulk_response(params["symbol"].split(","))
+
+    with patch.object(fetcher, "_client", new_callable=AsyncMock) as mock_client:
+        mock_client.get.side_effect = mock_get
+        stock_quotes = await fetcher.fetch_bulk_stock_quotes(
+            endpoint="/", symbols=symbols
+        )
+
+    requested_chunks = [
+        call.kwargs["params"]["symbol"].split(",")
+        for call in mock_client.get.await_args_list
+    ]
+    assert sorted(len(chunk) for chunk in requested_chunks) == [50, 100]
+    assert list(stock_quotes) == symbols
+    assert stock_quotes["SYM0"] == {
+        "symbol": "SYM0",
+        "timestamp": "2024-03-15 16:15:00.000",
+        "open": "1.0",
+        "high": "2.0",
+        "low": "0.5",
+        "close": "1.5",
+        "volume": "100",
+        "previous_close": "1.25",
+        "change": "0.25",
+        "change_percent": "20.0",
+    }
+
+
+@pytest.mark.asyncio
+async def test_fetch_bulk_stock_quotes_falls_back_for_missing_symbols(
+    fetcher: StockQuotesFetcher,
+) -> None:
+    """Test that symbols absent from the bulk response are fetched one by one."""
+
+    async def mock_get(
+        endpoint: str, params: dict[str, str], **kwargs: Any
+    ) -> httpx.Response:
+        if params["function"] == AVAPIConsts.BULK_OPERATION:
+            return _bulk_response(["AAPL"])
+        return httpx.Response(
+            status_code=200,
+            json={"Global Quote": {"01. symbol": params["symbol"]}},
+            request=httpx.Request("get", AVAPIConsts.BASE_URL),
+        )
+
+    with patch.object(fetcher, "_client", new_callable=AsyncMock) as mock_client:
+        mock_client.get.side_effect = mock_get
+        stock_quotes = await fetcher.fetch_bulk_stock_quotes(
+            endpoint="/", symbols=["aapl", "MSFT", "aapl"]
+        )
+
+    assert mock_client.get.await_count == 2
+    assert stock_quotes["aapl"]["close"] == "1.5"
+    assert stock_quotes["MSFT"] == {"Global Quote": {"01. symbol": "MSFT"}}
+
+
+@pytest.mark.asyncio
+async def test_fetch_bulk_stock_quotes_bounds_concurrency() -> None:
+    """Test that chunks and fallbacks never exceed `max_concurrency` requests."""
+    fetcher = StockQuotesFetcher(
+        api_client=AsyncMock(spec=AsyncAPIClient),
+        api_key="api_key",
+        max_concurrency=3,
+    )
+    in_flight = peak = 0
+
+    async def mock_get_json(endpoint: str, params: dict[str, str]) -> Any:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0)
+        in_flight -= 1
+        if params["function"] == AVAPIConsts.BULK_OPERATION:
+            return {"data": []}
+        return {"Global Quote": {"01. symbol": params["symbol"]}}
+
+    symbols = [f"SYM{index}" for index in range(250)]
+    with patch.object(fetcher, "_get_json", side_effect=mock_get_json) as mock_get:
+        stock_quotes = await fetcher.fetch_bulk_stock_quotes(
+            endpoint="/", symbols=symbols
+        )
+
+    assert mock_get.await_count == 3 + 250
+    assert peak == 3
+    assert stock_quotes["SYM42"] == {"Global Quote": {"01. symbol": "SYM42"}}
+
+
+@pytest.mark.exception
+def test_invalid_max_concurrency() -> None:
+    """Test that the bulk concurrency limit must be positive."""
+    with pytest.raises(ValueError):
+        StockQuotesFetcher(
+            api_client=AsyncMock(spec=AsyncAPIClient),
+            api_key="api_key",
+            max_concurrency=0,
+        )
+
+
+@pytest.mark.exception
+@pytest.mark.asyncio
+async def test_fetch_bulk_stock_quotes_isolates_failed_chunks(
+    fetcher: StockQuotesFetcher,
+) -> None:
+    """Test that a failed chunk only fails its own symbols."""
+    symbols = [f"SYM{index}" for index in range(150)]
+    request = httpx.Request("get", AVAPIConsts.BASE_URL)
+    error = httpx.HTTPStatusError(
+        "Bad Request", request=request, response=httpx.Response(400, request=request)
+    )
+
+    async def mock_get(
+        endpoint: str, params: dict[str, str], **kwargs: Any
+    ) -> httpx.Response:
+        chunk = params["symbol"].split(",")
+        if "SYM100" in chunk:
+            raise error
+        return _bulk_response(chunk)
+
+    with patch.object(fetcher, "_client", new_callable=AsyncMock) as mock_client:
+        mock_client.get.side_effect = mock_get
+        stock_quotes = await fetcher.fetch_bulk_stock_quotes(
+            endpoint="/", symbols=symbols
+        )
+
+    assert mock_client.get.await_count == 2
+    assert list(stock_quotes) == symbols
+    assert all(stock_quotes[symbol]["close"] == "1.5" for symbol in symbols[:100])
+    assert all(stock_quotes[symbol] is error for symbol in symbols[100:])
+
+
+@pytest.mark.exception
+@pytest.mark.asyncio
+async def test_fetch_bulk_stock_quotes_falls_back_when_rejected(
+    fetcher: StockQuotesFetcher,
+) -> None:
+    """Test that a premium endpoint rejection falls back to one fetch per symbol."""
+
+    async def mock_get(
+        endpoint: str, params: dict[str, str], **kwargs: Any
+    ) -> httpx.Response:
+        if params["function"] == AVAPIConsts.BULK_OPERATION:
+            content: dict[str, Any] = {
+                "Information": "Thank you for using Alpha Vantage! This is a premium "
+                "endpoint. You may subscribe to any of the premium plans at "
+                "https://www.alphavantage.co/premium/ to instantly unlock all premium "
+                "endpoints"
+            }
+        elif params["symbol"] == "BAD":
+            content = {"Error Message": "Invalid API call."}
+        else:
+            content = {"Global Quote": {"01. symbol": params["symbol"]}}
+        return httpx.Response(
+            status_code=200,
+            json=content,
+            request=httpx.Request("get", AVAPIConsts.BASE_URL),
+        )
+
+    with patch.object(fetcher, "_client", new_callable=AsyncMock) as mock_client:
+        mock_client.get.side_effect = mock_get
+        stock_quotes = await fetcher.fetch_bulk_stock_quotes(
+            endpoint="/", symbols=["AAPL", "BAD", "MSFT"]
+        )
+
+    assert mock_client.get.await_count == 4
+    assert stock_quotes["AAPL"] == {"Global Quote": {"01. symbol": "AAPL"}}
+    assert stock_quotes["MSFT"] == {"Global Quote": {"01. symbol": "MSFT"}}
+    assert isinstance(stock_quotes["BAD"], AlphaVantageAPIError)
+
+
+@pytest.mark.asyncio
+async def test_cached_fetcher_bulk_fetches_only_missing_symbols() -> None:
+    """Test that cached symbols are not requested again in bulk mode."""
+    inner_fetcher = AsyncMock(spec=StockQuotesFetcher)
+    inner_fetcher.fetch_stock_quote.return_value = {"quote": "AAPL"}
+    inner_fetcher.fetch_bulk_stock_quotes.return_value = {"MSFT": {"quote": "MSFT"}}
+    fetcher = CachedStockQuotesFetcher(fetcher=inner_fetcher)
+    await fetcher.fetch_stock_quote(
+        endpoint="/", operation=AVAPIConsts.OPERATION, symbol="AAPL"
+    )
+
+    stock_quotes = await fetcher.fetch_bulk_stock_quotes(
+        endpoint="/", symbols=["AAPL", "MSFT"]
+    )
+    await fetcher.fetch_bulk_stock_quotes(endpoint="/", symbols=["AAPL", "MSFT"])
+
+    assert stock_quotes == {"AAPL": {"quote": "AAPL"}, "MSFT": {"quote": "MSFT"}}
+    inner_fetcher.fetch_bulk_stock_quotes.assert_awaited_once_with(
+        endpoint="/", symbols=["MSFT"]
+    )
+
+
+@pytest.mark.exception
+@pytest.mark.asyncio
+async def test_cached_fetcher_bulk_does_not_cache_errors() -> None:
+    """Test that symbols failing in a bulk fetch are requested again."""
+    error = httpx.ConnectError("refused")
+    inner_fetcher = AsyncMock(spec=StockQuotesFetcher)
+    inner_fetcher.fetch_bulk_stock_quotes.return_value = {"AAPL": error}
+    fetcher = CachedStockQuotesFetcher(fetcher=inner_fetcher, ttl=60)
+
+    for _ in range(2):
+        stock_quotes = await fetcher.fetch_bulk_stock_quotes(
+            endpoint="/", symbols=["AAPL"]
+        )
+        assert stock_quotes == {"AAPL": error}
+
+    assert inner_fetcher.fetch_bulk_stock_quotes.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_coalescing_fetcher_bulk_normalizes_symbols() -> None:
+    """Test that bulk fetches send each normalized symbol once."""
+    inner_fetcher = AsyncMock(spec=StockQuotesFetcher)
+    inner_fetcher.fetch_bulk_stock_quotes.return_value = {"AAPL": {"quote": "AAPL"}}
+    fetcher = CoalescingStockQuotesFetcher(fetcher=inner_fetcher)
+
+    stock_quotes = await fetcher.fetch_bulk_stock_quotes(
+        endpoint="/", symbols=["AAPL", " aapl", "MSFT"]
+    )
+
+    inner_fetcher.fetch_bulk_stock_quotes.assert_awaited_once_with(
+        endpoint="/", symbols=["AAPL", "MSFT"]
+    )
+    assert stock_quotes == {"AAPL": {"quote": "AAPL"}, " aapl": {"quote": "AAPL"}}
+
+
+@pytest.mark.asyncio
+async def test_coalescing_fetcher_bulk_joins_symbols_in_flight() -> None:
+    """Test that concurrent bulk fetches only send the symbols not yet in flight."""
+    inner_fetcher = AsyncMock(spec=StockQuotesFetcher)
+
+    async def fetch_bulk_stock_quotes(
+        endpoint: str, symbols: list[str]
+    ) -> dict[str, Any]:
+        await asyncio.sleep(0)
+        return {symbol: {"quote": symbol} for symbol in symbols}
+
+    inner_fetcher.fetch_bulk_stock_quotes.side_effect = fetch_bulk_stock_quotes
+    fetcher = CoalescingStockQuotesFetcher(fetcher=inner_fetcher)
+
+    first, second = await asyncio.gather(
+        fetcher.fetch_bulk_stock_quotes(endpoint="/", symbols=["AAPL", "MSFT"]),
+        fetcher.fetch_bulk_stock_quotes(endpoint="/", symbols=["msft", "GOOGL"]),
+    )
+
+    assert first == {"AAPL": {"quote": "AAPL"}, "MSFT": {"quote": "MSFT"}}
+    assert second == {"msft": {"quote": "MSFT"}, "GOOGL": {"quote": "GOOGL"}}
+    assert [
+        call.kwargs["symbols"]
+        for call in inner_fetcher.fetch_bulk_stock_quotes.await_args_list
+    ] == [["AAPL", "MSFT"], ["GOOGL"]]
+
+
+@pytest.mark.exception
+@pytest.mark.asyncio
+async def test_cached_fetcher_raises_when_refetch_fails() -> None:
+    """Test that a failed refetch raises instead of serving the expired quote."""
+    inner_fetcher = AsyncMock(spec=StockQuotesFetcher)
+    inner_fetcher.fetch_stock_quote.side_effect = [
+        {"test_key": "test_value"},
+        CircuitOpenError("open"),
+    ]
+    fetcher = CachedStockQuotesFetcher(fetcher=inner_fetcher, ttl=60)
+    await fetcher.fetch_stock_quote(endpoint="/", operation="GLOBAL", symbol="A")
+    fetcher._cache._clock = lambda: float("inf")
+
+    with pytest.raises(CircuitOpenError):
+        await fetcher.fetch_stock_quote(endpoint="/", operation="GLOBAL", symbol="A")
+
+    assert inner_fetcher.fetch_stock_quote.await_count == 2
+
+
+def _fetcher_answering(
+    content: dict[str, Any],
+) -> tuple[StockQuotesFetcher, AsyncMock, AsyncMock]:
+    """Build a fetcher whose client answers every request with the given content."""
+    rate_limiter = AsyncMock(spec=RateLimiterInterface)
+    api_client = AsyncMock(spec=AsyncAPIClient)
+    api_client.get.return_value = httpx.Response(
+        status_code=200,
+        json=content,
+        request=httpx.Request("get", AVAPIConsts.BASE_URL),
+    )
+    fetcher = StockQuotesFetcher(
+        api_client=api_client, api_key="api_key", rate_limiter=rate_limiter
+    )
+    return fetcher, api_client, rate_limiter
+
+
+@pytest.mark.exception
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "content",
+    [
+        {
+            "Note": "Thank you for using Alpha Vantage! Our standard API call "
+            "frequency is 5 calls per minute and 500 calls per day. Please visit "
+            "https://www.alphavantage.co/premium/ if you would like to target a "
+            "higher API call frequency."
+        },
+        {
+            "Information": "Thank you for using Alpha Vantage! Please consider "
+            "spreading out your free API requests more sparingly (1 request per "
+            "second). You may subscribe to any of the premium plans at "
+            "https://www.alphavantage.co/premium/ to lift the free key rate limit "
+            "(25 requests per day), raise the per-minute limit to higher levels, and "
+            "remove all daily rate limits."
+        },
+    ],
+)
+async def test_fetch_stock_quote_throttled_pauses_requests(
+    content: dict[str, Any],
+) -> None:
+    """Test that a throttle payload raises and pauses for the quota window."""
+    fetcher, _, rate_limiter = _fetcher_answering(content)
+
+    with pytest.raises(AlphaVantageThrottledError) as exc_info:
+        await fetcher.fetch_stock_quote(endpoint="/", operation="GLOBAL", symbol="A")
+
+    assert not exc_info.value.daily
+    rate_limiter.pause.assert_called_once_with(AVAPILimits.QUOTA_WINDOW_SECONDS)
+    rate_limiter.exhaust_daily_budget.assert_not_called()
+
+
+@pytest.mark.exception
+@pytest.mark.asyncio
+async def test_fetch_stock_quote_daily_quota_exhausts_budget() -> None:
+    """Test that a daily throttle payload stops requests until the next day."""
+    fetcher, _, rate_limiter = _fetcher_answering(
+        {
+            "Information": "Thank you for using Alpha Vantage! Our standard API "
+            "rate limit is 25 requests per day. Please subscribe to any of the "
+            "premium plans at https://www.alphavantage.co/premium/ to instantly "
+            "remove all daily rate limits."
+        }
+    )
+
+    with pytest.raises(AlphaVantageThrottledError) as exc_info:
+        await fetcher.fetch_stock_quote(endpoint="/", operation="GLOBAL", symbol="A")
+
+    assert exc_info.value.daily
+    rate_limiter.exhaust_daily_budget.assert_called_once_with()
+    rate_limiter.pause.assert_not_called()
+
+
+@pytest.mark.exception
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "content",
+    [
+        {"Error Message": "Invalid API call."},
+        {
+            "Information": "Thank you for using Alpha Vantage! This is a premium "
+            "endpoint. You may subscribe to any of the premium plans at "
+            "https://www.alphavantage.co/premium/ to instantly unlock all premium "
+            "endpoints"
+        },
+        {
+            "Information": "The **demo** API key is for demo purposes only. Please "
+            "claim your free API key at (https://www.alphavantage.co/support/#api-key)"
+            " to explore our full API offerings. It takes fewer than 20 seconds."
+        },
+        {
+            "Error Message": "the parameter apikey is invalid or missing. Please "
+            "claim your free API key on (https://www.alphavantage.co/support/#api-key)"
+            ". It should take less than 20 seconds."
+        },
+        {
+            "Information": "The apikey is invalid. Please claim your free API key "
+            "at (https://www.alphavantage.co/support/#api-key)."
+        },
+        {"Note": "Scheduled maintenance tonight."},
+    ],
+)
+async def test_fetch_stock_quote_error_payload(content: dict[str, Any]) -> None:
+    """Test that an error payload raises without pausing requests."""
+    fetcher, _, rate_limiter = _fetcher_answering(content)
+
+    with pytest.raises(AlphaVantageAPIError):
+        await fetcher.fetch_stock_quote(endpoint="/", operation="GLOBAL", symbol="A")
+
+    rate_limiter.pause.assert_not_called()
+    rate_limiter.exhaust_daily_budget.assert_not_called()
+
+
+@pytest.mark.exception
+@pytest.mark.asyncio
+async def test_cached_fetcher_does_not_cache_throttle_payloads() -> None:
+    """Test that a throttled response is never served from the cache."""
+    fetcher, api_client, _ = _fetcher_answering({"Note": "5 calls per minute"})
+    cached_fetcher = CachedStockQuotesFetcher(fetcher=fetcher, ttl=60)
+
+    for _ in range(2):
+        with pytest.raises(AlphaVantageThrottledError):
+            await cached_fetcher.fetch_stock_quote(
+                endpoint="/", operation="GLOBAL", symbol="A"
+            )
+
+    assert api_client.get.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_fetch_stock_quote_uses_json_decoder() -> None:
+    """Test that the raw response bytes are parsed by the given JSON decoder."""
+    json_decoder = StdlibJSONDecoder()
+    api_client = AsyncMock(spec=AsyncAPIClient)
+    api_client.get.return_value = httpx.Response(
+        status_code=200,
+        content=b'{"test_key": "test_value"}',
+        request=httpx.Request("get", AVAPIConsts.BASE_URL),
+    )
+    fetcher = StockQuotesFetcher(
+        api_client=api_client, api_key="api_key", json_decoder=json_decoder
+    )
+
+    with patch.object(json_decoder, "decode", wraps=json_decoder.decode) as decode:
+        actual_content = await fetcher.fetch_stock_quote(
+            endpoint="/", operation="GLOBAL", symbol="A"
+        )
+
+    assert actual_content == {"test_key": "test_value"}
+    decode.assert_called_once_with(b'{"test_key": "test_value"}')
+
+
+@pytest.mark.asyncio
+async def test_fetcher_metrics() -> None:
+    """Test that the fetcher times the JSON parsing and counts throttled responses."""
+    api_client = AsyncMock(spec=AsyncAPIClient)
+    api_client.get.side_effect = [
+        httpx.Response(
+            status_code=200,
+            json=content,
+            request=httpx.Request("get", AVAPIConsts.BASE_URL),
+        )
+        for content in ({"Global Quote": {}}, {"Note": "5 calls per minute"})
+    ]
+    metrics = MetricsRegistry()
+    fetcher = StockQuotesFetcher(api_client=api_client, api_key="key", metrics=metrics)
+
+    await fetcher.fetch_stock_quote(endpoint="/query", operation="Q", symbol="IBM")
+    with pytest.raises(AlphaVantageThrottledError):
+        await fetcher.fetch_stock_quote(endpoint="/query", operation="Q", symbol="IBM")
+
+    assert metrics.histogram("quote_parse_duration_seconds").count == 2
+    throttled = metrics.counter("quote_throttled_total", labels={"quota": "minute"})
+    assert throttled.value == 1
+
+
+@pytest.mark.asyncio
+async def test_concurrency_limited_fetcher_bounds_fetches() -> None:
+    """Test that fetches beyond the limit wait for a running one to complete."""
+    running = 0
+    max_running = 0
+
+    async def fetch_stock_quote(**_: Any) -> dict[str, Any]:
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0.001)
+        running -= 1
+        return {}
+
+    inner_fetcher = AsyncMock(spec=StockQuotesFetcher)
+    inner_fetcher.fetch_stock_quote.side_effect = fetch_stock_quote
+    fetcher = ConcurrencyLimitedStockQuotesFetcher(
+        fetcher=inner_fetcher, max_concurrency=3
+    )
+
+    await asyncio.gather(
+        *(
+            fetcher.fetch_stock_quote(endpoint="/", operation="op", symbol=str(index))
+            for index in range(20)
+        )
+    )
+
+    assert inner_fetcher.fetch_stock_quote.await_count == 20
+    assert max_running == 3
+    assert fetcher.in_flight == 0
+    with pytest.raises(ValueError):
+        ConcurrencyLimitedStockQuotesFetcher(fetcher=inner_fetcher, max_concurrency=0)
@@ -1,8 +1,20 @@
 """Module implementing a test suite for the stock quote model."""
 
+from dataclasses import replace
+from datetime import date
+
 import pytest
 
-from src.model import Model, StockQuote
+from src import model as model_module
+from src.enums import FetchStatus, QuoteChange
+from src.model import (
+    COLUMN_TYPECODES,
+    ChangeSet,
+    FetchResult,
+    Model,
+    QuoteStore,
+    StockQuote,
+)
 
 
 @pytest.fixture(scope="module")
@@ -10,18 +22,28 @@ def stock_quote() -> StockQuote:
     """Fixture function for creating a StockQuote instance."""
     return StockQuote(
         symbol="GOOGL",
-        open="2710.00",
-        high="2732.45",
-        low="2704.10",
-        price="2729.80",
-        volume="1185947",
-        latest_trading_day="2024-03-14",
-        previous_close="2717.50",
-        change="+12.30",
-        change_percent="+0.45%",
+        open=2710.00,
+        high=2732.45,
+        low=2704.10,
+        price=2729.80,
+        volume=1185947,
+        latest_trading_day=date(2024, 3, 14),
+        previous_close=2717.50,
+        change=12.30,
+        change_percent=0.45,
     )
 
 
+@pytest.fixture(params=["python", "numpy"])
+def backend(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> str:
+    """Fixture function running a test with and without NumPy."""
+    if request.param == "numpy":
+        monkeypatch.setattr(model_module, "_np", pytest.importorskip("numpy"))
+    else:
+        monkeypatch.setattr(model_module, "_np", None)
+    return str(request.param)
+
+
 @pytest.fixture(scope="module")
 def model() -> Model:
     """Fixture function for creating a Model instance."""
@@ -37,7 +59,7 @@ def test_stock_quote_immutability(stock_quote: StockQuote) -> None:
 @pytest.mark.smoke
 def test_add_stock_quote(model: Model, stock_quote: StockQuote) -> None:
     """Verify the functionality of adding a stock quote to the model."""
-    model.add_stock_quote(stock_quote=stock_quote)
+    model.upsert_stock_quote(stock_quote=stock_quote)
     assert len(model.stock_quotes) == 1
     assert model.stock_quotes[0] == stock_quote
 
@@ -45,6 +67,299 @@ def test_add_stock_quote(model: Model, stock_quote: StockQuote) -> None:
 @pytest.mark.smoke
 def test_remove_stock_quotes(model: Model) -> None:
     """Verify the functionality of removing all stock quotes."""
-    model.remove_all_stock_quotes()
+    model.retain_symbols(symbols=[])
     assert len(model.stock_quotes) == 0
     assert model.stock_quotes == []
+
+
+@pytest.mark.parametrize(
+    "status, ok, retryable",
+    [
+        (FetchStatus.SUCCESS, True, False),
+        (FetchStatus.HTTP_ERROR, False, True),
+        (FetchStatus.THROTTLED, False, True),
+        (FetchStatus.PARSE_ERROR, False, False),
+        (FetchStatus.INTERNAL_ERROR, False, False),
+    ],
+)
+def test_fetch_result_status(status: FetchStatus, ok: bool, retryable: bool) -> None:
+    """Verify which fetch statuses are successful and which are worth retrying."""
+    result = FetchResult(symbol="AAPL", status=status)
+
+    assert result.ok is ok
+    assert result.retryable is retryable
+
+
+def _quote(symbol: str, price: float, volume: int = 1000) -> StockQuote:
+    """Build a stock quote with the given symbol, price and volume."""
+    return StockQuote(
+        symbol=symbol,
+        open=price,
+        high=price,
+        low=price,
+        price=price,
+        volume=volume,
+        latest_trading_day=date(2024, 3, 15),
+        previous_close=price,
+        change=0.0,
+        change_percent=0.0,
+    )
+
+
+def test_upsert_stock_quote_replaces_same_symbol() -> None:
+    """Verify that upserting a quote of a known symbol replaces it in place."""
+    model = Model()
+    model.upsert_stock_quote(stock_quote=_quote("AAPL", 1.0))
+    model.upsert_stock_quote(stock_quote=_quote("MSFT", 2.0))
+    model.upsert_stock_quote(stock_quote=_quote("AAPL", 3.0))
+
+    assert [quote.symbol for quote in model.stock_quotes] == ["AAPL", "MSFT"]
+    assert model.get_stock_quote("AAPL") == _quote("AAPL", 3.0)
+    assert model.get_stock_quote("IBM") is None
+
+
+@pytest.mark.smoke
+def test_quote_store_round_trip(stock_quote: StockQuote) -> None:
+    """Verify that a stored quote is rebuilt with the same values."""
+    store = QuoteStore()
+
+    assert store.upsert(stock_quote) is QuoteChange.ADDED
+    assert store.upsert(replace(stock_quote, price=1.5)) is QuoteChange.UPDATED
+    assert store.upsert(replace(stock_quote, price=1.5)) is QuoteChange.UNCHANGED
+
+    assert len(store) == 1
+    assert "GOOGL" in store
+    assert store.get("GOOGL") == replace(stock_quote, price=1.5)
+
+
+def test_quote_store_remove_moves_last_row() -> None:
+    """Verify that removing a symbol keeps the rows dense and the index valid."""
+    store = QuoteStore()
+    for index, symbol in enumerate(["A", "B", "C"]):
+        store.upsert(_quote(symbol, float(index)))
+
+    assert store.remove("A")
+    assert not store.remove("A")
+
+    assert store.symbols == ["C", "B"]
+    assert list(store.column("price")) == [2.0, 1.0]
+    assert store.get("C") == _quote("C", 2.0)
+    assert store.remove("B")
+    assert store.remove("C")
+    assert len(store) == 0
+
+
+def test_quote_store_sort_and_filter(backend: str) -> None:
+    """Verify sorting and filtering symbols on a numeric column."""
+    store = QuoteStore()
+    assert store.sorted_symbols(by="price") == []
+    assert store.filter_symbols(by="price", min_value=0) == []
+    for symbol, price in [("A", 3.0), ("B", 1.0), ("C", 2.0), ("D", 4.0), ("E", 1.0)]:
+        store.upsert(_quote(symbol, price))
+
+    assert store.sorted_symbols(by="price") == ["B", "E", "C", "A", "D"]
+    assert store.sorted_symbols(by="price", descending=True) == [
+        "D",
+        "A",
+        "C",
+        "B",
+        "E",
+    ]
+    assert store.sorted_symbols(by="price", descending=True, limit=2) == ["D", "A"]
+    assert store.sorted_symbols(by="price", limit=1) == ["B"]
+    assert store.filter_symbols(by="price", min_value=2.0) == ["A", "C", "D"]
+    assert store.filter_symbols(by="price", min_value=2, max_value=3) == ["A", "C"]
+
+
+def test_quote_store_column_snapshot_does_not_lock_store() -> None:
+    """Verify that a held column snapshot neither blocks nor follows later writes."""
+    store = QuoteStore()
+    for index, symbol in enumerate(["A", "B"]):
+        store.upsert(_quote(symbol, float(index)))
+    prices = store.column("price")
+
+    store.upsert(_quote("C", 2.0))
+    store.upsert(_quote("A", 5.0))
+    assert store.remove("B")
+
+    assert list(prices) == [0.0, 1.0]
+    assert list(store.column("price")) == [5.0, 2.0]
+
+
+@pytest.mark.exception
+def test_quote_store_failed_upsert_leaves_store_unchanged() -> None:
+    """Verify that an upsert failing half-way through a row is rolled back."""
+    store = QuoteStore()
+    store.upsert(_quote("A", 1.0))
+    too_large = replace(_quote("A", 2.0), volume=2**70)
+
+    with pytest.raises(OverflowError):
+        store.upsert(too_large)
+    with pytest.raises(OverflowError):
+        store.upsert(replace(too_large, symbol="B"))
+
+    assert store.symbols == ["A"]
+    assert store.get("A") == _quote("A", 1.0)
+    assert all(len(store.column(name)) == 1 for name in COLUMN_TYPECODES)
+
+
+def test_quote_store_quotes_are_built_once() -> None:
+    """Verify that listed quotes are reused and kept in step with the rows."""
+    store = QuoteStore()
+    for index, symbol in enumerate(["A", "B", "C"]):
+        store.upsert(_quote(symbol, float(index)))
+    quotes = store.quotes()
+
+    assert store.quotes() == quotes
+    assert store.get("B") is quotes[1]
+
+    store.upsert(_quote("B", 5.0))
+    store.upsert(_quote("D", 3.0))
+    store.remove("A")
+
+    assert store.quotes() == [
+        _quote("D", 3.0),
+        _quote("B", 5.0),
+        _quote("C", 2.0),
+    ]
+    store.clear()
+    assert store.quotes() == []
+
+
+@pytest.mark.exception
+def test_quote_store_unknown_column() -> None:
+    """Verify that non-numeric or unknown columns are rejected."""
+    store = QuoteStore()
+
+    with pytest.raises(ValueError):
+        store.column("symbol")
+    with pytest.raises(ValueError):
+        store.sorted_symbols(by="unknown")
+
+
+@pytest.mark.exception
+def test_quote_store_column_is_read_only() -> None:
+    """Verify that columns can not be modified through their view."""
+    store = QuoteStore()
+    store.upsert(_quote("A", 1.0))
+
+    with pytest.raises(TypeError):
+        store.column("volume")[0] = 2
+
+
+def test_quote_store_memory_is_close_to_raw_numeric_data() -> None:
+    """Verify that a 10k symbols store is a small multiple of its numeric data."""
+    store = QuoteStore()
+    for index in range(10_000):
+        store.upsert(_quote(f"SYM{index}", float(index)))
+    store.clear()
+    for index in range(10_000):
+        store.upsert(_quote(f"SYM{index}", float(index)))
+
+    raw_numeric_bytes = 10_000 * 8 * len(COLUMN_TYPECODES)
+    assert store.nbytes < 3 * raw_numeric_bytes
+
+
+def test_pop_changes_reports_each_kind_of_change() -> None:
+    """Verify that a change set lists added, updated, unchanged and stale symbols."""
+    model = Model()
+    for symbol in ["A", "B", "C", "D"]:
+        model.upsert_stock_quote(stock_quote=_quote(symbol, 1.0))
+    assert model.pop_changes().added == tuple(
+        _quote(symbol, 1.0) for symbol in ["A", "B", "C", "D"]
+    )
+
+    model.upsert_stock_quote(stock_quote=_quote("A", 2.0))
+    model.upsert_stock_quote(stock_quote=_quote("B", 1.0))
+    assert model.mark_stale(symbol="c")
+    assert not model.mark_stale(symbol="C")
+    assert not model.mark_stale(symbol="UNKNOWN")
+    model.retain_symbols(symbols=["A", "B", "C"])
+
+    assert model.pop_changes() == ChangeSet(
+        updated=(_quote("A", 2.0),), unchanged=("B",), stale=("C",), removed=("D",)
+    )
+    assert model.pop_changes() == ChangeSet()
+    assert model.is_stale("C")
+    assert model.stale_symbols == ["C"]
+    assert model.get_stock_quote("C") == _quote("C", 1.0)
+
+
+def test_pop_changes_merges_changes_of_a_symbol() -> None:
+    """Verify that several changes of a symbol between two pops are merged."""
+    model = Model()
+    model.upsert_stock_quote(stock_quote=_quote("A", 1.0))
+    model.upsert_stock_quote(stock_quote=_quote("A", 2.0))
+    model.upsert_stock_quote(stock_quote=_quote("B", 1.0))
+    model.retain_symbols(symbols=["A"])
+
+    assert model.pop_changes() == ChangeSet(added=(_quote("A", 2.0),))
+
+    model.retain_symbols(symbols=[])
+    model.upsert_stock_quote(stock_quote=_quote("A", 3.0))
+
+    assert model.pop_changes() == ChangeSet(updated=(_quote("A", 3.0),))
+
+
+def test_upsert_stock_quote_marks_fresh() -> None:
+    """Verify that a successful upsert records the time and clears staleness."""
+    now = 100.0
+    model = Model(clock=lambda: now)
+    model.upsert_stock_quote(stock_quote=_quote("A", 1.0))
+    model.mark_stale(symbol="A")
+    model.pop_changes()
+    now = 160.0
+
+    assert model.upsert_stock_quote(_quote("A", 1.0)) is QuoteChange.UNCHANGED
+
+    assert not model.is_stale("A")
+    assert model.last_updated("A") == 160.0
+    assert model.last_updated("B") is None
+    assert model.pop_changes() == ChangeSet(unchanged=("A",))
+    assert not ChangeSet(unchanged=("A",)).changed
+
+
+def test_history_records_changed_quotes() -> None:
+    """Verify that changed quotes are recorded with the volume traded in between."""
+    now = 0.0
+    model = Model(clock=lambda: now, history_size=10)
+    for price, volume in [(10.0, 100), (12.0, 400), (12.0, 400), (11.0, 500)]:
+        now += 60
+        model.upsert_stock_quote(stock_quote=_quote("A", price, volume=volume))
+
+    history = model.history("A")
+    assert history is not None
+    assert len(history) == 3
+    assert history.window.timestamps() == [60, 120, 240]
+    assert history.window.weights() == [0, 300, 100]
+    assert history.sma == 11
+    assert history.low == 10
+    assert history.high == 12
+    assert history.vwap == (12 * 300 + 11 * 100) / 400
+    assert history.ema is not None
+
+    model.retain_symbols(symbols=[])
+    assert model.history("A") is None
+
+
+def test_history_resets_volume_on_new_trading_day() -> None:
+    """Verify that the first volume of a trading day is counted in full."""
+    model = Model(history_size=10)
+    model.upsert_stock_quote(stock_quote=_quote("A", 10.0, volume=900))
+    model.upsert_stock_quote(
+        stock_quote=replace(
+            _quote("A", 11.0, volume=50), latest_trading_day=date(2024, 3, 18)
+        )
+    )
+
+    history = model.history("A")
+    assert history is not None
+    assert history.window.weights() == [0, 50]
+
+
+def test_no_history_by_default() -> None:
+    """Verify that no history is kept unless a size is given."""
+    model = Model()
+    model.upsert_stock_quote(stock_quote=_quote("A", 10.0))
+
+    assert model.history("A") is None
@@ -1,13 +1,26 @@
 """Module implementing a test suite for the Presenter class."""
 
-from unittest.mock import MagicMock
+import asyncio
+from datetime import date
+from typing import Any
+from unittest.mock import MagicMock, patch
 
+import httpx
 import pytest
 
-from src.fetcher import StockQuotesFetcher
-from src.model import Model, StockQuote
+from src.adapters import QuoteSchemaError
+from src.enums import FetchStatus
+from src.fetcher import (
+    AlphaVantageAPIError,
+    AlphaVantageThrottledError,
+    StockQuotesFetcher,
+)
+from src.model import ChangeSet, FetchResult, Model, StockQuote
 from src.presenter import Presenter
 from src.view import View
+from tests.helpers import FakeClock
+from toolkit.api import RateLimitExceededError
+from toolkit.metrics import MetricsRegistry
 
 
 @pytest.fixture
@@ -122,26 +135,33 @@ def test_update_view(
     mock_model : MagicMock
         A MagicMock instance of Model.
     """
-    mock_model.stock_quotes = [
-        StockQuote(
-            "AAPL",
-            "150.42",
-            "152.34",
-            "149.25",
-            "151.20",
-            "1000000",
-            "2024-03-15",
-            "150.50",
-            "0.70",
-            "0.50%",
+    changes = ChangeSet(
+        added=(
+            StockQuote(
+                "AAPL",
+                150.42,
+                152.34,
+                149.25,
+                151.20,
+                1000000,
+                date(2024, 3, 15),
+                150.50,
+                0.70,
+                0.50,
+            ),
         )
-    ]
+    )
+    mock_model.pop_changes.return_value = changes
     presenter.update_view()
-    mock_view.show_stock_quotes.assert_called_with(stock_quotes=mock_model.stock_quotes)
+    mock_view.show_quote_changes.assert_called_with(changes=changes)
 
 
-def test_handle_stock_quote_addition_with_invalid_data(
-    presenter: Presenter, mock_model: MagicMock, mock_view: MagicMock
+@pytest.mark.asyncio
+async def test_handle_stock_quote_addition_with_invalid_data(
+    presenter: Presenter,
+    mock_model: MagicMock,
+    mock_view: MagicMock,
+    mock_fetcher: MagicMock,
 ) -> None:
     """Test case to handle invalid stock data.
 
@@ -153,22 +173,32 @@ def test_handle_stock_quote_addition_with_invalid_data(
         A MagicMock instance of Model.
     mock_view : MagicMock
         A MagicMock instance of View.
+    mock_fetcher : MagicMock
+        A MagicMock instance of StockQuotesFetcher.
     """
-    stock_data = [{"symbol": "AAPL", "invalid_key": "150.42"}]
+    mock_fetcher.fetch_stock_quote.return_value = {
+        "symbol": "AAPL",
+        "invalid_key": "150.42",
+    }
     presenter._prepare_stock_data = MagicMock(side_effect=ValueError("Invalid data"))  # type: ignore
-    presenter._handle_stock_quote_addition(stock_data)
+    await presenter.refresh_model(symbols_list=["AAPL"])
 
-    assert mock_model.remove_all_stock_quotes.called
-    assert mock_model.add_stock_quote.call_count == 0
+    mock_model.retain_symbols.assert_called_once_with(symbols=["AAPL"])
+    assert mock_model.upsert_stock_quote.call_count == 0
+    mock_model.mark_stale.assert_called_once_with(symbol="AAPL")
     assert mock_view.show_external_service_error.call_count == 1
     assert mock_view.show_internal_error.call_count == 0
 
 
-def test_handle_stock_quote_addition_with_exception(
-    presenter: Presenter, mock_model: MagicMock, mock_view: MagicMock
+@pytest.mark.asyncio
+async def test_handle_stock_quote_addition_with_exception(
+    presenter: Presenter,
+    mock_model: MagicMock,
+    mock_view: MagicMock,
+    mock_fetcher: MagicMock,
 ) -> None:
     """
-    Test case to ensure that handle_stock_quote_addition handles exceptions correctly.
+    Test case to ensure that unexpected errors are reported as internal errors.
 
     Parameters
     ----------
@@ -178,35 +208,21 @@ def test_handle_stock_quote_addition_with_exception(
         A MagicMock instance of Model.
     mock_view : MagicMock
         A MagicMock instance of View.
+    mock_fetcher : MagicMock
+        A MagicMock instance of StockQuotesFetcher.
     """
-    stock_data = [{"symbol": "AAPL", "price": "150.42"}]
+    mock_fetcher.fetch_stock_quote.return_value = {"symbol": "AAPL", "price": "150.42"}
     presenter._prepare_stock_data = MagicMock(side_effect=Exception("Unexpected error"))  # type: ignore
-    presenter._handle_stock_quote_addition(stock_data)
+    await presenter.refresh_model(symbols_list=["AAPL"])
 
-    assert mock_model.remove_all_stock_quotes.called
-    assert mock_model.add_stock_quote.call_count == 0
+    mock_model.retain_symbols.assert_called_once_with(symbols=["AAPL"])
+    assert mock_model.upsert_stock_quote.call_count == 0
+    mock_model.mark_stale.assert_called_once_with(symbol="AAPL")
     assert mock_view.show_external_service_error.call_count == 0
     assert mock_view.show_internal_error.call_count == 1
 
 
-@pytest.mark.parametrize(
-    "stock_data, expected_output",
-    [
-        (
-            {"Global Quote": {"01. symbol": "AAPL", "05. price": "150.42"}},
-            {"symbol": "AAPL", "price": "150.42"},
-        ),
-        (
-            {"Global Quote": {"01. symbol": "GOOGL", "05. price": "2809.02"}},
-            {"symbol": "GOOGL", "price": "2809.02"},
-        ),
-    ],
-)
-def test_prepare_stock_data(
-    presenter: Presenter,
-    stock_data: dict[str, dict[str, str]],
-    expected_output: dict[str, str],
-) -> None:
+def test_prepare_stock_data(presenter: Presenter) -> None:
     """
     Test case to ensure that prepare_stock_data method prepares stock data correctly.
 
@@ -214,28 +230,45 @@ def test_prepare_stock_data(
     ----------
     presenter : Presenter
         An instance of Presenter.
-    stock_data : dict[str, dict[str, str]]
-        Input stock data.
-    expected_output : dict[str, str]
-        Expected prepared data.
     """
-    prepared_data = presenter._prepare_stock_data(stock_data)
-    assert prepared_data == expected_output
+    prepared_data = presenter._prepare_stock_data(_global_quote("AAPL"))
+    assert prepared_data == {
+        "symbol": "AAPL",
+        "open": 149.75,
+        "high": 152.34,
+        "low": 149.25,
+        "price": 150.42,
+        "volume": 1000000,
+        "latest_trading_day": date(2024, 3, 15),
+        "previous_close": 150.50,
+        "change": 0.70,
+        "change_percent": 0.50,
+    }
 
 
-def test_prepare_invalid_stock_data(presenter: Presenter, mock_view: MagicMock) -> None:
+@pytest.mark.exception
+@pytest.mark.parametrize(
+    "stock_data",
+    [
+        {"Invalid": {"01. symbol": "AAPL"}},
+        {"Global Quote": {"01. symbol": "AAPL", "05. price": "150.42"}},
+    ],
+)
+def test_prepare_invalid_stock_data(
+    presenter: Presenter, stock_data: dict[str, dict[str, str]]
+) -> None:
     """
-    Test case to ensure that prepare_stock_data handles invalid stock data correctly.
+    Test case to ensure that prepare_stock_data reports invalid stock data.
 
     Parameters
     ----------
     presenter : Presenter
         An instance of Presenter.
-    mock_view : MagicMock
-        A MagicMock instance of View.
+    stock_data : dict[str, dict[str, str]]
+        Input stock data of an unknown schema or lacking fields.
     """
-    presenter._prepare_stock_data({"Invalid": {"01. symbol": "AAPL"}})
-    mock_view.show_external_service_error.assert_called_once()
+    with pytest.raises(QuoteSchemaError):
+        presenter._prepare_stock_data(stock_data)
 
 
 @pytest.mark.parametrize(
@@ -263,3 +296,444 @@ def test_split_symbols(
     """
     symbols_list = presenter._split_symbols(symbols_string)
     assert symbols_list == expected_symbols_list
+
+
+def _global_quote(symbol: str) -> dict[str, dict[str, str]]:
+    """Build a valid GLOBAL_QUOTE payload for the given symbol."""
+    return {
+        "Global Quote": {
+            "01. symbol": symbol,
+            "02. open": "149.75",
+            "03. high": "152.34",
+            "04. low": "149.25",
+            "05. price": "150.42",
+            "06. volume": "1000000",
+            "07. latest trading day": "2024-03-15",
+            "08. previous close": "150.50",
+            "09. change": "0.70",
+            "10. change percent": "0.50%",
+        },
+    }
+
+
+async def _collect(
+    presenter: Presenter, symbols_list: list[str]
+) -> dict[str, FetchResult]:
+    """Collect every result streamed by the presenter for the given symbols."""
+    return {
+        result.symbol: result
+        async for result in presenter.stream_stock_quotes(symbols_list=symbols_list)
+    }
+
+
+@pytest.mark.asyncio
+async def test_stream_stock_quotes_bounded_concurrency(
+    mock_view: MagicMock, mock_model: MagicMock, mock_fetcher: MagicMock
+) -> None:
+    """
+    Test that no more than `max_concurrency` quotes are fetched at the same time.
+
+    Parameters
+    ----------
+    mock_view : MagicMock
+        A MagicMock instance of View.
+    mock_model : MagicMock
+        A MagicMock instance of Model.
+    mock_fetcher : MagicMock
+        A MagicMock instance of StockQuotesFetcher.
+    """
+    in_flight = 0
+    max_in_flight = 0
+
+    async def fetch_stock_quote(**kwargs: Any) -> dict[str, dict[str, str]]:
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0)
+        in_flight -= 1
+        return _global_quote(kwargs["symbol"])
+
+    mock_fetcher.fetch_stock_quote.side_effect = fetch_stock_quote
+    presenter = Presenter(
+        view=mock_view, model=mock_model, fetcher=mock_fetcher, max_concurrency=3
+    )
+    symbols = [f"SYM{index}" for index in range(20)]
+
+    results = await _collect(presenter, symbols_list=symbols)
+
+    assert max_in_flight == 3
+    assert mock_fetcher.fetch_stock_quote.await_count == len(symbols)
+    assert sorted(results) == sorted(symbols)
+    for symbol, result in results.items():
+        assert result.ok
+        assert result.stock_quote is not None
+        assert result.stock_quote.symbol == symbol
+
+
+@pytest.mark.asyncio
+async def test_stream_stock_quotes_yields_in_completion_order(
+    mock_view: MagicMock, mock_model: MagicMock, mock_fetcher: MagicMock
+) -> None:
+    """
+    Test that fast symbols are yielded while a slow one is still pending.
+
+    Parameters
+    ----------
+    mock_view : MagicMock
+        A MagicMock instance of View.
+    mock_model : MagicMock
+        A MagicMock instance of Model.
+    mock_fetcher : MagicMock
+        A MagicMock instance of StockQuotesFetcher.
+    """
+    release_slow = asyncio.Event()
+
+    async def fetch_stock_quote(**kwargs: Any) -> dict[str, dict[str, str]]:
+        if kwargs["symbol"] == "SLOW":
+            await release_slow.wait()
+        return _global_quote(kwargs["symbol"])
+
+    mock_fetcher.fetch_stock_quote.side_effect = fetch_stock_quote
+    presenter = Presenter(
+        view=mock_view, model=mock_model, fetcher=mock_fetcher, max_concurrency=2
+    )
+
+    yielded = []
+    async for result in presenter.stream_stock_quotes(
+        symbols_list=["SLOW", "A", "B", "C", "D"]
+    ):
+        yielded.append(result.symbol)
+        if len(yielded) == 4:
+            release_slow.set()
+
+    assert yielded == ["A", "B", "C", "D", "SLOW"]
+
+
+@pytest.mark.asyncio
+async def test_stream_stock_quotes_yields_fetch_errors(
+    presenter: Presenter, mock_fetcher: MagicMock
+) -> None:
+    """
+    Test that a failing symbol is yielded as an error without stopping the others.
+
+    Parameters
+    ----------
+    presenter : Presenter
+        An instance of Presenter.
+    mock_fetcher : MagicMock
+        A MagicMock instance of StockQuotesFetcher.
+    """
+    error = httpx.ConnectTimeout("timeout")
+
+    async def fetch_stock_quote(**kwargs: Any) -> dict[str, dict[str, str]]:
+        if kwargs["symbol"] == "FAIL":
+            raise error
+        return _global_quote(kwargs["symbol"])
+
+    mock_fetcher.fetch_stock_quote.side_effect = fetch_stock_quote
+
+    results = await _collect(presenter, symbols_list=["FAIL", "AAPL"])
+
+    assert results["FAIL"] == FetchResult(
+        symbol="FAIL", status=FetchStatus.HTTP_ERROR, error=error
+    )
+    assert results["FAIL"].retryable
+    assert results["AAPL"].ok
+
+
+@pytest.mark.asyncio
+async def test_stream_stock_quotes_empty(presenter: Presenter) -> None:
+    """
+    Test that streaming an empty list of symbols yields nothing.
+
+    Parameters
+    ----------
+    presenter : Presenter
+        An instance of Presenter.
+    """
+    assert await _collect(presenter, symbols_list=[]) == {}
+
+
+@pytest.mark.exception
+def test_invalid_max_concurrency(
+    mock_view: MagicMock, mock_model: MagicMock, mock_fetcher: MagicMock
+) -> None:
+    """
+    Test that a non-positive `max_concurrency` is rejected.
+
+    Parameters
+    ----------
+    mock_view : MagicMock
+        A MagicMock instance of View.
+    mock_model : MagicMock
+        A MagicMock instance of Model.
+    mock_fetcher : MagicMock
+        A MagicMock instance of StockQuotesFetcher.
+    """
+    with pytest.raises(ValueError):
+        Presenter(
+            view=mock_view, model=mock_model, fetcher=mock_fetcher, max_concurrency=0
+        )
+
+
+@pytest.mark.asyncio
+async def test_stream_stock_quotes_bulk_mode(
+    mock_view: MagicMock, mock_model: MagicMock, mock_fetcher: MagicMock
+) -> None:
+    """
+    Test that bulk mode fetches every symbol through a single bulk call.
+
+    Symbols failing in the bulk call, or missing from its result, are reported as
+    retryable fetch failures.
+
+    Parameters
+    ----------
+    mock_view : MagicMock
+        A MagicMock instance of View.
+    mock_model : MagicMock
+        A MagicMock instance of Model.
+    mock_fetcher : MagicMock
+        A MagicMock instance of StockQuotesFetcher.
+    """
+    mock_fetcher.fetch_bulk_stock_quotes.return_value = {
+        "AAPL": _global_quote("AAPL"),
+        "IBM": httpx.ConnectError("refused"),
+    }
+    presenter = Presenter(
+        view=mock_view, model=mock_model, fetcher=mock_fetcher, use_bulk_quotes=True
+    )
+
+    results = await _collect(presenter, symbols_list=["AAPL", "IBM", "MSFT"])
+
+    assert results["AAPL"].ok
+    assert results["IBM"].status is FetchStatus.HTTP_ERROR
+    assert results["MSFT"].status is FetchStatus.HTTP_ERROR
+    assert results["MSFT"].retryable
+    mock_fetcher.fetch_bulk_stock_quotes.assert_awaited_once()
+    mock_fetcher.fetch_stock_quote.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_refresh_model_progressive(
+    mock_view: MagicMock, mock_fetcher: MagicMock
+) -> None:
+    """
+    Test that progressive mode updates the view after every added stock quote.
+
+    Parameters
+    ----------
+    mock_view : MagicMock
+        A MagicMock instance of View.
+    mock_fetcher : MagicMock
+        A MagicMock instance of StockQuotesFetcher.
+    """
+
+    async def fetch_stock_quote(**kwargs: Any) -> dict[str, dict[str, str]]:
+        return _global_quote(kwargs["symbol"])
+
+    mock_fetcher.fetch_stock_quote.side_effect = fetch_stock_quote
+    model = Model()
+    shown_symbols: list[str] = []
+    mock_view.show_quote_changes.side_effect = lambda changes: shown_symbols.extend(
+        quote.symbol for quote in changes.added
+    )
+    presenter = Presenter(
+        view=mock_view, model=model, fetcher=mock_fetcher, progressive=True
+    )
+
+    await presenter.refresh_model(symbols_list=["AAPL", "MSFT", "IBM"])
+
+    assert mock_view.show_quote_changes.call_count == 3
+    assert sorted(shown_symbols) == ["AAPL", "IBM", "MSFT"]
+
+
+@pytest.mark.asyncio
+async def test_refresh_model_does_not_prompt(
+    presenter: Presenter,
+    mock_view: MagicMock,
+    mock_model: MagicMock,
+    mock_fetcher: MagicMock,
+) -> None:
+    """
+    Test that refreshing given symbols updates the model without reading input.
+
+    Parameters
+    ----------
+    presenter : Presenter
+        An instance of Presenter.
+    mock_view : MagicMock
+        A MagicMock instance of View.
+    mock_model : MagicMock
+        A MagicMock instance of Model.
+    mock_fetcher : MagicMock
+        A MagicMock instance of StockQuotesFetcher.
+    """
+    mock_fetcher.fetch_stock_quote.return_value = {
+        "Global Quote": {"01. symbol": "AAPL"}
+    }
+
+    await presenter.refresh_model(symbols_list=["AAPL", "MSFT"])
+
+    mock_view.get_symbols.assert_not_called()
+    assert mock_fetcher.fetch_stock_quote.await_count == 2
+    mock_model.retain_symbols.assert_called_once_with(symbols=["AAPL", "MSFT"])
+
+
+@pytest.mark.parametrize(
+    "error, expected_status",
+    [
+        (
+            httpx.HTTPStatusError("503", request=MagicMock(), response=MagicMock()),
+            FetchStatus.HTTP_ERROR,
+        ),
+        (httpx.ReadTimeout("timeout"), FetchStatus.HTTP_ERROR),
+        (RateLimitExceededError("exhausted"), FetchStatus.THROTTLED),
+        (AlphaVantageThrottledError("Thank you..."), FetchStatus.THROTTLED),
+        (AlphaVantageAPIError("Invalid API call."), FetchStatus.PARSE_ERROR),
+        (ValueError("invalid"), FetchStatus.PARSE_ERROR),
+        (RuntimeError("unexpected"), FetchStatus.INTERNAL_ERROR),
+    ],
+)
+def test_build_fetch_result_classifies_errors(
+    presenter: Presenter, error: Exception, expected_status: FetchStatus
+) -> None:
+    """
+    Test that fetch errors are classified into the matching status.
+
+    Parameters
+    ----------
+    presenter : Presenter
+        An instance of Presenter.
+    error : Exception
+        The error raised while fetching.
+    expected_status : FetchStatus
+        The expected status of the result.
+    """
+    result = presenter._build_fetch_result("AAPL", error)
+
+    assert result.status is expected_status
+    assert result.error is error
+    assert result.stock_quote is None
+
+
+@pytest.mark.asyncio
+async def test_partial_results_kept_and_failed_symbols_retried(
+    mock_view: MagicMock, mock_fetcher: MagicMock
+) -> None:
+    """
+    Test that successes are kept and only retryable failures are fetched again.
+
+    Parameters
+    ----------
+    mock_view : MagicMock
+        A MagicMock instance of View.
+    mock_fetcher : MagicMock
+        A MagicMock instance of StockQuotesFetcher.
+    """
+    attempts: dict[str, int] = {}
+
+    async def fetch_stock_quote(**kwargs: Any) -> dict[str, Any]:
+        symbol = kwargs["symbol"]
+        attempts[symbol] = attempts.get(symbol, 0) + 1
+        if symbol == "FLAKY" and attempts[symbol] == 1:
+            raise httpx.ConnectError("connection refused")
+        if symbol == "BROKEN":
+            return {"unexpected": "payload"}
+        return _global_quote(symbol)
+
+    mock_fetcher.fetch_stock_quote.side_effect = fetch_stock_quote
+    model = Model()
+    presenter = Presenter(view=mock_view, model=model, fetcher=mock_fetcher)
+
+    await presenter.refresh_model(symbols_list=["AAPL", "FLAKY", "BROKEN"])
+    assert [quote.symbol for quote in model.stock_quotes] == ["AAPL"]
+    assert presenter.failed_symbols == ["FLAKY"]
+
+    await presenter.retry_failed_symbols()
+    assert [quote.symbol for quote in model.stock_quotes] == ["AAPL", "FLAKY"]
+    assert presenter.failed_symbols == []
+    assert attempts == {"AAPL": 1, "FLAKY": 2, "BROKEN": 1}
+
+
+@pytest.mark.asyncio
+async def test_retry_failed_symbols_waits_for_delay(
+    mock_view: MagicMock, mock_fetcher: MagicMock, clock: FakeClock
+) -> None:
+    """
+    Test that failed symbols are retried only once the delay has passed.
+
+    Parameters
+    ----------
+    mock_view : MagicMock
+        A MagicMock instance of View.
+    mock_fetcher : MagicMock
+        A MagicMock instance of StockQuotesFetcher.
+    clock : FakeClock
+        The clock advanced by the patched `asyncio.sleep`.
+    """
+    mock_fetcher.fetch_stock_quote.side_effect = [
+        AlphaVantageThrottledError("Thank you..."),
+        _global_quote("AAPL"),
+    ]
+    model = Model()
+    presenter = Presenter(view=mock_view, model=model, fetcher=mock_fetcher)
+
+    with patch("asyncio.sleep", clock.sleep):
+        await presenter.refresh_model(symbols_list=["AAPL"])
+        await presenter.retry_failed_symbols(delay=30.0)
+        await presenter.retry_failed_symbols(delay=30.0)
+
+    assert clock.sleeps == [30.0]
+    assert model.get_stock_quote("AAPL") is not None
+    assert presenter.failed_symbols == []
+
+
+@pytest.mark.asyncio
+async def test_failed_refresh_keeps_stale_quote(
+    mock_view: MagicMock, mock_fetcher: MagicMock
+) -> None:
+    """
+    Test that a symbol failing on refresh keeps its last quote, flagged as stale.
+
+    Parameters
+    ----------
+    mock_view : MagicMock
+        A MagicMock instance of View.
+    mock_fetcher : MagicMock
+        A MagicMock instance of StockQuotesFetcher.
+    """
+    mock_fetcher.fetch_stock_quote.return_value = _global_quote("AAPL")
+    model = Model()
+    presenter = Presenter(view=mock_view, model=model, fetcher=mock_fetcher)
+    await presenter.refresh_model(symbols_list=["AAPL"])
+    presenter.update_view()
+
+    mock_fetcher.fetch_stock_quote.side_effect = httpx.ConnectError("refused")
+    await presenter.refresh_model(symbols_list=["AAPL"])
+    presenter.update_view()
+
+    assert [quote.symbol for quote in model.stock_quotes] == ["AAPL"]
+    assert model.is_stale("AAPL")
+    mock_view.show_quote_changes.assert_called_with(changes=ChangeSet(stale=("AAPL",)))
+
+
+@pytest.mark.asyncio
+async def test_refresh_model_metrics(
+    mock_view: MagicMock, mock_fetcher: MagicMock
+) -> None:
+    """Test that a refresh records its wall time and the outcome of every fetch."""
+    mock_fetcher.fetch_stock_quote.side_effect = [_global_quote("AAPL"), ValueError()]
+    metrics = MetricsRegistry()
+    presenter = Presenter(
+        view=mock_view, model=Model(), fetcher=mock_fetcher, metrics=metrics
+    )
+
+    await presenter.refresh_model(symbols_list=["AAPL", "MSFT"])
+
+    def results(status: FetchStatus) -> float:
+        labels = {"status": status}
+        return metrics.counter("presenter_fetch_results_total", labels=labels).value
+
+    assert metrics.histogram("presenter_fanout_duration_seconds").count == 1
+    assert results(FetchStatus.SUCCESS) == 1
+    assert results(FetchStatus.PARSE_ERROR) == 1
@@ -0,0 +1,147 @@
+"""Module implementing a test suite for the QuoteService class."""
+
+import asyncio
+import json
+from collections.abc import AsyncIterator
+from unittest.mock import AsyncMock
+
+import pytest
+import pytest_asyncio
+
+from benchmarks.fake_alpha_vantage import FakeAlphaVantage, constant_latency
+from src.fetcher import (
+    CachedStockQuotesFetcher,
+    CoalescingStockQuotesFetcher,
+    ConcurrencyLimitedStockQuotesFetcher,
+    StockQuotesFetcher,
+)
+from src.quote_service import QuoteService
+from toolkit.api import AsyncAPIClient
+from toolkit.metrics import MetricsRegistry
+from toolkit.server import HTTPRequest, HTTPServer
+
+
+@pytest.fixture
+def fake() -> FakeAlphaVantage:
+    """Fixture providing a fake AlphaVantage API answering after 20ms."""
+    return FakeAlphaVantage(latency=constant_latency(0.02))
+
+
+@pytest_asyncio.fixture
+async def service(fake: FakeAlphaVantage) -> AsyncIterator[QuoteService]:
+    """Fixture providing a service over the cached and coalesced fetch pipeline."""
+    async with AsyncAPIClient(
+        base_url="https://fake.test", transport=fake.transport()
+    ) as api_client:
+        fetcher = CoalescingStockQuotesFetcher(
+            fetcher=CachedStockQuotesFetcher(
+                fetcher=ConcurrencyLimitedStockQuotesFetcher(
+                    fetcher=StockQuotesFetcher(api_client=api_client, api_key="demo"),
+                    max_concurrency=2,
+                )
+            )
+        )
+        yield QuoteService(fetcher=fetcher, max_symbols=3, metrics=MetricsRegistry())
+
+
+@pytest.mark.smoke
+@pytest.mark.asyncio
+async def test_quotes(service: QuoteService) -> None:
+    """Test that the normalized symbols are answered with their quotes as JSON."""
+    response = await service.handle(
+        HTTPRequest(method="GET", path="/quotes", query={"symbols": "aapl, MSFT,AAPL"})
+    )
+
+    content = json.loads(response.body)
+    assert response.status == 200
+    assert response.content_type == "application/json"
+    assert list(content["quotes"]) == ["AAPL", "MSFT"]
+    assert content["quotes"]["AAPL"]["symbol"] == "AAPL"
+    assert isinstance(content["quotes"]["AAPL"]["price"], float)
+    assert isinstance(content["quotes"]["AAPL"]["latest_trading_day"], str)
+    assert content["errors"] == {}
+
+
+async def _get(port: int, target: str) -> bytes:
+    """Send a GET request over a new connection and return the status line."""
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write(f"GET {target} HTTP/1.1\r\nConnection: close\r\n\r\n".encode())
+    await writer.drain()
+    status_line = await reader.readline()
+    writer.close()
+    return status_line.strip()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_clients_share_upstream_fetches(
+    service: QuoteService, fake: FakeAlphaVantage
+) -> None:
+    """Test that many concurrent clients cost one upstream fetch per symbol."""
+    async with HTTPServer(handler=service.handle, backlog=1024) as server:
+        status_lines = await asyncio.gather(
+            *(_get(server.port, "/quotes?symbols=AAPL,MSFT,IBM") for _ in range(1000))
+        )
+
+    assert set(status_lines) == {b"HTTP/1.1 200 OK"}
+    assert server.connections_opened == 1000
+    assert fake.responses["quote"] == 3
+
+
+@pytest.mark.exception
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("path", "method", "symbols", "status"),
+    [
+        ("/quotes", "GET", "", 400),
+        ("/quotes", "GET", "A,B,C,D", 400),
+        ("/quotes", "GET", "AAPL,../etc", 400),
+        ("/quotes", "POST", "AAPL", 405),
+        ("/", "GET", "AAPL", 404),
+    ],
+)
+async def test_invalid_requests(
+    service: QuoteService, path: str, method: str, symbols: str, status: int
+) -> None:
+    """Test that invalid requests are rejected without fetching anything."""
+    response = await service.handle(
+        HTTPRequest(method=method, path=path, query={"symbols": symbols})
+    )
+
+    assert response.status == status
+    assert "error" in json.loads(response.body)
+
+
+@pytest.mark.exception
+@pytest.mark.asyncio
+async def test_all_symbols_failed() -> None:
+    """Test that a request whose every symbol failed is answered with a 502."""
+    fake = FakeAlphaVantage(error_rate=1.0)
+    metrics = MetricsRegistry()
+    async with AsyncAPIClient(
+        base_url="https://fake.test", transport=fake.transport()
+    ) as api_client:
+        service = QuoteService(
+            fetcher=StockQuotesFetcher(api_client=api_client, api_key="demo"),
+            metrics=metrics,
+        )
+        response = await service.handle(
+            HTTPRequest(method="GET", path="/quotes", query={"symbols": "AAPL"})
+        )
+
+    assert response.status == 502
+    assert json.loads(response.body) == {"quotes": {}, "errors": {"AAPL": "http_error"}}
+    counter = metrics.counter("quote_service_requests_total", labels={"status": "502"})
+    assert counter.value == 1
+    assert metrics.histogram("quote_service_request_duration_seconds").count == 1
+
+
+@pytest.mark.exception
+@pytest.mark.parametrize(("max_symbols", "max_concurrency"), [(0, 10), (100, 0)])
+def test_invalid_limits(max_symbols: int, max_concurrency: int) -> None:
+    """Test that the symbol and concurrency limits must be positive."""
+    with pytest.raises(ValueError):
+        QuoteService(
+            fetcher=AsyncMock(spec=StockQuotesFetcher),
+            max_symbols=max_symbols,
+            max_concurrency=max_concurrency,
+        )
@@ -1,13 +1,16 @@
 """Module implementing a test suite for the View class."""
 
+from dataclasses import replace
+from datetime import date
 from unittest.mock import patch
 
 import pytest
 import rich
 
 from src.enums import ViewMessages
-from src.model import StockQuote
-from src.view import View
+from src.model import ChangeSet, StockQuote
+from src.view import STALE_ROW_STYLE, HeadlessView, LiveView, View
+from toolkit.metrics import MetricsRegistry
 
 
 @pytest.fixture(scope="module")
@@ -63,27 +66,27 @@ def test_welcome(view: View) -> None:
         [
             StockQuote(
                 "AAPL",
-                "123.45",
-                "130.20",
-                "120.30",
-                "125.67",
-                "1000000",
-                "2024-03-15",
-                "120.50",
-                "5.17",
-                "+4.32%",
+                123.45,
+                130.20,
+                120.30,
+                125.67,
+                1000000,
+                date(2024, 3, 15),
+                120.50,
+                5.17,
+                4.32,
             ),
             StockQuote(
                 "GOOGL",
-                "2000.00",
-                "2050.00",
-                "1990.00",
-                "2025.50",
-                "500000",
-                "2024-03-15",
-                "1998.75",
-                "26.75",
-                "+1.34%",
+                2000.00,
+                2050.00,
+                1990.00,
+                2025.50,
+                500000,
+                date(2024, 3, 15),
+                1998.75,
+                26.75,
+                1.34,
             ),
         ],
     ),
@@ -179,3 +182,249 @@ def test_get_symbols(view: View) -> None:
         view.get_symbols()
 
         mock_input.assert_called_once_with(ViewMessages.SYMBOL_RETRIEVAL)
+
+
+@pytest.fixture
+def live_view() -> LiveView:
+    """
+    Fixture for initializing a LiveView instance without starting it.
+
+    Returns
+    -------
+    LiveView
+        An instance of the LiveView class.
+    """
+    return LiveView()
+
+
+@pytest.fixture(scope="module")
+def quote() -> StockQuote:
+    """
+    Fixture for creating a StockQuote instance.
+
+    Returns
+    -------
+    StockQuote
+        A StockQuote instance.
+    """
+    return StockQuote(
+        "AAPL",
+        123.45,
+        130.20,
+        120.30,
+        125.67,
+        1000000,
+        date(2024, 3, 15),
+        120.50,
+        5.17,
+        4.32,
+    )
+
+
+def test_live_view_formats_only_changed_rows(
+    live_view: LiveView, quote: StockQuote
+) -> None:
+    """
+    Test that only new or changed quotes are formatted and unchanged ones are skipped.
+
+    Parameters
+    ----------
+    live_view : LiveView
+        An instance of the LiveView class.
+    quote : StockQuote
+        A StockQuote instance.
+    """
+    other_quote = replace(quote, symbol="GOOGL")
+    with patch.object(
+        live_view, "_format_row", wraps=live_view._format_row
+    ) as mock_format_row:
+        live_view.show_stock_quotes([quote, other_quote])
+        assert mock_format_row.call_count == 2
+        table = live_view._get_renderable()
+
+        live_view.show_stock_quotes([quote, other_quote])
+        assert mock_format_row.call_count == 2
+        assert live_view._get_renderable() is table
+
+        live_view.show_stock_quotes([replace(quote, price=126.0), other_quote])
+        assert mock_format_row.call_count == 3
+
+        table = live_view._get_renderable()
+        assert isinstance(table, rich.table.Table)
+        assert table.row_count == 2
+        assert table.columns[4]._cells == ["$126.00", "$125.67"]
+
+
+def test_live_view_coalesces_updates(live_view: LiveView, quote: StockQuote) -> None:
+    """
+    Test that updates between two refreshes of the live display build one table.
+
+    Parameters
+    ----------
+    live_view : LiveView
+        An instance of the LiveView class.
+    quote : StockQuote
+        A StockQuote instance.
+    """
+    with patch.object(
+        live_view, "_build_table", wraps=live_view._build_table
+    ) as mock_build_table:
+        for price in (126.0, 127.0, 128.0):
+            live_view.show_quote_changes(
+                ChangeSet(added=(replace(quote, price=price),))
+            )
+        assert mock_build_table.call_count == 0
+
+        table = live_view._get_renderable()
+        assert live_view._live.get_renderable() is table
+        assert mock_build_table.call_count == 1
+        assert table.columns[4]._cells == ["$128.00"]
+
+
+def test_live_view_removes_missing_rows(live_view: LiveView, quote: StockQuote) -> None:
+    """
+    Test that quotes no longer shown are removed from the table.
+
+    Parameters
+    ----------
+    live_view : LiveView
+        An instance of the LiveView class.
+    quote : StockQuote
+        A StockQuote instance.
+    """
+    live_view.show_stock_quotes([quote, replace(quote, symbol="GOOGL")])
+    assert live_view._get_renderable().row_count == 2
+
+    live_view.show_stock_quotes([quote])
+    assert live_view._get_renderable().row_count == 1
+
+
+def test_live_view_error_caption(live_view: LiveView, quote: StockQuote) -> None:
+    """
+    Test that an error is shown as the caption until a refresh without errors.
+
+    Parameters
+    ----------
+    live_view : LiveView
+        An instance of the LiveView class.
+    quote : StockQuote
+        A StockQuote instance.
+    """
+    live_view.show_external_service_error()
+    live_view.show_stock_quotes([quote])
+    assert live_view._get_renderable().caption == (ViewMessages.EXTERNAL_ERROR.strip())
+
+    live_view.show_stock_quotes([quote])
+    assert live_view._get_renderable().caption is None
+
+
+def test_live_view_context_manager(live_view: LiveView) -> None:
+    """
+    Test that the live display is started and stopped by the context manager.
+
+    Parameters
+    ----------
+    live_view : LiveView
+        An instance of the LiveView class.
+    """
+    with (
+        patch.object(live_view._live, "start") as mock_start,
+        patch.object(live_view._live, "stop") as mock_stop,
+    ):
+        with live_view as entered_view:
+            assert entered_view is live_view
+            mock_start.assert_called_once()
+        mock_stop.assert_called_once()
+
+
+def test_show_quote_changes_prints_every_quote(view: View, quote: StockQuote) -> None:
+    """
+    Test that the View applies a change set and prints all its quotes, stale dimmed.
+
+    Parameters
+    ----------
+    view : View
+        An instance of the View class.
+    quote : StockQuote
+        A StockQuote instance.
+    """
+    other_quote = replace(quote, symbol="GOOGL")
+    with patch.object(view, "console") as mock_console:
+        view.show_quote_changes(ChangeSet(added=(quote, other_quote)))
+        view.show_quote_changes(ChangeSet(unchanged=("AAPL",), stale=("GOOGL",)))
+
+        table = mock_console.print.call_args_list[-2][0][0]
+        assert table.row_count == 2
+        assert [row.style for row in table.rows] == [None, STALE_ROW_STYLE]
+
+
+def test_live_view_applies_only_listed_changes(
+    live_view: LiveView, quote: StockQuote
+) -> None:
+    """
+    Test that the LiveView formats only added or updated rows and restyles stale ones.
+
+    Parameters
+    ----------
+    live_view : LiveView
+        An instance of the LiveView class.
+    quote : StockQuote
+        A StockQuote instance.
+    """
+    other_quote = replace(quote, symbol="GOOGL")
+    with patch.object(
+        live_view, "_format_row", wraps=live_view._format_row
+    ) as mock_format_row:
+        live_view.show_quote_changes(ChangeSet(added=(quote, other_quote)))
+        table = live_view._get_renderable()
+        live_view.show_quote_changes(ChangeSet(unchanged=("AAPL", "GOOGL")))
+        assert mock_format_row.call_count == 2
+        assert live_view._get_renderable() is table
+
+        live_view.show_quote_changes(ChangeSet(stale=("GOOGL",)))
+        assert mock_format_row.call_count == 2
+        table = live_view._get_renderable()
+        assert [row.style for row in table.rows] == [None, STALE_ROW_STYLE]
+
+        live_view.show_quote_changes(ChangeSet(removed=("AAPL",)))
+        assert live_view._get_renderable().row_count == 1
+
+
+def test_render_metrics(quote: StockQuote) -> None:
+    """
+    Test that both views record the time spent rendering the table.
+
+    Parameters
+    ----------
+    quote : StockQuote
+        A StockQuote instance.
+    """
+    metrics = MetricsRegistry()
+    view = View(metrics=metrics)
+    live_view = LiveView(metrics=metrics)
+    with patch.object(view, "console"):
+        view.show_stock_quotes([quote])
+    live_view.show_stock_quotes([quote])
+    live_view._get_renderable()
+
+    assert metrics.histogram("view_render_duration_seconds").count == 2
+
+
+def test_headless_view_logs(quote: StockQuote) -> None:
+    """
+    Test that the headless view logs instead of printing, and never prompts.
+
+    Parameters
+    ----------
+    quote : StockQuote
+        A StockQuote instance.
+    """
+    view = HeadlessView(symbols=["AAPL", "MSFT"])
+
+    with patch("src.view.logger") as mock_logger:
+        view.show_quote_changes(ChangeSet(added=(quote,), stale=("MSFT",)))
+        view.show_external_service_error()
+
+    assert mock_logger.debug.call_args[0][1:] == (1, 0, 0, 1)
+    mock_logger.warning.assert_called_once_with("External service error.")
+    assert view.get_symbols() == "AAPL,MSFT"
@@ -7,6 +7,10 @@ import httpx
 import pytest
 
 from toolkit.api.api_client import AsyncAPIClient
+from toolkit.api.circuit_breaker import CircuitBreaker, CircuitOpenError, CircuitState
+from toolkit.api.retry import RetryPolicy
+from toolkit.metrics import MetricsRegistry
+from toolkit.server import HTTPRequest, HTTPResponse, HTTPServer
 
 
 @pytest.fixture
@@ -195,3 +199,302 @@ def test_repr(async_client: AsyncAPIClient) -> None:
     assert (
         actual_repr == expected_repr
     ), f"expect `{expected_repr}`, but got `{actual_repr}`"
+
+
+@pytest.mark.asyncio
+async def test_connection_pool_is_reused(async_client: AsyncAPIClient) -> None:
+    """
+    Test that consecutive requests go through the same pooled httpx client.
+
+    The client must not open a new `httpx.AsyncClient` per request.
+    """
+    pooled_client = async_client._client
+    with mock.patch.object(
+        async_client._client,
+        "request",
+        new_callable=mock.AsyncMock,
+    ) as mock_request:
+        mock_request.return_value = httpx.Response(
+            status_code=200,
+            request=httpx.Request("GET", "https://example.com/endpoint"),
+        )
+        await async_client.get("/endpoint")
+        await async_client.get("/endpoint")
+
+        assert mock_request.await_count == 2
+    assert async_client._client is pooled_client
+
+
+def test_limits() -> None:
+    """Test that the connection pool limits are built from the init arguments."""
+    client = AsyncAPIClient(
+        base_url="https://www.example.com",
+        max_connections=5,
+        max_keepalive_connections=2,
+        keepalive_expiry=15.0,
+    )
+
+    assert client.limits == httpx.Limits(
+        max_connections=5, max_keepalive_connections=2, keepalive_expiry=15.0
+    )
+
+
+@pytest.mark.asyncio
+async def test_aclose(async_client: AsyncAPIClient) -> None:
+    """Test that 'aclose' closes the underlying connection pool."""
+    assert not async_client.is_closed
+    await async_client.aclose()
+    assert async_client.is_closed
+
+
+@pytest.mark.asyncio
+async def test_async_context_manager() -> None:
+    """Test that leaving the async context closes the connection pool."""
+    async with AsyncAPIClient(base_url="https://www.example.com") as client:
+        assert isinstance(client, AsyncAPIClient)
+        assert not client.is_closed
+
+    assert client.is_closed
+
+
+def _response(method: str, status_code: int) -> httpx.Response:
+    """Build a response with the given status for a request to example.com."""
+    return httpx.Response(
+        status_code=status_code,
+        request=httpx.Request(method, "https://example.com/endpoint"),
+    )
+
+
+@pytest.mark.asyncio
+async def test_retries_transient_failures() -> None:
+    """Test that transient failures are retried until a request succeeds."""
+    client = AsyncAPIClient(
+        base_url="https://www.example.com", retry_policy=RetryPolicy(max_attempts=3)
+    )
+    with (
+        mock.patch.object(
+            client._client, "request", new_callable=mock.AsyncMock
+        ) as mock_request,
+        mock.patch("asyncio.sleep", new_callable=mock.AsyncMock) as mock_sleep,
+    ):
+        mock_request.side_effect = [
+            httpx.ConnectError("refused"),
+            _response("GET", 503),
+            _response("GET", 200),
+        ]
+        response = await client.get("/endpoint")
+
+    assert response.status_code == HTTPStatus.OK
+    assert mock_request.await_count == 3
+    assert mock_sleep.await_count == 2
+
+
+@pytest.mark.exception
+@pytest.mark.asyncio
+async def test_gives_up_after_max_attempts() -> None:
+    """Test that the last error is raised once every attempt has failed."""
+    client = AsyncAPIClient(
+        base_url="https://www.example.com", retry_policy=RetryPolicy(max_attempts=2)
+    )
+    with (
+        mock.patch.object(
+            client._client, "request", new_callable=mock.AsyncMock
+        ) as mock_request,
+        mock.patch("asyncio.sleep", new_callable=mock.AsyncMock),
+    ):
+        mock_request.return_value = _response("GET", 503)
+        with pytest.raises(httpx.HTTPStatusError):
+            await client.get("/endpoint")
+
+    assert mock_request.await_count == 2
+
+
+@pytest.mark.exception
+@pytest.mark.asyncio
+async def test_does_not_retry_non_idempotent_methods() -> None:
+    """Test that POST requests are not retried by the default policy."""
+    client = AsyncAPIClient(
+        base_url="https://www.example.com", retry_policy=RetryPolicy(max_attempts=3)
+    )
+    with mock.patch.object(
+        client._client, "request", new_callable=mock.AsyncMock
+    ) as mock_request:
+        mock_request.return_value = _response("POST", 503)
+        with pytest.raises(httpx.HTTPStatusError):
+            await client.post("/endpoint")
+
+    mock_request.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_before_attempt_is_awaited_before_every_attempt() -> None:
+    """Test that the before_attempt hook paces retries as well as the first attempt."""
+    client = AsyncAPIClient(
+        base_url="https://www.example.com", retry_policy=RetryPolicy(max_attempts=3)
+    )
+    before_attempt = mock.AsyncMock()
+    with (
+        mock.patch.object(
+            client._client, "request", new_callable=mock.AsyncMock
+        ) as mock_request,
+        mock.patch("asyncio.sleep", new_callable=mock.AsyncMock),
+    ):
+        mock_request.side_effect = [
+            _response("GET", 503),
+            _response("GET", 503),
+            _response("GET", 200),
+        ]
+        await client.get("/endpoint", before_attempt=before_attempt)
+
+    assert before_attempt.await_count == 3
+
+
+@pytest.mark.exception
+@pytest.mark.asyncio
+async def test_retry_after_beyond_deadline_is_not_awaited() -> None:
+    """Test that no retry is attempted when Retry-After exceeds the deadline."""
+    client = AsyncAPIClient(
+        base_url="https://www.example.com",
+        retry_policy=RetryPolicy(max_attempts=3, deadline=5),
+    )
+    response = httpx.Response(
+        status_code=429,
+        headers={"Retry-After": "60"},
+        request=httpx.Request("GET", "https://example.com/endpoint"),
+    )
+    with (
+        mock.patch.object(
+            client._client, "request", new_callable=mock.AsyncMock
+        ) as mock_request,
+        mock.patch("asyncio.sleep", new_callable=mock.AsyncMock) as mock_sleep,
+    ):
+        mock_request.return_value = response
+        with pytest.raises(httpx.HTTPStatusError):
+            await client.get("/endpoint")
+
+    mock_request.assert_awaited_once()
+    mock_sleep.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_attempt_timeout_is_bounded_by_deadline() -> None:
+    """Test that an attempt's timeout never exceeds the remaining deadline."""
+    client = AsyncAPIClient(
+        base_url="https://www.example.com",
+        timeout=10,
+        retry_policy=RetryPolicy(deadline=2),
+    )
+    with mock.patch.object(
+        client._client, "request", new_callable=mock.AsyncMock
+    ) as mock_request:
+        mock_request.return_value = _response("GET", 200)
+        await client.get("/endpoint")
+
+    assert mock_request.call_args.kwargs["timeout"] <= 2
+
+
+@pytest.mark.exception
+@pytest.mark.asyncio
+async def test_circuit_breaker_fails_fast_when_open() -> None:
+    """Test that requests are rejected without I/O once the host's circuit opens."""
+    client = AsyncAPIClient(
+        base_url="https://www.example.com",
+        circuit_breaker_factory=lambda: CircuitBreaker(window_size=2, minimum_calls=2),
+    )
+    with mock.patch.object(
+        client._client, "request", new_callable=mock.AsyncMock
+    ) as mock_request:
+        mock_request.side_effect = httpx.ConnectError("refused")
+        for _ in range(2):
+            with pytest.raises(httpx.ConnectError):
+                await client.get("/endpoint")
+
+        with pytest.raises(CircuitOpenError):
+            await client.get("/endpoint")
+
+    assert mock_request.await_count == 2
+    breaker = client.circuit_breaker("https://www.example.com/endpoint")
+    assert breaker is not None
+    assert breaker.state is CircuitState.OPEN
+
+
+@pytest.mark.asyncio
+async def test_circuit_breaker_ignores_client_errors() -> None:
+    """Test that 4xx responses do not count as upstream failures."""
+    client = AsyncAPIClient(
+        base_url="https://www.example.com",
+        circuit_breaker_factory=lambda: CircuitBreaker(window_size=2, minimum_calls=2),
+    )
+    with mock.patch.object(
+        client._client, "request", new_callable=mock.AsyncMock
+    ) as mock_request:
+        mock_request.return_value = _response("GET", 404)
+        for _ in range(3):
+            with pytest.raises(httpx.HTTPStatusError):
+                await client.get("/endpoint")
+
+    assert mock_request.await_count == 3
+
+
+def test_circuit_breaker_per_host() -> None:
+    """Test that each host gets its own circuit breaker."""
+    client = AsyncAPIClient(
+        base_url="https://www.example.com", circuit_breaker_factory=CircuitBreaker
+    )
+
+    first = client.circuit_breaker("https://www.example.com/a")
+    assert first is client.circuit_breaker("https://www.example.com/b")
+    assert first is not client.circuit_breaker("https://other.example.com/a")
+    assert (
+        AsyncAPIClient(base_url="https://a.com").circuit_breaker("https://a.com")
+        is None
+    )
+
+
+@pytest.mark.asyncio
+async def test_metrics_record_phases_and_outcomes() -> None:
+    """Test that each attempt records its phases and its status or error."""
+
+    async def handler(request: HTTPRequest) -> HTTPResponse:
+        status = HTTPStatus.OK if request.path == "/ok" else HTTPStatus.BAD_GATEWAY
+        return HTTPResponse(status=status)
+
+    metrics = MetricsRegistry()
+    async with HTTPServer(handler=handler) as server:
+        async with AsyncAPIClient(base_url=server.url, metrics=metrics) as client:
+            await client.get("/ok")
+            await client.get("/ok")
+            with pytest.raises(httpx.HTTPStatusError):
+                await client.get("/fail")
+
+    def duration(phase: str) -> int:
+        name = "http_client_request_duration_seconds"
+        return metrics.histogram(name, labels={"phase": phase}).count
+
+    def requests(outcome: str) -> float:
+        name = "http_client_requests_total"
+        return metrics.counter(name, labels={"outcome": outcome}).value
+
+    assert (duration("total"), duration("ttfb"), duration("connect")) == (3, 3, 1)
+    assert (requests("200"), requests("502")) == (2, 1)
+    assert metrics.gauge("http_client_requests_in_flight").value == 0
+
+
+@pytest.mark.asyncio
+async def test_metrics_record_transport_errors() -> None:
+    """Test that an attempt failing without a response counts its error type."""
+
+    def refuse(request: httpx.Request) -> httpx.Response:
+        raise httpx.ConnectError("refused", request=request)
+
+    metrics = MetricsRegistry()
+    client = AsyncAPIClient(
+        base_url="https://www.example.com",
+        transport=httpx.MockTransport(refuse),
+        metrics=metrics,
+    )
+    with pytest.raises(httpx.ConnectError):
+        await client.get("/endpoint")
+
+    outcome = {"outcome": "ConnectError"}
+    assert metrics.counter("http_client_requests_total", labels=outcome).value == 1
@@ -0,0 +1,123 @@
+"""Tests for the CircuitBreaker class in toolkit.api.circuit_breaker module."""
+
+import pytest
+
+from tests.helpers import FakeClock
+from toolkit.api.circuit_breaker import CircuitBreaker, CircuitOpenError, CircuitState
+
+
+@pytest.fixture
+def breaker(clock: FakeClock) -> CircuitBreaker:
+    """Fixture providing a CircuitBreaker opening at 50% failures of 4 calls."""
+    return CircuitBreaker(
+        failure_rate_threshold=0.5,
+        window_size=4,
+        minimum_calls=4,
+        cooldown=10,
+        clock=clock,
+    )
+
+
+def _state(breaker: CircuitBreaker) -> CircuitState:
+    """Return the current state, read afresh on every call."""
+    return breaker.state
+
+
+def _open(breaker: CircuitBreaker) -> None:
+    """Record enough failures to open the breaker."""
+    for _ in range(4):
+        breaker.before_call()
+        breaker.record_failure()
+
+
+@pytest.mark.smoke
+def test_opens_at_failure_rate(breaker: CircuitBreaker) -> None:
+    """Test that the circuit opens once the failure rate reaches the threshold."""
+    for succeeded in (True, False, True):
+        breaker.before_call()
+        breaker.record_success() if succeeded else breaker.record_failure()
+    assert _state(breaker) is CircuitState.CLOSED
+
+    breaker.before_call()
+    breaker.record_failure()
+
+    assert _state(breaker) is CircuitState.OPEN
+    assert breaker.failure_rate == 0.5
+
+
+def test_does_not_open_below_minimum_calls(breaker: CircuitBreaker) -> None:
+    """Test that a few failures do not open the circuit before `minimum_calls`."""
+    for _ in range(3):
+        breaker.record_failure()
+
+    assert _state(breaker) is CircuitState.CLOSED
+
+
+@pytest.mark.exception
+def test_open_circuit_rejects_calls(breaker: CircuitBreaker) -> None:
+    """Test that calls are rejected while the circuit is open."""
+    _open(breaker)
+
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+
+def test_half_open_probe_success_closes(
+    breaker: CircuitBreaker, clock: FakeClock
+) -> None:
+    """Test that a successful probe after the cooldown closes the circuit."""
+    _open(breaker)
+    clock.now = 10
+
+    assert _state(breaker) is CircuitState.HALF_OPEN
+    breaker.before_call()
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+    breaker.record_success()
+
+    assert _state(breaker) is CircuitState.CLOSED
+    assert breaker.failure_rate == 0.0
+
+
+def test_half_open_probe_failure_reopens(
+    breaker: CircuitBreaker, clock: FakeClock
+) -> None:
+    """Test that a failed probe opens the circuit for another cooldown."""
+    _open(breaker)
+    clock.now = 10
+    breaker.before_call()
+    breaker.record_failure()
+
+    assert _state(breaker) is CircuitState.OPEN
+    clock.now = 19
+    assert _state(breaker) is CircuitState.OPEN
+    clock.now = 20
+    assert _state(breaker) is CircuitState.HALF_OPEN
+
+
+def test_release_frees_probe_slot(breaker: CircuitBreaker, clock: FakeClock) -> None:
+    """Test that a probe ending without an outcome lets another probe through."""
+    _open(breaker)
+    clock.now = 10
+    breaker.before_call()
+    breaker.release()
+
+    breaker.before_call()
+
+
+@pytest.mark.exception
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"failure_rate_threshold": 0},
+        {"failure_rate_threshold": 1.5},
+        {"window_size": 5, "minimum_calls": 6},
+        {"cooldown": -1},
+        {"half_open_max_calls": 0},
+    ],
+)
+def test_invalid_arguments(kwargs: dict[str, float]) -> None:
+    """Test that out of range arguments are rejected."""
+    with pytest.raises(ValueError):
+        CircuitBreaker(**kwargs)  # type: ignore[arg-type]
@@ -0,0 +1,135 @@
+"""Tests for the TokenBucketRateLimiter class in toolkit.api.rate_limiter module."""
+
+from unittest import mock
+
+import pytest
+
+from tests.helpers import FakeClock
+from toolkit.api.rate_limiter import RateLimitExceededError, TokenBucketRateLimiter
+
+
+@pytest.mark.smoke
+@pytest.mark.asyncio
+async def test_burst_is_served_without_waiting(clock: FakeClock) -> None:
+    """Test that up to `burst` requests are allowed back to back."""
+    limiter = TokenBucketRateLimiter(rate=1, burst=3, clock=clock)
+
+    with mock.patch("asyncio.sleep", clock.sleep):
+        for _ in range(3):
+            await limiter.acquire()
+
+    assert clock.sleeps == []
+
+
+@pytest.mark.asyncio
+async def test_waits_exactly_until_next_token(clock: FakeClock) -> None:
+    """Test that once the bucket is empty, a request waits for exactly one token."""
+    limiter = TokenBucketRateLimiter(rate=2, burst=1, clock=clock)
+
+    with mock.patch("asyncio.sleep", clock.sleep):
+        await limiter.acquire()
+        await limiter.acquire()
+        clock.now += 0.2
+        await limiter.acquire()
+
+    assert clock.sleeps == pytest.approx([0.5, 0.3])
+
+
+@pytest.mark.asyncio
+async def test_refill_is_capped_at_burst(clock: FakeClock) -> None:
+    """Test that an idle bucket does not accumulate more than `burst` tokens."""
+    limiter = TokenBucketRateLimiter(rate=1, burst=2, clock=clock)
+    clock.now += 100
+
+    with mock.patch("asyncio.sleep", clock.sleep):
+        for _ in range(3):
+            await limiter.acquire()
+
+    assert clock.sleeps == pytest.approx([1.0])
+
+
+@pytest.mark.exception
+@pytest.mark.asyncio
+async def test_daily_budget_exhausted(clock: FakeClock) -> None:
+    """Test that requests beyond the daily budget raise RateLimitExceededError."""
+    limiter = TokenBucketRateLimiter(rate=10, burst=10, daily_budget=2, clock=clock)
+
+    await limiter.acquire()
+    await limiter.acquire()
+    assert limiter.remaining_daily_budget == 0
+
+    with pytest.raises(RateLimitExceededError):
+        await limiter.acquire()
+
+
+@pytest.mark.asyncio
+async def test_daily_budget_resets_on_new_day(clock: FakeClock) -> None:
+    """Test that the daily budget is restored when the UTC day changes."""
+    limiter = TokenBucketRateLimiter(rate=10, burst=10, daily_budget=1, clock=clock)
+    await limiter.acquire()
+
+    limiter._budget_day = limiter._budget_day.replace(year=2000)
+
+    assert limiter.remaining_daily_budget == 1
+    await limiter.acquire()
+
+
+def test_no_daily_budget() -> None:
+    """Test that `remaining_daily_budget` is None when no budget is configured."""
+    limiter = TokenBucketRateLimiter(rate=1)
+    assert limiter.remaining_daily_budget is None
+
+
+@pytest.mark.exception
+@pytest.mark.parametrize("rate, burst", [(0, 1), (-1, 1), (1, 0)])
+def test_invalid_arguments(rate: float, burst: int) -> None:
+    """Test that non-positive rates and bursts are rejected."""
+    with pytest.raises(ValueError):
+        TokenBucketRateLimiter(rate=rate, burst=burst)
+
+
+@pytest.mark.asyncio
+async def test_pause_holds_back_requests(clock: FakeClock) -> None:
+    """Test that requests wait until the pause is over, even with tokens left."""
+    limiter = TokenBucketRateLimiter(rate=10, burst=10, clock=clock)
+    limiter.pause(60)
+    limiter.pause(30)
+
+    assert limiter.paused
+    with mock.patch("asyncio.sleep", side_effect=clock.sleep):
+        await limiter.acquire()
+        await limiter.acquire()
+
+    assert clock.sleeps == [60]
+    assert not limiter.paused
+
+
+@pytest.mark.asyncio
+async def test_pause_during_token_wait(clock: FakeClock) -> None:
+    """Test that a pause started while waiting for a token is waited out too."""
+    limiter = TokenBucketRateLimiter(rate=1, burst=1, clock=clock)
+
+    async def sleep(delay: float) -> None:
+        if not clock.sleeps:
+            limiter.pause(10)
+        await clock.sleep(delay)
+
+    with mock.patch("asyncio.sleep", side_effect=sleep):
+        await limiter.acquire()
+        await limiter.acquire()
+
+    assert clock.sleeps == pytest.approx([1.0, 9.0])
+
+
+@pytest.mark.exception
+@pytest.mark.asyncio
+async def test_exhaust_daily_budget(clock: FakeClock) -> None:
+    """Test that an exhausted daily budget refuses requests until the next day."""
+    limiter = TokenBucketRateLimiter(rate=10, burst=10, clock=clock)
+    limiter.exhaust_daily_budget()
+
+    with pytest.raises(RateLimitExceededError):
+        await limiter.acquire()
+
+    limiter._budget_day = limiter._budget_day.replace(year=2000)
+    await limiter.acquire()
@@ -0,0 +1,85 @@
+"""Tests for the RetryPolicy class in toolkit.api.retry module."""
+
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from unittest import mock
+
+import httpx
+import pytest
+
+from toolkit.api.retry import RetryPolicy, parse_retry_after
+
+
+def _status_error(status_code: int, headers: dict[str, str]) -> httpx.HTTPStatusError:
+    """Build an HTTPStatusError for a response with the given status and headers."""
+    request = httpx.Request("GET", "https://example.com")
+    response = httpx.Response(status_code, headers=headers, request=request)
+    return httpx.HTTPStatusError("error", request=request, response=response)
+
+
+@pytest.mark.parametrize(
+    "method, error, expected",
+    [
+        ("GET", httpx.ConnectError("refused"), True),
+        ("get", httpx.ReadTimeout("timeout"), True),
+        ("GET", _status_error(503, {}), True),
+        ("GET", _status_error(429, {}), True),
+        ("GET", _status_error(404, {}), False),
+        ("POST", httpx.ConnectError("refused"), False),
+        ("GET", ValueError("not an http error"), False),
+    ],
+)
+def test_is_retryable(method: str, error: Exception, expected: bool) -> None:
+    """Test that only idempotent transport and retryable status errors are retried."""
+    assert RetryPolicy().is_retryable(method, error) is expected
+
+
+@pytest.mark.parametrize("attempt, ceiling", [(1, 0.5), (2, 1.0), (3, 2.0), (10, 10.0)])
+def test_backoff_is_full_jitter(attempt: int, ceiling: float) -> None:
+    """Test that the backoff is drawn between zero and the capped exponential delay."""
+    with mock.patch("random.uniform", return_value=0.1) as mock_uniform:
+        assert RetryPolicy().backoff(attempt) == 0.1
+
+    mock_uniform.assert_called_once_with(0, ceiling)
+
+
+def test_delay_prefers_retry_after() -> None:
+    """Test that the Retry-After header overrides the backoff."""
+    error = _status_error(429, {"Retry-After": "7"})
+    assert RetryPolicy().delay(attempt=1, error=error) == 7.0
+
+
+def test_parse_retry_after_http_date() -> None:
+    """Test that an HTTP-date Retry-After is converted to the seconds until then."""
+    retry_at = datetime.now(timezone.utc) + timedelta(seconds=30)
+    response = httpx.Response(429, headers={"Retry-After": format_datetime(retry_at)})
+
+    retry_after = parse_retry_after(response)
+
+    assert retry_after is not None
+    assert 28 <= retry_after <= 30
+
+
+@pytest.mark.parametrize(
+    "headers",
+    [
+        {},
+        {"Retry-After": "soon"},
+        {"Retry-After": "inf"},
+        {"Retry-After": "nan"},
+    ],
+)
+def test_parse_retry_after_missing_or_invalid(headers: dict[str, str]) -> None:
+    """Test that a missing or unparsable Retry-After is ignored."""
+    assert parse_retry_after(httpx.Response(429, headers=headers)) is None
+
+
+@pytest.mark.exception
+@pytest.mark.parametrize(
+    "kwargs",
+    [{"max_attempts": 0}, {"backoff_base": -1}, {"deadline": 0}],
+)
+def test_invalid_policy(kwargs: dict[str, float]) -> None:
+    """Test that invalid policies are rejected."""
+    with pytest.raises(ValueError):
+        RetryPolicy(**kwargs)  # type: ignore[arg-type]
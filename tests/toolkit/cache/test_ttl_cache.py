@@ -0,0 +1,93 @@
+"""Tests for the TTLCache class in toolkit.cache.ttl_cache module."""
+
+import pytest
+
+from tests.helpers import FakeClock
+from toolkit.cache.ttl_cache import TTLCache
+
+
+@pytest.fixture
+def cache(clock: FakeClock) -> TTLCache[str, int]:
+    """Fixture providing a TTLCache with a 10s TTL and room for 2 entries."""
+    return TTLCache(ttl=10, max_entries=2, clock=clock)
+
+
+@pytest.mark.smoke
+def test_get_hit_and_miss(cache: TTLCache[str, int]) -> None:
+    """Test that set values are returned and counted as hits, others as misses."""
+    cache.set("a", 1)
+
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("b", 0) == 0
+    assert cache.stats.hits == 1
+    assert cache.stats.misses == 2
+
+
+def test_entry_expires_after_ttl(cache: TTLCache[str, int], clock: FakeClock) -> None:
+    """Test that an entry is no longer returned once its TTL has elapsed."""
+    cache.set("a", 1)
+    clock.now = 9.9
+    assert cache.get("a") == 1
+    assert "a" in cache
+
+    clock.now = 10
+    assert "a" not in cache
+    assert cache.get("a") is None
+    assert cache.stats.expirations == 1
+    assert len(cache) == 0
+
+
+def test_least_recently_used_is_evicted(cache: TTLCache[str, int]) -> None:
+    """Test that the least recently used entry is evicted when the cache is full."""
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert "a" in cache
+    assert "b" not in cache
+    assert "c" in cache
+    assert cache.stats.evictions == 1
+
+
+def test_set_refreshes_ttl(cache: TTLCache[str, int], clock: FakeClock) -> None:
+    """Test that setting an existing key restarts its TTL."""
+    cache.set("a", 1)
+    clock.now = 8
+    cache.set("a", 2)
+    clock.now = 15
+
+    assert cache.get("a") == 2
+
+
+def test_invalidate_and_clear(cache: TTLCache[str, int]) -> None:
+    """Test removing a single entry and every entry."""
+    cache.set("a", 1)
+    cache.set("b", 2)
+
+    cache.invalidate("a")
+    assert "a" not in cache
+    cache.invalidate("missing")
+
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_hit_ratio(cache: TTLCache[str, int]) -> None:
+    """Test the hit ratio with and without lookups."""
+    assert cache.stats.hit_ratio == 0.0
+
+    cache.set("a", 1)
+    cache.get("a")
+    cache.get("b")
+
+    assert cache.stats.hit_ratio == 0.5
+
+
+@pytest.mark.exception
+@pytest.mark.parametrize("ttl, max_entries", [(0, 1), (-1, 1), (1, 0)])
+def test_invalid_arguments(ttl: float, max_entries: int) -> None:
+    """Test that non-positive TTLs and sizes are rejected."""
+    with pytest.raises(ValueError):
+        TTLCache(ttl=ttl, max_entries=max_entries)
@@ -0,0 +1,79 @@
+"""Tests for the run_periodically function in toolkit.concurrency.scheduler."""
+
+import asyncio
+from unittest import mock
+
+import pytest
+
+from toolkit.concurrency.scheduler import run_periodically
+
+
+@pytest.mark.smoke
+@pytest.mark.asyncio
+async def test_runs_until_stopped() -> None:
+    """Test that the callback runs repeatedly until the stop event is set."""
+    stop_event = asyncio.Event()
+    runs = 0
+
+    async def callback() -> None:
+        nonlocal runs
+        runs += 1
+        if runs == 3:
+            stop_event.set()
+
+    await asyncio.wait_for(
+        run_periodically(callback, interval=0.001, stop_event=stop_event), timeout=1
+    )
+
+    assert runs == 3
+
+
+@pytest.mark.asyncio
+async def test_delay_includes_jitter() -> None:
+    """Test that the random jitter is added to the remaining interval."""
+    stop_event = asyncio.Event()
+    timeouts: list[float] = []
+
+    async def callback() -> None:
+        if timeouts:
+            stop_event.set()
+
+    async def wait_for(awaitable: asyncio.Future[bool], timeout: float) -> None:
+        timeouts.append(timeout)
+        awaitable.close()  # type: ignore[attr-defined]
+        raise asyncio.TimeoutError
+
+    with (
+        mock.patch("asyncio.wait_for", wait_for),
+        mock.patch("random.uniform", return_value=0.5) as mock_uniform,
+    ):
+        await run_periodically(callback, interval=10, jitter=1, stop_event=stop_event)
+
+    mock_uniform.assert_called_with(0, 1)
+    assert 10 < timeouts[0] <= 10.5
+
+
+@pytest.mark.asyncio
+async def test_stop_interrupts_the_wait() -> None:
+    """Test that setting the stop event ends the wait before the interval elapses."""
+    stop_event = asyncio.Event()
+
+    async def callback() -> None:
+        asyncio.get_running_loop().call_soon(stop_event.set)
+
+    await asyncio.wait_for(
+        run_periodically(callback, interval=60, stop_event=stop_event), timeout=1
+    )
+
+
+@pytest.mark.exception
+@pytest.mark.asyncio
+@pytest.mark.parametrize("interval, jitter", [(0, 0), (1, -1)])
+async def test_invalid_arguments(interval: float, jitter: float) -> None:
+    """Test that a non-positive interval and a negative jitter are rejected."""
+
+    async def callback() -> None:
+        """Do nothing."""
+
+    with pytest.raises(ValueError):
+        await run_periodically(callback, interval=interval, jitter=jitter)
@@ -0,0 +1,152 @@
+"""Tests for the SingleFlight class in toolkit.concurrency.single_flight module."""
+
+import asyncio
+
+import pytest
+
+from toolkit.concurrency.single_flight import SingleFlight
+
+
+@pytest.mark.smoke
+@pytest.mark.asyncio
+async def test_concurrent_calls_share_one_execution() -> None:
+    """Test that concurrent calls with the same key execute the function once."""
+    single_flight: SingleFlight[str, int] = SingleFlight()
+    calls = 0
+    release = asyncio.Event()
+
+    async def func() -> int:
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return 42
+
+    callers = [asyncio.create_task(single_flight.do("key", func)) for _ in range(5)]
+    await asyncio.sleep(0)
+    assert single_flight.in_flight == 1
+
+    release.set()
+    results = await asyncio.gather(*callers)
+
+    assert results == [42] * 5
+    assert calls == 1
+    assert single_flight.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_different_keys_execute_separately() -> None:
+    """Test that calls with different keys are not coalesced."""
+    single_flight: SingleFlight[str, str] = SingleFlight()
+
+    async def func(value: str) -> str:
+        await asyncio.sleep(0)
+        return value
+
+    results = await asyncio.gather(
+        single_flight.do("a", lambda: func("a")),
+        single_flight.do("b", lambda: func("b")),
+    )
+
+    assert list(results) == ["a", "b"]
+
+
+@pytest.mark.asyncio
+async def test_sequential_calls_execute_again() -> None:
+    """Test that a finished call is not reused by later callers."""
+    single_flight: SingleFlight[str, int] = SingleFlight()
+    calls = 0
+
+    async def func() -> int:
+        nonlocal calls
+        calls += 1
+        return calls
+
+    assert await single_flight.do("key", func) == 1
+    await asyncio.sleep(0)
+    assert await single_flight.do("key", func) == 2
+
+
+@pytest.mark.exception
+@pytest.mark.asyncio
+async def test_exception_is_shared() -> None:
+    """Test that every concurrent caller receives the exception of the execution."""
+    single_flight: SingleFlight[str, int] = SingleFlight()
+
+    async def func() -> int:
+        await asyncio.sleep(0)
+        raise RuntimeError("boom")
+
+    results = await asyncio.gather(
+        single_flight.do("key", func),
+        single_flight.do("key", func),
+        return_exceptions=True,
+    )
+
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert results[0] is results[1]
+
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_does_not_cancel_others() -> None:
+    """Test that cancelling one caller leaves the shared execution running."""
+    single_flight: SingleFlight[str, int] = SingleFlight()
+    release = asyncio.Event()
+
+    async def func() -> int:
+        await release.wait()
+        return 1
+
+    first = asyncio.create_task(single_flight.do("key", func))
+    second = asyncio.create_task(single_flight.do("key", func))
+    await asyncio.sleep(0)
+
+    first.cancel()
+    release.set()
+
+    assert await second == 1
+    assert first.cancelled()
+
+
+@pytest.mark.asyncio
+async def test_do_many_joins_keys_in_flight() -> None:
+    """Test that a batch only executes its keys that are not already in flight."""
+    single_flight: SingleFlight[str, str] = SingleFlight()
+    release = asyncio.Event()
+    batches: list[list[str]] = []
+
+    async def func(keys: list[str]) -> dict[str, str]:
+        batches.append(keys)
+        await release.wait()
+        return {key: key.lower() for key in keys if key != "MISSING"}
+
+    first = asyncio.create_task(single_flight.do_many(["A", "B", "A"], func))
+    await asyncio.sleep(0)
+    second = asyncio.create_task(single_flight.do_many(["B", "C", "MISSING"], func))
+    await asyncio.sleep(0)
+    assert single_flight.in_flight == 4
+
+    release.set()
+
+    assert await first == {"A": "a", "B": "b"}
+    assert await second == {"B": "b", "C": "c"}
+    assert batches == [["A", "B"], ["C", "MISSING"]]
+    assert single_flight.in_flight == 0
+
+
+@pytest.mark.exception
+@pytest.mark.asyncio
+async def test_do_many_exception_is_shared() -> None:
+    """Test that callers joining a failed batch receive its exception."""
+    single_flight: SingleFlight[str, int] = SingleFlight()
+
+    async def func(keys: list[str]) -> dict[str, int]:
+        await asyncio.sleep(0)
+        raise RuntimeError("boom")
+
+    results = await asyncio.gather(
+        single_flight.do_many(["A", "B"], func),
+        single_flight.do_many(["B"], func),
+        return_exceptions=True,
+    )
+
+    assert all(isinstance(result, RuntimeError) for result in results)
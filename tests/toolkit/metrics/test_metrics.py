@@ -0,0 +1,80 @@
+"""Tests for the metric types in toolkit.metrics.metrics module."""
+
+import random
+
+import pytest
+
+from toolkit.metrics.metrics import Counter, Gauge, Histogram, timed
+
+
+def test_counter_and_gauge() -> None:
+    """Test that counters only increase while gauges go both ways."""
+    counter = Counter()
+    gauge = Gauge()
+
+    counter.inc()
+    counter.inc(2.5)
+    gauge.inc(3)
+    gauge.dec()
+    with pytest.raises(ValueError):
+        counter.inc(-1)
+
+    assert counter.value == 3.5
+    assert gauge.value == 2
+    gauge.set(7)
+    assert gauge.value == 7
+
+
+@pytest.mark.smoke
+def test_histogram_percentiles_have_bounded_relative_error() -> None:
+    """Test that percentiles stay within the precision over several magnitudes."""
+    histogram = Histogram(unit=1e-6, precision_bits=5)
+    rng = random.Random(0)
+    values = sorted(rng.lognormvariate(-4, 2) for _ in range(10_000))
+    for value in values:
+        histogram.record(value)
+
+    for q in (1, 50, 90, 99, 99.9):
+        expected = values[max(int(q / 100 * len(values)) - 1, 0)]
+        assert histogram.percentile(q) == pytest.approx(expected, rel=1 / 16, abs=1e-6)
+    assert histogram.count == len(values)
+    assert histogram.sum == pytest.approx(sum(values))
+    assert (histogram.min, histogram.max) == (values[0], values[-1])
+    assert histogram.percentile(100) == values[-1]
+
+
+def test_histogram_small_values_are_exact() -> None:
+    """Test that values below the linear range are counted in exact buckets."""
+    histogram = Histogram(unit=1.0, precision_bits=3)
+    for value in (0, 1, 2, 3, 7):
+        histogram.record(value)
+
+    assert histogram.percentile(0) == 0
+    assert histogram.percentile(20) == 0.5
+    assert histogram.percentile(60) == 2.5
+    assert Histogram().percentile(50) is None
+
+
+@pytest.mark.exception
+def test_histogram_rejects_invalid_values() -> None:
+    """Test that negative values and settings are rejected."""
+    with pytest.raises(ValueError):
+        Histogram().record(-1.0)
+    with pytest.raises(ValueError):
+        Histogram(unit=0)
+    with pytest.raises(ValueError):
+        Histogram(precision_bits=0)
+
+
+def test_timed_blocks() -> None:
+    """Test timing a block into a histogram, or nothing when metrics are disabled."""
+    histogram = Histogram()
+
+    with timed(histogram):
+        pass
+    with timed(None):
+        pass
+    with pytest.raises(RuntimeError), histogram.time():
+        raise RuntimeError
+
+    assert histogram.count == 2
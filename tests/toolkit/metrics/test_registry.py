@@ -0,0 +1,89 @@
+"""Tests for the MetricsRegistry class in toolkit.metrics.registry module."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from toolkit.metrics.registry import MetricsRegistry
+
+
+@pytest.fixture
+def registry() -> MetricsRegistry:
+    """Fixture providing a registry with one metric of each type."""
+    registry = MetricsRegistry()
+    registry.counter("requests_total", "Requests.", labels={"outcome": "200"}).inc(3)
+    registry.gauge("in_flight", "In-flight requests.").set(2)
+    histogram = registry.histogram("duration_seconds", labels={"phase": "total"})
+    for value in (0.1, 0.2, 0.3):
+        histogram.record(value)
+    return registry
+
+
+@pytest.mark.smoke
+def test_metrics_are_created_once(registry: MetricsRegistry) -> None:
+    """Test that the same name and labels return the same metric."""
+    counter = registry.counter("requests_total", labels={"outcome": "200"})
+
+    assert counter is registry.counter("requests_total", labels={"outcome": "200"})
+    assert counter is not registry.counter("requests_total", labels={"outcome": "500"})
+    assert counter.value == 3
+
+
+@pytest.mark.exception
+def test_type_conflict(registry: MetricsRegistry) -> None:
+    """Test that a name can not be registered with two metric types."""
+    with pytest.raises(ValueError, match="counter"):
+        registry.gauge("requests_total")
+
+
+def test_snapshot(registry: MetricsRegistry) -> None:
+    """Test the JSON-serializable snapshot of the metrics."""
+    snapshot = json.loads(registry.to_json())
+
+    assert snapshot["requests_total"] == {
+        "type": "counter",
+        "help": "Requests.",
+        "samples": [{"labels": {"outcome": "200"}, "value": 3.0}],
+    }
+    (sample,) = snapshot["duration_seconds"]["samples"]
+    assert sample["count"] == 3
+    assert sample["p50"] == pytest.approx(0.2, rel=1 / 32)
+    assert sample["max"] == 0.3
+
+
+def test_prometheus_exposition(registry: MetricsRegistry) -> None:
+    """Test the Prometheus text format, with histograms exposed as summaries."""
+    registry.counter("escaped_total", labels={"path": 'a"b\\c'}).inc()
+
+    lines = registry.to_prometheus().splitlines()
+
+    assert "# HELP requests_total Requests." in lines
+    assert "# TYPE requests_total counter" in lines
+    assert 'requests_total{outcome="200"} 3.0' in lines
+    assert "in_flight 2.0" in lines
+    assert "# TYPE duration_seconds summary" in lines
+    assert 'duration_seconds_count{phase="total"} 3' in lines
+    assert any(
+        line.startswith('duration_seconds{phase="total",quantile="0.99"} ')
+        for line in lines
+    )
+    assert 'escaped_total{path="a\\"b\\\\c"} 1.0' in lines
+
+
+def test_write(registry: MetricsRegistry, tmp_path: Path) -> None:
+    """Test writing snapshots in the format matching the file suffix."""
+    registry.write(tmp_path / "metrics.json")
+    registry.write(tmp_path / "metrics.prom")
+    registry.write(tmp_path / "metrics.out", format="prometheus")
+
+    assert "requests_total" in json.loads((tmp_path / "metrics.json").read_text())
+    assert (tmp_path / "metrics.prom").read_text() == registry.to_prometheus()
+    assert (tmp_path / "metrics.out").read_text() == registry.to_prometheus()
+    assert sorted(path.name for path in tmp_path.iterdir()) == [
+        "metrics.json",
+        "metrics.out",
+        "metrics.prom",
+    ]
+    with pytest.raises(ValueError):
+        registry.write(tmp_path / "metrics.xml", format="xml")
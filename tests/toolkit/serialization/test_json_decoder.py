@@ -0,0 +1,76 @@
+"""Tests for the JSON decoders in toolkit.serialization.json_decoder module."""
+
+import json
+from typing import Callable
+from unittest import mock
+
+import pytest
+
+from toolkit.serialization.json_decoder import (
+    JSONDecoderInterface,
+    MsgspecJSONDecoder,
+    OrjsonJSONDecoder,
+    StdlibJSONDecoder,
+    get_json_decoder,
+)
+
+
+def _available_backends() -> list[Callable[[], JSONDecoderInterface]]:
+    """Return the decoder backends installed in the current environment."""
+    candidates: tuple[Callable[[], JSONDecoderInterface], ...] = (
+        StdlibJSONDecoder,
+        OrjsonJSONDecoder,
+        MsgspecJSONDecoder,
+    )
+    backends = []
+    for backend in candidates:
+        try:
+            backend()
+        except ImportError:
+            continue
+        backends.append(backend)
+    return backends
+
+
+@pytest.mark.smoke
+@pytest.mark.parametrize("backend", _available_backends())
+def test_decode(backend: Callable[[], JSONDecoderInterface]) -> None:
+    """Test that every available backend decodes raw bytes the same way."""
+    document = {"Global Quote": {"01. symbol": "AAPL", "05. price": "150.42"}}
+
+    assert backend().decode(json.dumps(document).encode()) == document
+
+
+@pytest.mark.exception
+@pytest.mark.parametrize("backend", _available_backends())
+def test_decode_invalid_document(backend: Callable[[], JSONDecoderInterface]) -> None:
+    """Test that every available backend raises json.JSONDecodeError."""
+    with pytest.raises(json.JSONDecodeError):
+        backend().decode(b"{not json")
+
+
+def test_get_json_decoder_prefers_orjson() -> None:
+    """Test that orjson is selected by default when it is installed."""
+    pytest.importorskip("orjson")
+
+    assert isinstance(get_json_decoder(), OrjsonJSONDecoder)
+
+
+def test_get_json_decoder_falls_back_to_stdlib() -> None:
+    """Test that the standard library is used when no fast backend is installed."""
+    with mock.patch("importlib.import_module", side_effect=ImportError):
+        decoder = get_json_decoder()
+
+    assert isinstance(decoder, StdlibJSONDecoder)
+
+
+def test_get_json_decoder_preferred() -> None:
+    """Test that a preferred backend is returned when asked for."""
+    assert isinstance(get_json_decoder(preferred="json"), StdlibJSONDecoder)
+
+
+@pytest.mark.exception
+def test_get_json_decoder_unknown_backend() -> None:
+    """Test that an unknown backend name is rejected."""
+    with pytest.raises(ValueError):
+        get_json_decoder(preferred="yaml")
@@ -0,0 +1,74 @@
+"""Tests for the HTTPServer class in toolkit.server.http_server module."""
+
+import asyncio
+from http import HTTPStatus
+
+import httpx
+import pytest
+
+from toolkit.server.http_server import HTTPRequest, HTTPResponse, HTTPServer
+
+
+async def _echo(request: HTTPRequest) -> HTTPResponse:
+    """Answer with the method, path and query of the request."""
+    if request.path == "/boom":
+        raise RuntimeError("boom")
+    query = "&".join(f"{name}={value}" for name, value in request.query.items())
+    return HTTPResponse(
+        body=f"{request.method} {request.path} {query} {request.body!r}".encode(),
+        headers={"X-Test": "1"},
+    )
+
+
+@pytest.mark.smoke
+@pytest.mark.asyncio
+async def test_requests_reuse_the_connection() -> None:
+    """Test that requests are answered and share one kept-alive connection."""
+    async with HTTPServer(handler=_echo) as server:
+        async with httpx.AsyncClient(base_url=server.url) as client:
+            first = await client.get("/quotes", params={"symbols": "A,B"})
+            second = await client.post("/echo", content=b"data")
+
+    assert first.status_code == HTTPStatus.OK
+    assert first.text == "GET /quotes symbols=A,B b''"
+    assert first.headers["x-test"] == "1"
+    assert second.text == "POST /echo  b'data'"
+    assert server.connections_opened == 1
+    assert server.requests_served == 2
+
+
+@pytest.mark.asyncio
+async def test_handler_error_answers_500() -> None:
+    """Test that an exception raised by the handler is answered with a 500."""
+    async with HTTPServer(handler=_echo) as server:
+        async with httpx.AsyncClient(base_url=server.url) as client:
+            response = await client.get("/boom")
+
+    assert response.status_code == HTTPStatus.INTERNAL_SERVER_ERROR
+
+
+@pytest.mark.asyncio
+async def test_malformed_request_answers_400() -> None:
+    """Test that a malformed request is answered with a 400, closing the connection."""
+    async with HTTPServer(handler=_echo) as server:
+        reader, writer = await asyncio.open_connection(server.host, server.port)
+        writer.write(b"garbage\r\n\r\n")
+        response = await reader.read()
+        writer.close()
+
+    assert response.startswith(b"HTTP/1.1 400 Bad Request\r\n")
+    assert b"Connection: close" in response
+
+
+@pytest.mark.asyncio
+async def test_close_drops_idle_connections() -> None:
+    """Test that closing the server closes its idle kept-alive connections."""
+    server = HTTPServer(handler=_echo)
+    await server.start()
+    async with httpx.AsyncClient(base_url=server.url) as client:
+        await client.get("/")
+        assert server.open_connections == 1
+
+        await server.close()
+
+    assert server.open_connections == 0
@@ -0,0 +1,81 @@
+"""Tests for the RollingWindow class in toolkit.timeseries.rolling_window module."""
+
+import random
+
+import pytest
+
+from toolkit.timeseries.rolling_window import RollingWindow
+
+
+@pytest.mark.smoke
+def test_statistics_of_partial_window() -> None:
+    """Test the statistics of a window holding fewer samples than its capacity."""
+    window = RollingWindow(capacity=5, ema_span=3)
+    for timestamp, (value, weight) in enumerate([(10, 1), (12, 3), (11, 0)]):
+        window.push(timestamp=timestamp, value=value, weight=weight)
+
+    assert len(window) == 3
+    assert not window.full
+    assert window.mean == 11
+    assert window.min == 10
+    assert window.max == 12
+    assert window.weighted_mean == (10 * 1 + 12 * 3) / 4
+    assert window.ema == pytest.approx(10 + 0.5 * (12 - 10) + 0.5 * (11 - 11))
+    assert window.latest == (2, 11, 0)
+    assert window.values() == [10, 12, 11]
+
+
+def test_oldest_samples_are_evicted() -> None:
+    """Test that only the last `capacity` samples are kept, oldest first."""
+    window = RollingWindow(capacity=3)
+    for timestamp, value in enumerate([5.0, 1.0, 4.0, 3.0, 2.0]):
+        window.push(timestamp=timestamp, value=value, weight=1)
+
+    assert window.full
+    assert window.timestamps() == [2, 3, 4]
+    assert window.values() == [4, 3, 2]
+    assert window.weights() == [1, 1, 1]
+    assert window.mean == 3
+    assert window.min == 2
+    assert window.max == 4
+    assert window.weighted_mean == 3
+
+
+def test_matches_recomputed_statistics() -> None:
+    """Test that incremental statistics match the ones recomputed from scratch."""
+    rng = random.Random(42)
+    window = RollingWindow(capacity=7)
+    for timestamp in range(100):
+        window.push(
+            timestamp=timestamp, value=rng.uniform(90, 110), weight=rng.randint(0, 9)
+        )
+        values, weights = window.values(), window.weights()
+
+        assert window.mean == pytest.approx(sum(values) / len(values))
+        assert window.min == min(values)
+        assert window.max == max(values)
+        if sum(weights):
+            assert window.weighted_mean == pytest.approx(
+                sum(v * w for v, w in zip(values, weights)) / sum(weights)
+            )
+
+
+def test_empty_window() -> None:
+    """Test that an empty window has no statistics."""
+    window = RollingWindow(capacity=3)
+
+    assert window.latest is None
+    assert window.mean is None
+    assert window.ema is None
+    assert window.min is None
+    assert window.max is None
+    assert window.weighted_mean is None
+    assert window.values() == []
+
+
+@pytest.mark.exception
+@pytest.mark.parametrize("capacity, ema_span", [(0, None), (3, 0)])
+def test_invalid_arguments(capacity: int, ema_span: int) -> None:
+    """Test that a non-positive capacity or EMA span is rejected."""
+    with pytest.raises(ValueError):
+        RollingWindow(capacity=capacity, ema_span=ema_span)
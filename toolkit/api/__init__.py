@@ -1,3 +1,19 @@
 from .api_client import AsyncAPIClient
+from .circuit_breaker import CircuitBreaker, CircuitOpenError, CircuitState
+from .rate_limiter import (
+    RateLimiterInterface,
+    RateLimitExceededError,
+    TokenBucketRateLimiter,
+)
+from .retry import RetryPolicy
 
-__all__ = ["AsyncAPIClient"]
+__all__ = [
+    "AsyncAPIClient",
+    "CircuitBreaker",
+    "CircuitOpenError",
+    "CircuitState",
+    "RateLimitExceededError",
+    "RateLimiterInterface",
+    "RetryPolicy",
+    "TokenBucketRateLimiter",
+]
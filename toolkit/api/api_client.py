@@ -1,10 +1,22 @@
 """Client for making HTTP requests using the httpx library."""
 
-from typing import Any, Optional
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable
+from http import HTTPStatus
+from types import TracebackType
+from typing import Any, Callable, Optional
 from urllib.parse import urljoin
 
 import httpx
 
+from ..metrics import MetricsRegistry
+from .circuit_breaker import CircuitBreaker
+from .retry import RetryPolicy
+
+logger = logging.getLogger(__name__)
+
 
 class AsyncAPIClient:
     """AsyncAPIClient class for making asynchronous HTTP requests."""
@@ -12,14 +24,108 @@ class AsyncAPIClient:
     def __init__(
         self,
         base_url: str,
-        timeout: int = 10,
+        timeout: float = 10,
         default_headers: Optional[dict[str, Any]] = None,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry: float = 30.0,
+        retry_policy: Optional[RetryPolicy] = None,
+        circuit_breaker_factory: Optional[Callable[[], CircuitBreaker]] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        metrics: Optional[MetricsRegistry] = None,
     ) -> None:
-        """Initialize the AsyncAPIClient."""
+        """
+        Initialize the AsyncAPIClient.
+
+        The client owns a single `httpx.AsyncClient`, so its connection pool is shared
+        by every request and warm connections are reused between calls. Call `aclose`
+        (or use the client as an async context manager) to release the pool.
+
+        Parameters
+        ----------
+        base_url : str
+            Base URL that endpoints are joined to.
+        timeout : float, optional
+            Request timeout in seconds.
+        default_headers : dict, optional
+            Headers sent with every request.
+        max_connections : int, optional
+            Maximum number of concurrent connections in the pool.
+        max_keepalive_connections : int, optional
+            Maximum number of idle connections kept alive in the pool.
+        keepalive_expiry : float, optional
+            Seconds an idle connection is kept alive before being closed.
+        retry_policy : RetryPolicy, optional
+            Policy for retrying failed requests. Requests are not retried if not given.
+        circuit_breaker_factory : Callable[[], CircuitBreaker], optional
+            Factory of the circuit breaker created for each host. Requests are not
+            guarded by a circuit breaker if not given.
+        transport : httpx.AsyncBaseTransport, optional
+            Transport sending the requests, e.g. an `httpx.MockTransport` answering
+            in-process. Defaults to a connection pool honouring the limits above.
+        metrics : MetricsRegistry, optional
+            Registry receiving the outcome and the connect, time to first byte and
+            total latency of every attempt. Attempts are not measured if not given.
+        """
         self.base_url = base_url
         self.timeout = timeout
         self.default_headers = default_headers or {}
-        self._client = httpx.AsyncClient
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.retry_policy = retry_policy or RetryPolicy(max_attempts=1)
+        self.metrics = metrics
+        self._circuit_breaker_factory = circuit_breaker_factory
+        self._circuit_breakers: dict[str, CircuitBreaker] = {}
+        self._client = httpx.AsyncClient(
+            limits=self.limits, timeout=self.timeout, transport=transport
+        )
+
+    @property
+    def is_closed(self) -> bool:
+        """Whether the underlying connection pool has been closed."""
+        return self._client.is_closed
+
+    def circuit_breaker(self, url: str) -> Optional[CircuitBreaker]:
+        """
+        Return the circuit breaker guarding the host of `url`, creating it if needed.
+
+        Parameters
+        ----------
+        url : str
+            An absolute URL.
+
+        Returns
+        -------
+        CircuitBreaker, optional
+            The host's circuit breaker, or None if circuit breaking is disabled.
+        """
+        if self._circuit_breaker_factory is None:
+            return None
+        host = httpx.URL(url).host
+        breaker = self._circuit_breakers.get(host)
+        if breaker is None:
+            breaker = self._circuit_breakers[host] = self._circuit_breaker_factory()
+        return breaker
+
+    async def aclose(self) -> None:
+        """Close the underlying connection pool."""
+        await self._client.aclose()
+
+    async def __aenter__(self) -> "AsyncAPIClient":
+        """Enter the async context, returning the client itself."""
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        """Exit the async context, closing the connection pool."""
+        await self.aclose()
 
     async def _request(
         self,
@@ -28,11 +134,18 @@ class AsyncAPIClient:
         headers: Optional[dict[str, Any]] = None,
         params: Optional[dict[str, Any]] = None,
         payload: Optional[dict[str, Any]] = None,
+        before_attempt: Optional[Callable[[], Awaitable[Any]]] = None,
         **kwargs: Any,
     ) -> httpx.Response:
         """
         Make an asynchronous HTTP request.
 
+        Failed attempts are retried according to the client's retry policy; each
+        attempt's timeout is shortened so that the policy's deadline is respected.
+        While the circuit breaker of the host is open, attempts fail immediately.
+        `before_attempt` is awaited before every attempt, retries included, so that a
+        rate limiter paces each request actually sent.
+
         Parameters
         ----------
         method : str
@@ -45,6 +158,9 @@ class AsyncAPIClient:
             URL parameters.
         payload : dict, optional
             Request payload for methods like POST, PUT, PATCH.
+        before_attempt : Callable[[], Awaitable[Any]], optional
+            Coroutine function awaited before every attempt, e.g. a rate limiter's
+            `acquire`. Its exceptions are raised without sending the attempt.
         **kwargs
             Additional keyword arguments for httpx.AsyncClient.request.
 
@@ -52,28 +168,267 @@ class AsyncAPIClient:
         -------
         httpx.Response
             The HTTP response object.
+
+        Raises
+        ------
+        httpx.HTTPError
+            If the last attempt failed with a transport error or an error status.
+        CircuitOpenError
+            If the circuit breaker of the host rejected the attempt.
         """
         full_url = urljoin(self.base_url, endpoint)
         request_headers = {**self.default_headers, **(headers or {})}
+        breaker = self.circuit_breaker(full_url)
+
+        policy = self.retry_policy
+        deadline: Optional[float] = None
+        attempt = 0
+        while True:
+            attempt += 1
+            if before_attempt is not None:
+                await before_attempt()
+            # The deadline starts once the first attempt may be sent, so the wait for
+            # it is not counted against the retries.
+            if deadline is None and policy.deadline is not None:
+                deadline = time.monotonic() + policy.deadline
+            timeout: float = self.timeout
+            if deadline is not None:
+                timeout = min(timeout, max(deadline - time.monotonic(), 0.0))
+            try:
+                return await self._send(
+                    method,
+                    full_url,
+                    breaker=breaker,
+                    headers=request_headers,
+                    params=params,
+                    data=payload,
+                    timeout=timeout,
+                    **kwargs,
+                )
+            except (httpx.TransportError, httpx.HTTPStatusError) as error:
+                delay = self._retry_delay(
+                    method=method,
+                    url=full_url,
+                    attempt=attempt,
+                    error=error,
+                    deadline=deadline,
+                )
+                if delay is None:
+                    raise
+                logger.info(
+                    "Retrying %s %s in %.3fs after attempt %d failed: %s",
+                    method,
+                    full_url,
+                    delay,
+                    attempt,
+                    error,
+                )
+                await asyncio.sleep(delay)
+
+    async def _send(
+        self,
+        method: str,
+        url: str,
+        breaker: Optional[CircuitBreaker],
+        **kwargs: Any,
+    ) -> httpx.Response:
+        """
+        Send a single request attempt, guarded by the host's circuit breaker.
+
+        Parameters
+        ----------
+        method : str
+            HTTP method.
+        url : str
+            Absolute URL of the request.
+        breaker : CircuitBreaker, optional
+            The circuit breaker of the host, if any.
+        **kwargs
+            Additional keyword arguments for httpx.AsyncClient.request.
+
+        Returns
+        -------
+        httpx.Response
+            The HTTP response object.
+
+        Raises
+        ------
+        httpx.HTTPError
+            If the attempt failed with a transport error or an error status.
+        CircuitOpenError
+            If the circuit breaker rejected the attempt.
+        """
+        if breaker is None:
+            return await self._perform(method, url, **kwargs)
+
+        breaker.before_call()
+        try:
+            response = await self._perform(method, url, **kwargs)
+        except (httpx.TransportError, httpx.HTTPStatusError) as error:
+            if self._is_upstream_failure(error):
+                breaker.record_failure()
+            else:
+                breaker.record_success()
+            raise
+        except BaseException:
+            breaker.release()
+            raise
+        breaker.record_success()
+        return response
+
+    async def _perform(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
+        """
+        Send a request with the connection pool, measuring it if metrics are enabled.
+
+        The connect and time to first byte phases are timed from the trace events of
+        httpcore. DNS resolution happens while connecting, so it is part of the
+        connect phase, which is only measured when a new connection is opened.
 
-        async with self._client() as client:
-            response: httpx.Response = await client.request(
-                method,
-                full_url,
-                headers=request_headers,
-                params=params,
-                data=payload,
-                timeout=self.timeout,
-                **kwargs,
+        Parameters
+        ----------
+        method : str
+            HTTP method.
+        url : str
+            Absolute URL of the request.
+        **kwargs
+            Additional keyword arguments for httpx.AsyncClient.request.
+
+        Returns
+        -------
+        httpx.Response
+            The HTTP response object.
+
+        Raises
+        ------
+        httpx.HTTPError
+            If the request failed with a transport error or an error status.
+        """
+        if self.metrics is None:
+            response: httpx.Response = await self._client.request(method, url, **kwargs)
+            response.raise_for_status()
+            return response
+
+        events: dict[str, float] = {}
+
+        async def trace(event_name: str, info: dict[str, Any]) -> None:
+            events[event_name.partition(".")[2]] = time.perf_counter()
+
+        in_flight = self.metrics.gauge(
+            "http_client_requests_in_flight", "HTTP requests waiting for a response."
+        )
+        in_flight.inc()
+        outcome = "error"
+        start = time.perf_counter()
+        try:
+            response = await self._client.request(
+                method, url, extensions={"trace": trace}, **kwargs
             )
+            outcome = str(response.status_code)
             response.raise_for_status()
             return response
+        except httpx.TransportError as error:
+            outcome = type(error).__name__
+            raise
+        finally:
+            in_flight.dec()
+            self._record_attempt(start, events, outcome)
+
+    def _record_attempt(
+        self, start: float, events: dict[str, float], outcome: str
+    ) -> None:
+        """Record the phases and the outcome of a request attempt."""
+        assert self.metrics is not None
+        end = time.perf_counter()
+        phases = {"total": end - start}
+        if "connect_tcp.complete" in events:
+            connected = events.get("start_tls.complete", events["connect_tcp.complete"])
+            phases["connect"] = connected - events["connect_tcp.started"]
+        if "receive_response_headers.complete" in events:
+            phases["ttfb"] = (
+                events["receive_response_headers.complete"]
+                - events["send_request_headers.started"]
+            )
+        for phase, duration in phases.items():
+            self.metrics.histogram(
+                "http_client_request_duration_seconds",
+                "Duration of the phases of HTTP request attempts.",
+                labels={"phase": phase},
+            ).record(duration)
+        self.metrics.counter(
+            "http_client_requests_total",
+            "HTTP request attempts by status code or transport error.",
+            labels={"outcome": outcome},
+        ).inc()
+
+    def _retry_delay(
+        self,
+        method: str,
+        url: str,
+        attempt: int,
+        error: httpx.HTTPError,
+        deadline: Optional[float],
+    ) -> Optional[float]:
+        """
+        Return the delay before retrying a failed attempt, or None to give up.
+
+        Parameters
+        ----------
+        method : str
+            HTTP method.
+        url : str
+            Absolute URL of the request.
+        attempt : int
+            The number of the attempt that failed, starting at 1.
+        error : httpx.HTTPError
+            The error the attempt failed with.
+        deadline : float, optional
+            Monotonic time by which the request must be over, if any.
+
+        Returns
+        -------
+        float, optional
+            The delay in seconds, or None if the request must not be retried.
+        """
+        policy = self.retry_policy
+        if attempt >= policy.max_attempts or not policy.is_retryable(method, error):
+            return None
+        delay = policy.delay(attempt=attempt, error=error)
+        if deadline is not None and time.monotonic() + delay >= deadline:
+            logger.warning(
+                "Retry deadline exceeded for %s %s", method, error.request.url
+            )
+            return None
+        return delay
+
+    @staticmethod
+    def _is_upstream_failure(error: httpx.HTTPError) -> bool:
+        """
+        Whether `error` indicates an unhealthy upstream rather than a bad request.
+
+        Parameters
+        ----------
+        error : httpx.HTTPError
+            The error an attempt failed with.
+
+        Returns
+        -------
+        bool
+            True for transport errors, server errors and 429 Too Many Requests.
+        """
+        if isinstance(error, httpx.HTTPStatusError):
+            status_code = error.response.status_code
+            return (
+                status_code >= HTTPStatus.INTERNAL_SERVER_ERROR
+                or status_code == HTTPStatus.TOO_MANY_REQUESTS
+            )
+        return True
 
     async def get(
         self,
         endpoint: str = "",
         headers: Optional[dict[str, Any]] = None,
         params: Optional[dict[str, Any]] = None,
+        before_attempt: Optional[Callable[[], Awaitable[Any]]] = None,
         **kwargs: Any,
     ) -> httpx.Response:
         """
@@ -87,6 +442,9 @@ class AsyncAPIClient:
             Additional headers for the request.
         params : dict, optional
             URL parameters.
+        before_attempt : Callable[[], Awaitable[Any]], optional
+            Coroutine function awaited before every attempt, e.g. a rate limiter's
+            `acquire`.
         **kwargs
             Additional keyword arguments for httpx.AsyncClient.request.
 
@@ -96,7 +454,12 @@ class AsyncAPIClient:
             The HTTP response object.
         """
         response = await self._request(
-            method="GET", endpoint=endpoint, headers=headers, params=params, **kwargs
+            method="GET",
+            endpoint=endpoint,
+            headers=headers,
+            params=params,
+            before_attempt=before_attempt,
+            **kwargs,
         )
         return response
 
@@ -106,6 +469,7 @@ class AsyncAPIClient:
         headers: Optional[dict[str, Any]] = None,
         params: Optional[dict[str, Any]] = None,
         payload: Optional[dict[str, Any]] = None,
+        before_attempt: Optional[Callable[[], Awaitable[Any]]] = None,
         **kwargs: Any,
     ) -> httpx.Response:
         """
@@ -121,6 +485,9 @@ class AsyncAPIClient:
             URL parameters.
         payload : dict, optional
             Request data.
+        before_attempt : Callable[[], Awaitable[Any]], optional
+            Coroutine function awaited before every attempt, e.g. a rate limiter's
+            `acquire`.
         **kwargs
             Additional keyword arguments for httpx.AsyncClient.request.
 
@@ -135,6 +502,7 @@ class AsyncAPIClient:
             headers=headers,
             params=params,
             payload=payload,
+            before_attempt=before_attempt,
             **kwargs,
         )
         return response
@@ -145,6 +513,7 @@ class AsyncAPIClient:
         headers: Optional[dict[str, Any]] = None,
         params: Optional[dict[str, Any]] = None,
         payload: Optional[dict[str, Any]] = None,
+        before_attempt: Optional[Callable[[], Awaitable[Any]]] = None,
         **kwargs: Any,
     ) -> httpx.Response:
         """
@@ -160,6 +529,9 @@ class AsyncAPIClient:
             URL parameters.
         payload : dict, optional
             Request data.
+        before_attempt : Callable[[], Awaitable[Any]], optional
+            Coroutine function awaited before every attempt, e.g. a rate limiter's
+            `acquire`.
         **kwargs
             Additional keyword arguments for httpx.AsyncClient.request.
 
@@ -174,6 +546,7 @@ class AsyncAPIClient:
             headers=headers,
             params=params,
             payload=payload,
+            before_attempt=before_attempt,
             **kwargs,
         )
         return response
@@ -184,6 +557,7 @@ class AsyncAPIClient:
         headers: Optional[dict[str, Any]] = None,
         params: Optional[dict[str, Any]] = None,
         payload: Optional[dict[str, Any]] = None,
+        before_attempt: Optional[Callable[[], Awaitable[Any]]] = None,
         **kwargs: Any,
     ) -> httpx.Response:
         """
@@ -199,6 +573,9 @@ class AsyncAPIClient:
             URL parameters.
         payload : dict, optional
             Request data.
+        before_attempt : Callable[[], Awaitable[Any]], optional
+            Coroutine function awaited before every attempt, e.g. a rate limiter's
+            `acquire`.
         **kwargs
             Additional keyword arguments for httpx.AsyncClient.request.
 
@@ -213,6 +590,7 @@ class AsyncAPIClient:
             headers=headers,
             params=params,
             payload=payload,
+            before_attempt=before_attempt,
             **kwargs,
         )
         return response
@@ -222,6 +600,7 @@ class AsyncAPIClient:
         endpoint: str = "",
         headers: Optional[dict[str, Any]] = None,
         params: Optional[dict[str, Any]] = None,
+        before_attempt: Optional[Callable[[], Awaitable[Any]]] = None,
         **kwargs: Any,
     ) -> httpx.Response:
         """
@@ -235,6 +614,9 @@ class AsyncAPIClient:
             Additional headers for the request.
         params : dict, optional
             URL parameters.
+        before_attempt : Callable[[], Awaitable[Any]], optional
+            Coroutine function awaited before every attempt, e.g. a rate limiter's
+            `acquire`.
         **kwargs
             Additional keyword arguments for httpx.AsyncClient.request.
 
@@ -244,7 +626,12 @@ class AsyncAPIClient:
             The HTTP response object.
         """
         response = await self._request(
-            method="DELETE", endpoint=endpoint, headers=headers, params=params, **kwargs
+            method="DELETE",
+            endpoint=endpoint,
+            headers=headers,
+            params=params,
+            before_attempt=before_attempt,
+            **kwargs,
         )
         return response
 
@@ -0,0 +1,171 @@
+"""Circuit breaker failing requests fast while an upstream host is unhealthy."""
+
+import logging
+import time
+from collections import deque
+from enum import StrEnum
+from typing import Callable
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitState(StrEnum):
+    """States of a circuit breaker."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(Exception):
+    """Raised when a call is rejected because the circuit is open."""
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker tripping on the failure rate of the most recent calls.
+
+    While closed, the outcomes of the last `window_size` calls are recorded, and the
+    circuit opens once at least `minimum_calls` have been recorded and the failure
+    rate reaches `failure_rate_threshold`. While open, calls are rejected immediately.
+    After `cooldown` seconds the circuit becomes half-open and lets through up to
+    `half_open_max_calls` probe calls: a successful probe closes the circuit, a failed
+    one opens it again for another cooldown.
+    """
+
+    def __init__(
+        self,
+        failure_rate_threshold: float = 0.5,
+        window_size: int = 20,
+        minimum_calls: int = 5,
+        cooldown: float = 30.0,
+        half_open_max_calls: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Initialize the CircuitBreaker in the closed state.
+
+        Parameters
+        ----------
+        failure_rate_threshold : float, optional
+            Failure rate, between 0 and 1, at which the circuit opens.
+        window_size : int, optional
+            Number of most recent call outcomes the failure rate is computed over.
+        minimum_calls : int, optional
+            Number of recorded outcomes required before the circuit may open.
+        cooldown : float, optional
+            Seconds the circuit stays open before letting probe calls through.
+        half_open_max_calls : int, optional
+            Maximum number of concurrent probe calls while half-open.
+        clock : Callable[[], float], optional
+            Monotonic clock returning seconds.
+
+        Raises
+        ------
+        ValueError
+            If an argument is out of range.
+        """
+        if not 0 < failure_rate_threshold <= 1:
+            raise ValueError("`failure_rate_threshold` must be in (0, 1].")
+        if window_size < 1 or not 1 <= minimum_calls <= window_size:
+            raise ValueError("`minimum_calls` must be between 1 and `window_size`.")
+        if cooldown < 0:
+            raise ValueError("`cooldown` must not be negative.")
+        if half_open_max_calls < 1:
+            raise ValueError("`half_open_max_calls` must be at least 1.")
+
+        self.failure_rate_threshold = failure_rate_threshold
+        self.minimum_calls = minimum_calls
+        self.cooldown = cooldown
+        self.half_open_max_calls = half_open_max_calls
+        self._clock = clock
+        self._outcomes: deque[bool] = deque(maxlen=window_size)
+        self._state = CircuitState.CLOSED
+        self._opened_at = 0.0
+        self._probes_in_flight = 0
+
+    @property
+    def state(self) -> CircuitState:
+        """The current state, moving from open to half-open once cooled down."""
+        if (
+            self._state is CircuitState.OPEN
+            and self._clock() - self._opened_at >= self.cooldown
+        ):
+            self._transition(CircuitState.HALF_OPEN)
+        return self._state
+
+    @property
+    def failure_rate(self) -> float:
+        """Failure rate of the recorded outcomes, 0.0 if there are none."""
+        if not self._outcomes:
+            return 0.0
+        return self._outcomes.count(False) / len(self._outcomes)
+
+    def before_call(self) -> None:
+        """
+        Check that a call may be made, reserving a probe slot when half-open.
+
+        Raises
+        ------
+        CircuitOpenError
+            If the circuit is open, or half-open with every probe slot in use.
+        """
+        state = self.state
+        if state is CircuitState.OPEN:
+            raise CircuitOpenError("Circuit is open, the call has been rejected.")
+        if state is CircuitState.HALF_OPEN:
+            if self._probes_in_flight >= self.half_open_max_calls:
+                raise CircuitOpenError("Circuit is half-open, waiting for probes.")
+            self._probes_in_flight += 1
+
+    def record_success(self) -> None:
+        """Record a successful call, closing the circuit after a successful probe."""
+        if self._state is CircuitState.HALF_OPEN:
+            self._release_probe()
+            self._outcomes.clear()
+            self._transition(CircuitState.CLOSED)
+        self._outcomes.append(True)
+
+    def record_failure(self) -> None:
+        """Record a failed call, opening the circuit if the failure rate is reached."""
+        if self._state is CircuitState.HALF_OPEN:
+            self._release_probe()
+            self._open()
+            return
+
+        self._outcomes.append(False)
+        if (
+            self._state is CircuitState.CLOSED
+            and len(self._outcomes) >= self.minimum_calls
+            and self.failure_rate >= self.failure_rate_threshold
+        ):
+            self._open()
+
+    def release(self) -> None:
+        """Release the probe slot of a call that ended without an outcome."""
+        if self._state is CircuitState.HALF_OPEN:
+            self._release_probe()
+
+    def _open(self) -> None:
+        """Open the circuit and start the cooldown."""
+        self._opened_at = self._clock()
+        self._transition(CircuitState.OPEN)
+
+    def _release_probe(self) -> None:
+        """Free one half-open probe slot."""
+        self._probes_in_flight = max(self._probes_in_flight - 1, 0)
+
+    def _transition(self, state: CircuitState) -> None:
+        """Move to `state`, logging the change."""
+        if state is not self._state:
+            logger.warning("Circuit breaker state: %s -> %s", self._state, state)
+            self._state = state
+            self._probes_in_flight = 0
+
+    def __repr__(self) -> str:
+        """Return an unambiguous string representation of the circuit breaker."""
+        return (
+            f"CircuitBreaker(state={self._state}, "
+            f"failure_rate_threshold={self.failure_rate_threshold}, "
+            f"cooldown={self.cooldown})"
+        )
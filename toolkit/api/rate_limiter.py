@@ -0,0 +1,223 @@
+"""Asynchronous rate limiters for pacing outgoing API requests."""
+
+import asyncio
+import logging
+import time
+from abc import ABC, abstractmethod
+from datetime import date, datetime, timezone
+from typing import Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class RateLimitExceededError(Exception):
+    """Raised when a request would exceed a hard (non-refilling) request budget."""
+
+
+class RateLimiterInterface(ABC):
+    """Abstract base class for asynchronous rate limiters."""
+
+    @abstractmethod
+    async def acquire(self) -> None:
+        """
+        Wait until a single request is allowed to be sent.
+
+        Raises
+        ------
+        RateLimitExceededError
+            If the request can not be allowed without exceeding a hard budget.
+        """
+
+    def pause(self, delay: float) -> None:
+        """
+        Hold back every request for the next `delay` seconds.
+
+        Called when the remote API reports that its quota window is exhausted. The
+        default implementation ignores the request; limiters able to pause should
+        override it.
+
+        Parameters
+        ----------
+        delay : float
+            Seconds to wait before sending the next request.
+        """
+
+    def exhaust_daily_budget(self) -> None:
+        """
+        Refuse every request until the daily budget resets.
+
+        Called when the remote API reports that the daily quota is used up. The
+        default implementation ignores the request; limiters tracking a daily budget
+        should override it.
+        """
+
+
+class TokenBucketRateLimiter(RateLimiterInterface):
+    """
+    Token bucket rate limiter with a burst size, sustained rate and daily budget.
+
+    The bucket holds up to `burst` tokens and refills continuously at `rate` tokens
+    per second. Each request consumes one token. Waiting requests are served in FIFO
+    order, and each one sleeps exactly until the next token is available instead of
+    polling in fixed intervals. The limiter can also be paused, or have its daily
+    budget marked as exhausted, when the remote API reports a quota it enforces.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int = 1,
+        daily_budget: Optional[int] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Initialize the TokenBucketRateLimiter.
+
+        Parameters
+        ----------
+        rate : float
+            Sustained rate in tokens (requests) per second.
+        burst : int, optional
+            Bucket capacity, i.e. how many requests may be sent back to back.
+        daily_budget : int, optional
+            Maximum number of requests per UTC day. Unlimited if not given.
+        clock : Callable[[], float], optional
+            Monotonic clock returning seconds, used for refilling the bucket.
+
+        Raises
+        ------
+        ValueError
+            If `rate` or `burst` is not positive.
+        """
+        if rate <= 0:
+            raise ValueError("`rate` must be positive.")
+        if burst < 1:
+            raise ValueError("`burst` must be at least 1.")
+
+        self.rate = rate
+        self.burst = burst
+        self.daily_budget = daily_budget
+        self._clock = clock
+        self._tokens = float(burst)
+        self._last_refill = clock()
+        self._lock = asyncio.Lock()
+        self._paused_until = self._last_refill
+        self._budget_day = self._today()
+        self._daily_used = 0
+        self._daily_budget_exhausted = False
+
+    @property
+    def remaining_daily_budget(self) -> Optional[int]:
+        """Requests left in today's budget, or None if there is no daily budget."""
+        if self.daily_budget is None:
+            return None
+        self._reset_daily_budget_if_needed()
+        if self._daily_budget_exhausted:
+            return 0
+        return max(self.daily_budget - self._daily_used, 0)
+
+    @property
+    def paused(self) -> bool:
+        """Whether requests are currently held back by `pause`."""
+        return self._clock() < self._paused_until
+
+    async def acquire(self) -> None:
+        """
+        Wait until the limiter is not paused and a token is available, and consume it.
+
+        The pause is checked again after every wait, so a pause started while the
+        request was waiting for a token still holds it back.
+
+        Raises
+        ------
+        RateLimitExceededError
+            If the daily budget has been used up.
+        """
+        async with self._lock:
+            self._reserve_daily_budget()
+            while True:
+                pause = self._paused_until - self._clock()
+                if pause > 0:
+                    logger.info("Rate limiter paused, waiting %.3fs.", pause)
+                    await asyncio.sleep(pause)
+                    continue
+                self._refill()
+                if self._tokens >= 1:
+                    break
+                delay = (1 - self._tokens) / self.rate
+                logger.debug("Rate limit reached, waiting %.3fs for a token.", delay)
+                await asyncio.sleep(delay)
+            self._tokens -= 1
+
+    def pause(self, delay: float) -> None:
+        """
+        Hold back every request for the next `delay` seconds.
+
+        Overlapping pauses do not add up: the one ending last wins.
+
+        Parameters
+        ----------
+        delay : float
+            Seconds to wait before sending the next request.
+        """
+        paused_until = self._clock() + delay
+        if paused_until > self._paused_until:
+            logger.warning("Pausing requests for %.3fs.", delay)
+            self._paused_until = paused_until
+
+    def exhaust_daily_budget(self) -> None:
+        """Refuse every request until the UTC day changes."""
+        self._reset_daily_budget_if_needed()
+        if not self._daily_budget_exhausted:
+            logger.warning("Daily request budget marked as exhausted.")
+            self._daily_budget_exhausted = True
+
+    def _refill(self) -> None:
+        """Add the tokens accumulated since the last refill, capped at `burst`."""
+        now = self._clock()
+        elapsed = now - self._last_refill
+        self._tokens = min(self.burst, self._tokens + elapsed * self.rate)
+        self._last_refill = now
+
+    def _reserve_daily_budget(self) -> None:
+        """
+        Count a request against the daily budget.
+
+        Raises
+        ------
+        RateLimitExceededError
+            If the daily budget has been used up.
+        """
+        self._reset_daily_budget_if_needed()
+        if self._daily_budget_exhausted:
+            msg = "Daily request budget is exhausted."
+            logger.warning(msg)
+            raise RateLimitExceededError(msg)
+        if self.daily_budget is None:
+            return
+        if self._daily_used >= self.daily_budget:
+            msg = f"Daily request budget of {self.daily_budget} is exhausted."
+            logger.warning(msg)
+            raise RateLimitExceededError(msg)
+        self._daily_used += 1
+
+    def _reset_daily_budget_if_needed(self) -> None:
+        """Reset the daily counter when the UTC day has changed."""
+        today = self._today()
+        if today != self._budget_day:
+            self._budget_day = today
+            self._daily_used = 0
+            self._daily_budget_exhausted = False
+
+    @staticmethod
+    def _today() -> date:
+        """Return the current UTC date."""
+        return datetime.now(timezone.utc).date()
+
+    def __repr__(self) -> str:
+        """Return an unambiguous string representation of the rate limiter."""
+        return (
+            f"TokenBucketRateLimiter(rate={self.rate}, "
+            f"burst={self.burst}, "
+            f"daily_budget={self.daily_budget})"
+        )
@@ -0,0 +1,149 @@
+"""Retry policy with exponential backoff and full jitter for HTTP requests."""
+
+import math
+import random
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from http import HTTPStatus
+from typing import Optional
+
+import httpx
+
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+RETRYABLE_STATUS_CODES = frozenset(
+    {
+        HTTPStatus.TOO_MANY_REQUESTS,
+        HTTPStatus.INTERNAL_SERVER_ERROR,
+        HTTPStatus.BAD_GATEWAY,
+        HTTPStatus.SERVICE_UNAVAILABLE,
+        HTTPStatus.GATEWAY_TIMEOUT,
+    }
+)
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """
+    Dataclass describing when and how long to wait before retrying a request.
+
+    Only idempotent methods are retried by default. The delay before a retry is the
+    server's `Retry-After` when given, otherwise a full jitter exponential backoff:
+    a random duration between zero and `backoff_base * 2 ** (attempt - 1)`, capped at
+    `backoff_max`. No retry is attempted once `deadline` seconds would be exceeded.
+    """
+
+    max_attempts: int = 3
+    backoff_base: float = 0.5
+    backoff_max: float = 10.0
+    deadline: Optional[float] = 30.0
+    methods: frozenset[str] = field(default=IDEMPOTENT_METHODS)
+    status_codes: frozenset[int] = field(default=RETRYABLE_STATUS_CODES)
+
+    def __post_init__(self) -> None:
+        """Validate the policy.
+
+        Raises
+        ------
+        ValueError
+            If `max_attempts` is not positive or a duration is negative.
+        """
+        if self.max_attempts < 1:
+            raise ValueError("`max_attempts` must be at least 1.")
+        if self.backoff_base < 0 or self.backoff_max < 0:
+            raise ValueError("Backoff durations must not be negative.")
+        if self.deadline is not None and self.deadline <= 0:
+            raise ValueError("`deadline` must be positive.")
+
+    def is_retryable(self, method: str, error: Exception) -> bool:
+        """
+        Whether a request failing with `error` may be retried.
+
+        Parameters
+        ----------
+        method : str
+            The HTTP method of the request.
+        error : Exception
+            The error the request failed with.
+
+        Returns
+        -------
+        bool
+            True for transport errors and retryable status codes of allowed methods.
+        """
+        if method.upper() not in self.methods:
+            return False
+        if isinstance(error, httpx.HTTPStatusError):
+            return error.response.status_code in self.status_codes
+        return isinstance(error, httpx.TransportError)
+
+    def backoff(self, attempt: int) -> float:
+        """
+        Return the full jitter delay before the retry following `attempt`.
+
+        Parameters
+        ----------
+        attempt : int
+            The number of the attempt that just failed, starting at 1.
+
+        Returns
+        -------
+        float
+            The delay in seconds.
+        """
+        ceiling = min(self.backoff_max, self.backoff_base * 2 ** (attempt - 1))
+        return random.uniform(0, ceiling)
+
+    def delay(self, attempt: int, error: Exception) -> float:
+        """
+        Return the delay before the retry following `attempt`, honoring Retry-After.
+
+        Parameters
+        ----------
+        attempt : int
+            The number of the attempt that just failed, starting at 1.
+        error : Exception
+            The error the attempt failed with.
+
+        Returns
+        -------
+        float
+            The delay in seconds.
+        """
+        if isinstance(error, httpx.HTTPStatusError):
+            retry_after = parse_retry_after(error.response)
+            if retry_after is not None:
+                return retry_after
+        return self.backoff(attempt)
+
+
+def parse_retry_after(response: httpx.Response) -> Optional[float]:
+    """
+    Parse the `Retry-After` header of a response.
+
+    Parameters
+    ----------
+    response : httpx.Response
+        The response carrying the header.
+
+    Returns
+    -------
+    float, optional
+        The seconds to wait, or None if the header is missing or invalid.
+    """
+    value = response.headers.get("Retry-After")
+    if value is None:
+        return None
+    try:
+        seconds = float(value)
+    except ValueError:
+        pass
+    else:
+        return max(seconds, 0.0) if math.isfinite(seconds) else None
+    try:
+        retry_at: datetime = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
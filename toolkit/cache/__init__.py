@@ -0,0 +1,3 @@
+from .ttl_cache import CacheStats, TTLCache
+
+__all__ = ["CacheStats", "TTLCache"]
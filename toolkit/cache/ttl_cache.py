@@ -0,0 +1,139 @@
+"""In-memory cache with per-entry time-to-live and least-recently-used eviction."""
+
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+from dataclasses import dataclass
+from typing import Callable, Generic, Optional, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+@dataclass
+class CacheStats:
+    """Counters describing how a cache has been used."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        """Fraction of lookups served from the cache, 0.0 if there were none."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class TTLCache(Generic[K, V]):
+    """
+    Cache with a per-entry time-to-live and a bounded number of entries.
+
+    Entries expire `ttl` seconds after they have been set. Once `max_entries` entries
+    are held, the least recently used one is evicted to make room for a new one.
+    """
+
+    def __init__(
+        self,
+        ttl: float,
+        max_entries: int,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Initialize the TTLCache.
+
+        Parameters
+        ----------
+        ttl : float
+            Seconds an entry stays valid after it has been set.
+        max_entries : int
+            Maximum number of entries held at the same time.
+        clock : Callable[[], float], optional
+            Monotonic clock returning seconds, used for expiring entries.
+
+        Raises
+        ------
+        ValueError
+            If `ttl` or `max_entries` is not positive.
+        """
+        if ttl <= 0:
+            raise ValueError("`ttl` must be positive.")
+        if max_entries < 1:
+            raise ValueError("`max_entries` must be at least 1.")
+
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.stats = CacheStats()
+        self._clock = clock
+        self._entries: OrderedDict[K, tuple[float, V]] = OrderedDict()
+
+    def get(self, key: K, default: Optional[V] = None) -> Optional[V]:
+        """
+        Return the cached value for `key`, or `default` if missing or expired.
+
+        Parameters
+        ----------
+        key : Hashable
+            The cache key.
+        default : Any, optional
+            Value returned when there is no valid entry for `key`.
+
+        Returns
+        -------
+        Any
+            The cached value or `default`.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self.stats.misses += 1
+            return default
+
+        expires_at, value = entry
+        if expires_at <= self._clock():
+            del self._entries[key]
+            self.stats.expirations += 1
+            self.stats.misses += 1
+            return default
+
+        self._entries.move_to_end(key)
+        self.stats.hits += 1
+        return value
+
+    def set(self, key: K, value: V) -> None:
+        """
+        Store `value` under `key`, evicting the least recently used entry if full.
+
+        Parameters
+        ----------
+        key : Hashable
+            The cache key.
+        value : Any
+            The value to cache.
+        """
+        self._entries[key] = (self._clock() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.stats.evictions += 1
+
+    def invalidate(self, key: K) -> None:
+        """Remove the entry for `key`, if any."""
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove every entry, keeping the statistics."""
+        self._entries.clear()
+
+    def __contains__(self, key: object) -> bool:
+        """Whether `key` has an entry that has not expired yet."""
+        entry = self._entries.get(key)  # type: ignore[arg-type]
+        return entry is not None and entry[0] > self._clock()
+
+    def __len__(self) -> int:
+        """Return the number of stored entries, including not yet purged ones."""
+        return len(self._entries)
+
+    def __repr__(self) -> str:
+        """Return an unambiguous string representation of the cache."""
+        return f"TTLCache(ttl={self.ttl}, max_entries={self.max_entries})"
@@ -0,0 +1,4 @@
+from .scheduler import run_periodically
+from .single_flight import SingleFlight
+
+__all__ = ["SingleFlight", "run_periodically"]
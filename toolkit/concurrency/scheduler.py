@@ -0,0 +1,59 @@
+"""Periodic scheduling of asynchronous callbacks."""
+
+import asyncio
+import logging
+import random
+import time
+from collections.abc import Awaitable
+from typing import Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+async def run_periodically(
+    callback: Callable[[], Awaitable[None]],
+    interval: float,
+    jitter: float = 0.0,
+    stop_event: Optional[asyncio.Event] = None,
+) -> None:
+    """
+    Await `callback` every `interval` seconds until `stop_event` is set.
+
+    Runs are scheduled at a fixed rate from the start of the previous run, delayed by
+    a random jitter in `[0, jitter]` seconds so that several pollers do not stay in
+    lockstep. A run that overruns the interval is followed immediately by the next
+    one; runs never overlap.
+
+    Parameters
+    ----------
+    callback : Callable[[], Awaitable[None]]
+        The coroutine function to run periodically.
+    interval : float
+        Seconds between the start of two consecutive runs.
+    jitter : float, optional
+        Maximum random delay, in seconds, added to every scheduled run.
+    stop_event : asyncio.Event, optional
+        Event that stops the scheduling once set. Runs forever if not given.
+
+    Raises
+    ------
+    ValueError
+        If `interval` is not positive or `jitter` is negative.
+    """
+    if interval <= 0:
+        raise ValueError("`interval` must be positive.")
+    if jitter < 0:
+        raise ValueError("`jitter` must not be negative.")
+
+    stop_event = stop_event or asyncio.Event()
+    while not stop_event.is_set():
+        started_at = time.monotonic()
+        await callback()
+
+        elapsed = time.monotonic() - started_at
+        delay = max(interval - elapsed, 0.0) + random.uniform(0, jitter)
+        logger.debug("Next periodic run in %.3fs.", delay)
+        try:
+            await asyncio.wait_for(stop_event.wait(), timeout=delay)
+        except asyncio.TimeoutError:
+            continue
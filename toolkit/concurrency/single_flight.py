@@ -0,0 +1,139 @@
+"""Duplicate call suppression for concurrent asynchronous operations."""
+
+import asyncio
+from collections.abc import Awaitable, Hashable, Iterable, Mapping
+from functools import partial
+from typing import Callable, Generic, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class _MissingKeyError(KeyError):
+    """Raised to callers of a key that a batch execution returned no value for."""
+
+
+class SingleFlight(Generic[K, V]):
+    """
+    Coalesce concurrent calls sharing a key into a single execution.
+
+    While a call for a key is in flight, later callers for the same key do not start
+    a new call but await the result (or exception) of the one already running.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the SingleFlight with no calls in flight."""
+        self._in_flight: dict[K, asyncio.Future[V]] = {}
+
+    @property
+    def in_flight(self) -> int:
+        """Number of distinct keys currently being executed."""
+        return len(self._in_flight)
+
+    async def do(self, key: K, func: Callable[[], Awaitable[V]]) -> V:
+        """
+        Execute `func` for `key`, or join the execution already in flight.
+
+        Cancelling one caller does not cancel the shared execution for the others.
+
+        Parameters
+        ----------
+        key : Hashable
+            Key identifying duplicate calls.
+        func : Callable[[], Awaitable]
+            Factory of the awaitable to execute; only called if nothing is in flight.
+
+        Returns
+        -------
+        Any
+            The result of the shared execution.
+        """
+        future = self._in_flight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(func())
+            self._in_flight[key] = future
+            future.add_done_callback(lambda _: self._forget(key, future))
+        return await asyncio.shield(future)
+
+    async def do_many(
+        self,
+        keys: Iterable[K],
+        func: Callable[[list[K]], Awaitable[Mapping[K, V]]],
+    ) -> dict[K, V]:
+        """
+        Execute `func` once for the keys not in flight, and join the others.
+
+        Every key is coalesced on its own: the keys already in flight, whether
+        started by `do` or by another `do_many`, join those executions, and the rest
+        are executed in a single batch whose result later callers of any of its keys
+        join. Cancelling one caller does not cancel the shared executions for the
+        others.
+
+        Parameters
+        ----------
+        keys : Iterable[Hashable]
+            Keys identifying duplicate calls; repeated keys are executed once.
+        func : Callable[[list[Hashable]], Awaitable[Mapping]]
+            Factory of the awaitable executing the given keys and mapping them to
+            their results; only called if some keys are not in flight.
+
+        Returns
+        -------
+        dict
+            Mapping of each key to its result, in the order of `keys`. Keys the batch
+            returned no result for are left out.
+        """
+        futures: dict[K, asyncio.Future[V]] = {}
+        batch_keys: list[K] = []
+        for key in keys:
+            if key in futures:
+                continue
+            future = self._in_flight.get(key)
+            if future is None:
+                future = asyncio.get_running_loop().create_future()
+                self._in_flight[key] = future
+                future.add_done_callback(partial(self._forget, key))
+                batch_keys.append(key)
+            futures[key] = future
+
+        if batch_keys:
+            batch = asyncio.ensure_future(func(batch_keys))
+            batch.add_done_callback(
+                lambda _: self._settle({key: futures[key] for key in batch_keys}, batch)
+            )
+
+        results = await asyncio.shield(
+            asyncio.gather(*futures.values(), return_exceptions=True)
+        )
+        values: dict[K, V] = {}
+        for key, result in zip(futures, results):
+            if isinstance(result, _MissingKeyError):
+                continue
+            if isinstance(result, BaseException):
+                raise result
+            values[key] = result
+        return values
+
+    @staticmethod
+    def _settle(
+        futures: Mapping[K, asyncio.Future[V]], batch: asyncio.Future[Mapping[K, V]]
+    ) -> None:
+        """Resolve the future of each key of a finished batch with its outcome."""
+        for key, future in futures.items():
+            if future.done():
+                continue
+            if batch.cancelled():
+                future.cancel()
+                continue
+            error = batch.exception()
+            if error is not None:
+                future.set_exception(error)
+            elif key in batch.result():
+                future.set_result(batch.result()[key])
+            else:
+                future.set_exception(_MissingKeyError(key))
+
+    def _forget(self, key: K, future: asyncio.Future[V]) -> None:
+        """Remove the finished `future` of `key` from the in-flight calls."""
+        if self._in_flight.get(key) is future:
+            del self._in_flight[key]
@@ -0,0 +1,11 @@
+from .metrics import Counter, Gauge, Histogram, timed
+from .registry import PROMETHEUS_CONTENT_TYPE, MetricsRegistry
+
+__all__ = [
+    "PROMETHEUS_CONTENT_TYPE",
+    "Counter",
+    "Gauge",
+    "Histogram",
+    "MetricsRegistry",
+    "timed",
+]
@@ -0,0 +1,196 @@
+"""Counters, gauges and HDR-style latency histograms."""
+
+import time
+from collections.abc import Iterator
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from typing import Optional
+
+
+class Counter:
+    """Monotonically increasing count of events."""
+
+    def __init__(self) -> None:
+        """Initialize the Counter at zero."""
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        """
+        Increase the count.
+
+        Parameters
+        ----------
+        amount : float, optional
+            Non-negative amount to add.
+
+        Raises
+        ------
+        ValueError
+            If `amount` is negative.
+        """
+        if amount < 0:
+            raise ValueError("A counter can only increase.")
+        self.value += amount
+
+
+class Gauge:
+    """Value that can go up and down, such as a number of in-flight requests."""
+
+    def __init__(self) -> None:
+        """Initialize the Gauge at zero."""
+        self.value = 0.0
+
+    def set(self, value: float) -> None:
+        """Set the value."""
+        self.value = value
+
+    def inc(self, amount: float = 1.0) -> None:
+        """Increase the value."""
+        self.value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        """Decrease the value."""
+        self.value -= amount
+
+
+class Histogram:
+    """
+    Histogram of non-negative values with a bounded relative error, in HDR style.
+
+    Values are scaled to integer multiples of `unit` and counted in log-linear
+    buckets: each power of two is split into `2 ** precision_bits` linear
+    sub-buckets, so any percentile is reported within `2 ** -precision_bits` of the
+    recorded value whatever its magnitude, while the number of buckets only grows
+    with the logarithm of the range. Recording a value is O(1) and allocates nothing
+    once its bucket exists.
+    """
+
+    def __init__(self, unit: float = 1e-6, precision_bits: int = 5) -> None:
+        """
+        Initialize the Histogram.
+
+        Parameters
+        ----------
+        unit : float, optional
+            Resolution of the recorded values. Defaults to a microsecond, for
+            latencies recorded in seconds.
+        precision_bits : int, optional
+            Base-2 logarithm of the number of sub-buckets per power of two.
+
+        Raises
+        ------
+        ValueError
+            If `unit` or `precision_bits` is not positive.
+        """
+        if unit <= 0:
+            raise ValueError("`unit` must be positive.")
+        if precision_bits < 1:
+            raise ValueError("`precision_bits` must be at least 1.")
+
+        self.unit = unit
+        self.precision_bits = precision_bits
+        self.count = 0
+        self.sum = 0.0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+        self._sub_buckets = 1 << precision_bits
+        self._counts: dict[int, int] = {}
+
+    def record(self, value: float) -> None:
+        """
+        Record a value.
+
+        Parameters
+        ----------
+        value : float
+            The non-negative value, e.g. a latency in seconds.
+
+        Raises
+        ------
+        ValueError
+            If `value` is negative.
+        """
+        if value < 0:
+            raise ValueError("A histogram only records non-negative values.")
+        index = self._index(int(value / self.unit))
+        self._counts[index] = self._counts.get(index, 0) + 1
+        self.count += 1
+        self.sum += value
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+
+    @contextmanager
+    def time(self) -> Iterator[None]:
+        """Record the wall time, in seconds, spent in the `with` block."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(time.perf_counter() - start)
+
+    def percentile(self, q: float) -> Optional[float]:
+        """
+        Return a percentile of the recorded values.
+
+        Parameters
+        ----------
+        q : float
+            The percentile, between 0 and 100.
+
+        Returns
+        -------
+        float, optional
+            The middle of the bucket holding the percentile, clamped to the recorded
+            range, or None if nothing was recorded. The 0th and 100th percentiles
+            are the exact minimum and maximum.
+        """
+        if self.min is None or self.max is None:
+            return None
+        if q <= 0:
+            return self.min
+        if q >= 100:
+            return self.max
+        rank = max(q / 100 * self.count, 1)
+        seen = 0
+        for index in sorted(self._counts):
+            seen += self._counts[index]
+            if seen >= rank:
+                break
+        low, high = self._bounds(index)
+        value = (low + high) / 2 * self.unit
+        return min(max(value, self.min), self.max)
+
+    def _index(self, scaled: int) -> int:
+        """Return the bucket index of a value scaled to units."""
+        sub_buckets = self._sub_buckets
+        if scaled < sub_buckets:
+            return scaled
+        shift = scaled.bit_length() - self.precision_bits - 1
+        return (shift + 1) * sub_buckets + (scaled >> shift) - sub_buckets
+
+    def _bounds(self, index: int) -> tuple[int, int]:
+        """Return the scaled lower and upper bounds of a bucket."""
+        sub_buckets = self._sub_buckets
+        if index < sub_buckets:
+            return index, index + 1
+        shift = index // sub_buckets - 1
+        sub_bucket = index % sub_buckets + sub_buckets
+        return sub_bucket << shift, (sub_bucket + 1) << shift
+
+
+def timed(histogram: Optional[Histogram]) -> AbstractContextManager[None]:
+    """
+    Return a context manager timing its block into the histogram, if there is one.
+
+    Parameters
+    ----------
+    histogram : Histogram, optional
+        The histogram recording the wall time of the block, in seconds.
+
+    Returns
+    -------
+    AbstractContextManager[None]
+        `histogram.time()`, or a no-op context manager if metrics are disabled.
+    """
+    return nullcontext() if histogram is None else histogram.time()
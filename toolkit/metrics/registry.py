@@ -0,0 +1,273 @@
+"""Registry of named metrics, exportable as JSON or Prometheus text."""
+
+import json
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Optional, Union
+
+from .metrics import Counter, Gauge, Histogram
+
+Metric = Union[Counter, Gauge, Histogram]
+LabelKey = tuple[tuple[str, str], ...]
+
+SNAPSHOT_PERCENTILES = (50.0, 90.0, 95.0, 99.0)
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+_TYPES: dict[type[Metric], str] = {
+    Counter: "counter",
+    Gauge: "gauge",
+    Histogram: "summary",
+}
+
+
+@dataclass
+class _Family:
+    """Metrics sharing a name and a type, told apart by their labels."""
+
+    kind: type[Metric]
+    help: str
+    metrics: dict[LabelKey, Metric] = field(default_factory=dict)
+
+
+class MetricsRegistry:
+    """
+    Registry creating metrics on first use and exporting snapshots of them.
+
+    Metrics are identified by a name and optional labels, following the Prometheus
+    data model. Asking twice for the same metric returns the same instance, so
+    components can look their metrics up once and update them cheaply afterwards.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty MetricsRegistry."""
+        self._families: dict[str, _Family] = {}
+
+    def counter(
+        self, name: str, help: str = "", labels: Optional[Mapping[str, str]] = None
+    ) -> Counter:
+        """
+        Return the counter with the given name and labels, creating it if needed.
+
+        Parameters
+        ----------
+        name : str
+            Name of the metric, e.g. `http_requests_total`.
+        help : str, optional
+            Description of the metric, kept from its first registration.
+        labels : Mapping[str, str], optional
+            Labels telling apart the metrics of the same name.
+
+        Returns
+        -------
+        Counter
+            The counter.
+
+        Raises
+        ------
+        ValueError
+            If a metric of another type is registered under the same name.
+        """
+        metric = self._get(Counter, name, help, labels)
+        assert isinstance(metric, Counter)
+        return metric
+
+    def gauge(
+        self, name: str, help: str = "", labels: Optional[Mapping[str, str]] = None
+    ) -> Gauge:
+        """
+        Return the gauge with the given name and labels, creating it if needed.
+
+        Parameters
+        ----------
+        name : str
+            Name of the metric.
+        help : str, optional
+            Description of the metric, kept from its first registration.
+        labels : Mapping[str, str], optional
+            Labels telling apart the metrics of the same name.
+
+        Returns
+        -------
+        Gauge
+            The gauge.
+
+        Raises
+        ------
+        ValueError
+            If a metric of another type is registered under the same name.
+        """
+        metric = self._get(Gauge, name, help, labels)
+        assert isinstance(metric, Gauge)
+        return metric
+
+    def histogram(
+        self, name: str, help: str = "", labels: Optional[Mapping[str, str]] = None
+    ) -> Histogram:
+        """
+        Return the histogram with the given name and labels, creating it if needed.
+
+        Parameters
+        ----------
+        name : str
+            Name of the metric, e.g. `http_request_duration_seconds`.
+        help : str, optional
+            Description of the metric, kept from its first registration.
+        labels : Mapping[str, str], optional
+            Labels telling apart the metrics of the same name.
+
+        Returns
+        -------
+        Histogram
+            The histogram, recording seconds with a microsecond resolution.
+
+        Raises
+        ------
+        ValueError
+            If a metric of another type is registered under the same name.
+        """
+        metric = self._get(Histogram, name, help, labels)
+        assert isinstance(metric, Histogram)
+        return metric
+
+    def snapshot(self) -> dict[str, Any]:
+        """
+        Return the current value of every metric as JSON-serializable data.
+
+        Returns
+        -------
+        dict[str, Any]
+            For each metric name, its type, help and one sample per label set.
+            Histogram samples hold their count, sum, min, max and percentiles.
+        """
+        return {
+            name: {
+                "type": _TYPES[family.kind],
+                "help": family.help,
+                "samples": [
+                    {"labels": dict(key), **_sample(metric)}
+                    for key, metric in family.metrics.items()
+                ],
+            }
+            for name, family in sorted(self._families.items())
+        }
+
+    def to_json(self) -> str:
+        """Return the snapshot of the metrics as a JSON document."""
+        return json.dumps(self.snapshot(), indent=2)
+
+    def to_prometheus(self) -> str:
+        """
+        Return the metrics in the Prometheus text exposition format.
+
+        Histograms are exposed as summaries with quantiles, a sum and a count.
+
+        Returns
+        -------
+        str
+            The exposition, ending with a new line.
+        """
+        lines = []
+        for name, family in sorted(self._families.items()):
+            if family.help:
+                lines.append(f"# HELP {name} {_escape(family.help, quote=False)}")
+            lines.append(f"# TYPE {name} {_TYPES[family.kind]}")
+            for key, metric in family.metrics.items():
+                if isinstance(metric, Histogram):
+                    lines.extend(_summary_lines(name, key, metric))
+                else:
+                    lines.append(f"{name}{_labels(key)} {_number(metric.value)}")
+        return "\n".join(lines) + "\n"
+
+    def write(self, path: Path, format: Optional[str] = None) -> None:
+        """
+        Write a snapshot of the metrics to a file, replacing it atomically.
+
+        Parameters
+        ----------
+        path : Path
+            The destination file.
+        format : str, optional
+            `"json"` or `"prometheus"`. Defaults to Prometheus for `.prom` and
+            `.txt` files and to JSON otherwise.
+
+        Raises
+        ------
+        ValueError
+            If `format` is unknown.
+        """
+        if format is None:
+            format = "prometheus" if path.suffix in {".prom", ".txt"} else "json"
+        if format == "json":
+            content = self.to_json()
+        elif format == "prometheus":
+            content = self.to_prometheus()
+        else:
+            raise ValueError(f"Unknown metrics format: {format!r}.")
+        temporary = path.with_name(f".{path.name}.tmp")
+        temporary.write_text(content, encoding="utf-8")
+        temporary.replace(path)
+
+    def _get(
+        self,
+        kind: type[Metric],
+        name: str,
+        help: str,
+        labels: Optional[Mapping[str, str]],
+    ) -> Metric:
+        """Return the metric of a name and labels, creating it if needed."""
+        family = self._families.get(name)
+        if family is None:
+            family = self._families[name] = _Family(kind=kind, help=help)
+        elif family.kind is not kind:
+            raise ValueError(
+                f"Metric {name!r} is already registered as a {_TYPES[family.kind]}."
+            )
+        key = tuple(sorted(labels.items())) if labels else ()
+        metric = family.metrics.get(key)
+        if metric is None:
+            metric = family.metrics[key] = kind()
+        return metric
+
+
+def _sample(metric: Metric) -> dict[str, Any]:
+    """Return the snapshot values of a metric."""
+    if not isinstance(metric, Histogram):
+        return {"value": metric.value}
+    return {
+        "count": metric.count,
+        "sum": metric.sum,
+        "min": metric.min,
+        "max": metric.max,
+        **{f"p{q:g}": metric.percentile(q) for q in SNAPSHOT_PERCENTILES},
+    }
+
+
+def _summary_lines(name: str, key: LabelKey, histogram: Histogram) -> list[str]:
+    """Return the exposition lines of a histogram as a Prometheus summary."""
+    lines = []
+    for q in SNAPSHOT_PERCENTILES:
+        value = histogram.percentile(q)
+        quantile_key = (*key, ("quantile", f"{q / 100:g}"))
+        lines.append(f"{name}{_labels(quantile_key)} {_number(value)}")
+    lines.append(f"{name}_sum{_labels(key)} {_number(histogram.sum)}")
+    lines.append(f"{name}_count{_labels(key)} {histogram.count}")
+    return lines
+
+
+def _labels(key: LabelKey) -> str:
+    """Format labels as a Prometheus label set."""
+    if not key:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in key) + "}"
+
+
+def _escape(text: str, quote: bool = True) -> str:
+    """Escape a label value or help text for the Prometheus text format."""
+    text = text.replace("\\", "\\\\").replace("\n", "\\n")
+    return text.replace('"', '\\"') if quote else text
+
+
+def _number(value: Optional[float]) -> str:
+    """Format a sample value, with NaN for a missing one."""
+    return "NaN" if value is None else repr(float(value))
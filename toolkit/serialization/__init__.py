@@ -0,0 +1,15 @@
+from .json_decoder import (
+    JSONDecoderInterface,
+    MsgspecJSONDecoder,
+    OrjsonJSONDecoder,
+    StdlibJSONDecoder,
+    get_json_decoder,
+)
+
+__all__ = [
+    "JSONDecoderInterface",
+    "MsgspecJSONDecoder",
+    "OrjsonJSONDecoder",
+    "StdlibJSONDecoder",
+    "get_json_decoder",
+]
@@ -0,0 +1,196 @@
+"""Pluggable JSON decoders with optional fast backends.
+
+Every backend decodes a document to the same plain Python values (dicts, lists,
+strings and numbers) as `json.loads`, never to typed structures, so the backends are
+interchangeable and only the parsing speed differs.
+"""
+
+import importlib
+import json
+import logging
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class JSONDecoderInterface(ABC):
+    """Abstract base class for decoding raw JSON bytes."""
+
+    name: str
+
+    @abstractmethod
+    def decode(self, data: bytes) -> Any:
+        """
+        Decode a JSON document.
+
+        Parameters
+        ----------
+        data : bytes
+            The raw, UTF-8 encoded JSON document.
+
+        Returns
+        -------
+        Any
+            The decoded document.
+
+        Raises
+        ------
+        json.JSONDecodeError
+            If the document is not valid JSON.
+        """
+
+
+class StdlibJSONDecoder(JSONDecoderInterface):
+    """JSON decoder based on the standard library `json` module."""
+
+    name = "json"
+
+    def decode(self, data: bytes) -> Any:
+        """
+        Decode a JSON document with `json.loads`.
+
+        Parameters
+        ----------
+        data : bytes
+            The raw, UTF-8 encoded JSON document.
+
+        Returns
+        -------
+        Any
+            The decoded document.
+
+        Raises
+        ------
+        json.JSONDecodeError
+            If the document is not valid JSON.
+        """
+        return json.loads(data)
+
+
+class OrjsonJSONDecoder(JSONDecoderInterface):
+    """JSON decoder based on `orjson`, which parses bytes without decoding them."""
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        """
+        Initialize the OrjsonJSONDecoder.
+
+        Raises
+        ------
+        ImportError
+            If `orjson` is not installed.
+        """
+        self._loads: Callable[[bytes], Any] = importlib.import_module("orjson").loads
+
+    def decode(self, data: bytes) -> Any:
+        """
+        Decode a JSON document with `orjson.loads`.
+
+        Parameters
+        ----------
+        data : bytes
+            The raw, UTF-8 encoded JSON document.
+
+        Returns
+        -------
+        Any
+            The decoded document.
+
+        Raises
+        ------
+        json.JSONDecodeError
+            If the document is not valid JSON; `orjson.JSONDecodeError` subclasses it.
+        """
+        return self._loads(data)
+
+
+class MsgspecJSONDecoder(JSONDecoderInterface):
+    """JSON decoder based on `msgspec`, decoding to plain values rather than Structs."""
+
+    name = "msgspec"
+
+    def __init__(self) -> None:
+        """
+        Initialize the MsgspecJSONDecoder.
+
+        Raises
+        ------
+        ImportError
+            If `msgspec` is not installed.
+        """
+        msgspec = importlib.import_module("msgspec")
+        self._decode: Callable[[bytes], Any] = msgspec.json.Decoder().decode
+        self._decode_error: type[Exception] = msgspec.DecodeError
+
+    def decode(self, data: bytes) -> Any:
+        """
+        Decode a JSON document with a reusable `msgspec.json.Decoder`.
+
+        Parameters
+        ----------
+        data : bytes
+            The raw, UTF-8 encoded JSON document.
+
+        Returns
+        -------
+        Any
+            The decoded document.
+
+        Raises
+        ------
+        json.JSONDecodeError
+            If the document is not valid JSON.
+        """
+        try:
+            return self._decode(data)
+        except self._decode_error as error:
+            raise json.JSONDecodeError(str(error), data.decode(errors="replace"), 0)
+
+
+_BACKENDS: dict[str, Callable[[], JSONDecoderInterface]] = {
+    OrjsonJSONDecoder.name: OrjsonJSONDecoder,
+    MsgspecJSONDecoder.name: MsgspecJSONDecoder,
+    StdlibJSONDecoder.name: StdlibJSONDecoder,
+}
+
+
+def get_json_decoder(preferred: Optional[str] = None) -> JSONDecoderInterface:
+    """
+    Return the fastest available JSON decoder.
+
+    Backends are tried in the order orjson, msgspec, then the standard library, which
+    is always available.
+
+    Parameters
+    ----------
+    preferred : str, optional
+        Name of the backend to use (`"orjson"`, `"msgspec"` or `"json"`) instead of
+        the fastest available one.
+
+    Returns
+    -------
+    JSONDecoderInterface
+        The selected decoder.
+
+    Raises
+    ------
+    ValueError
+        If `preferred` is not a known backend name.
+    ImportError
+        If the `preferred` backend is not installed.
+    """
+    if preferred is not None:
+        if preferred not in _BACKENDS:
+            raise ValueError(f"Unknown JSON decoder backend: {preferred!r}.")
+        return _BACKENDS[preferred]()
+
+    for name, backend in _BACKENDS.items():
+        try:
+            decoder = backend()
+        except ImportError:
+            continue
+        logger.debug("Using the %s JSON decoder.", name)
+        return decoder
+    return StdlibJSONDecoder()
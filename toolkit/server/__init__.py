@@ -0,0 +1,9 @@
+from .http_server import (
+    JSON_CONTENT_TYPE,
+    Handler,
+    HTTPRequest,
+    HTTPResponse,
+    HTTPServer,
+)
+
+__all__ = ["JSON_CONTENT_TYPE", "HTTPRequest", "HTTPResponse", "HTTPServer", "Handler"]
@@ -0,0 +1,238 @@
+"""Minimal asyncio HTTP/1.1 server for small JSON and text endpoints."""
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Mapping
+from dataclasses import dataclass, field
+from http import HTTPStatus
+from types import MappingProxyType, TracebackType
+from typing import Callable, Optional
+from urllib.parse import parse_qsl, urlsplit
+
+logger = logging.getLogger(__name__)
+
+JSON_CONTENT_TYPE = "application/json"
+
+
+@dataclass(frozen=True)
+class HTTPRequest:
+    """Dataclass representing a parsed HTTP request."""
+
+    method: str
+    path: str
+    query: Mapping[str, str] = field(default_factory=lambda: MappingProxyType({}))
+    headers: Mapping[str, str] = field(default_factory=lambda: MappingProxyType({}))
+    body: bytes = b""
+
+
+@dataclass(frozen=True)
+class HTTPResponse:
+    """Dataclass representing an HTTP response to send."""
+
+    status: int = HTTPStatus.OK
+    body: bytes = b""
+    content_type: str = "text/plain; charset=utf-8"
+    headers: Mapping[str, str] = field(default_factory=lambda: MappingProxyType({}))
+
+
+Handler = Callable[[HTTPRequest], Awaitable[HTTPResponse]]
+
+
+class HTTPServer:
+    """
+    Asyncio HTTP/1.1 server dispatching every request to a single handler.
+
+    Connections are kept alive between requests unless the client asks otherwise, so
+    clients with a connection pool reuse them. Only requests with a `Content-Length`
+    body (or none) are supported; the server is meant for small local endpoints, not
+    for exposure to the internet.
+    """
+
+    def __init__(
+        self,
+        handler: Handler,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        keepalive_timeout: float = 30.0,
+        backlog: int = 100,
+    ) -> None:
+        """
+        Initialize the HTTPServer.
+
+        Parameters
+        ----------
+        handler : Callable[[HTTPRequest], Awaitable[HTTPResponse]]
+            Coroutine function answering each request.
+        host : str, optional
+            Interface to listen on.
+        port : int, optional
+            Port to listen on. Defaults to a free port chosen by the system.
+        keepalive_timeout : float, optional
+            Seconds an idle connection is kept open while waiting for a request.
+        backlog : int, optional
+            Maximum number of connections waiting to be accepted. Raise it for
+            bursts of many clients connecting at once.
+        """
+        self.handler = handler
+        self.host = host
+        self.port = port
+        self.keepalive_timeout = keepalive_timeout
+        self.backlog = backlog
+        self.connections_opened = 0
+        self.requests_served = 0
+        self._server: Optional[asyncio.Server] = None
+        self._connections: set[asyncio.Task[None]] = set()
+
+    @property
+    def url(self) -> str:
+        """Base URL of the server, with the bound port once started."""
+        return f"http://{self.host}:{self.port}"
+
+    @property
+    def open_connections(self) -> int:
+        """Number of connections currently open."""
+        return len(self._connections)
+
+    async def start(self) -> None:
+        """Start listening, binding the actual port if a free one was requested."""
+        self._server = await asyncio.start_server(
+            self._serve_connection,
+            host=self.host,
+            port=self.port,
+            backlog=self.backlog,
+        )
+        self.port = self._server.sockets[0].getsockname()[1]
+        logger.info("HTTP server listening on %s", self.url)
+
+    async def serve_forever(self) -> None:
+        """Start the server if needed, then serve until cancelled."""
+        if self._server is None:
+            await self.start()
+        assert self._server is not None
+        await self._server.serve_forever()
+
+    async def close(self) -> None:
+        """Stop listening and close the open connections."""
+        if self._server is None:
+            return
+        self._server.close()
+        for connection in list(self._connections):
+            connection.cancel()
+        await asyncio.gather(*self._connections, return_exceptions=True)
+        await self._server.wait_closed()
+        self._server = None
+
+    async def __aenter__(self) -> "HTTPServer":
+        """Start the server, returning the server itself."""
+        await self.start()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        """Close the server."""
+        await self.close()
+
+    async def _serve_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Answer the requests sent over one connection until it is closed."""
+        task = asyncio.current_task()
+        assert task is not None
+        self._connections.add(task)
+        self.connections_opened += 1
+        try:
+            keep_alive = True
+            while keep_alive:
+                try:
+                    request = await asyncio.wait_for(
+                        self._read_request(reader), timeout=self.keepalive_timeout
+                    )
+                except (asyncio.TimeoutError, asyncio.IncompleteReadError):
+                    return
+                except ValueError:
+                    response = HTTPResponse(status=HTTPStatus.BAD_REQUEST)
+                    await self._write_response(writer, response, keep_alive=False)
+                    return
+                if request is None:
+                    return
+                keep_alive = request.headers.get("connection", "").lower() != "close"
+                response = await self._dispatch(request)
+                await self._write_response(writer, response, keep_alive=keep_alive)
+                self.requests_served += 1
+        except ConnectionError:
+            pass
+        except asyncio.CancelledError:
+            # Raised by `close`. The connection task is owned by asyncio's stream
+            # protocol, which logs cancelled tasks as errors, so it ends quietly.
+            pass
+        finally:
+            self._connections.discard(task)
+            writer.close()
+
+    async def _dispatch(self, request: HTTPRequest) -> HTTPResponse:
+        """Answer a request with the handler, turning its errors into a 500."""
+        try:
+            return await self.handler(request)
+        except Exception:
+            logger.exception("Failed to handle %s %s", request.method, request.path)
+            return HTTPResponse(status=HTTPStatus.INTERNAL_SERVER_ERROR)
+
+    @staticmethod
+    async def _read_request(reader: asyncio.StreamReader) -> Optional[HTTPRequest]:
+        """
+        Read and parse one request.
+
+        Returns
+        -------
+        HTTPRequest, optional
+            The request, or None if the client closed the connection.
+
+        Raises
+        ------
+        ValueError
+            If the request is malformed.
+        """
+        try:
+            head = await reader.readuntil(b"\r\n\r\n")
+        except asyncio.IncompleteReadError as error:
+            if not error.partial:
+                return None
+            raise
+        except asyncio.LimitOverrunError as error:
+            raise ValueError("Request head too large.") from error
+
+        request_line, *header_lines = head.decode("latin-1").split("\r\n")
+        method, target, _ = request_line.split(" ", 2)
+        headers = {}
+        for line in filter(None, header_lines):
+            name, _, value = line.partition(":")
+            headers[name.strip().lower()] = value.strip()
+        body = await reader.readexactly(int(headers.get("content-length", 0)))
+        url = urlsplit(target)
+        return HTTPRequest(
+            method=method.upper(),
+            path=url.path,
+            query=MappingProxyType(dict(parse_qsl(url.query))),
+            headers=MappingProxyType(headers),
+            body=body,
+        )
+
+    @staticmethod
+    async def _write_response(
+        writer: asyncio.StreamWriter, response: HTTPResponse, keep_alive: bool
+    ) -> None:
+        """Serialize a response to the connection."""
+        status = HTTPStatus(response.status)
+        head = [
+            f"HTTP/1.1 {status.value} {status.phrase}",
+            f"Content-Type: {response.content_type}",
+            f"Content-Length: {len(response.body)}",
+            f"Connection: {'keep-alive' if keep_alive else 'close'}",
+            *(f"{name}: {value}" for name, value in response.headers.items()),
+        ]
+        writer.write("\r\n".join(head).encode("latin-1") + b"\r\n\r\n" + response.body)
+        await writer.drain()
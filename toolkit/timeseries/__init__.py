@@ -0,0 +1,3 @@
+from .rolling_window import RollingWindow
+
+__all__ = ["RollingWindow"]
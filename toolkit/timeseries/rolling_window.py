@@ -0,0 +1,187 @@
+"""Fixed-capacity ring buffer of weighted samples with rolling statistics."""
+
+from array import array
+from collections import deque
+from typing import Optional
+
+
+class RollingWindow:
+    """
+    Ring buffer holding the last `capacity` `(timestamp, value, weight)` samples.
+
+    The buffer is preallocated, so memory stays bounded however many samples are
+    pushed. Statistics over the window are maintained incrementally on every push:
+    the mean and weighted mean from running sums, the minimum and maximum from
+    monotonic queues, and the exponential moving average from its recurrence. Pushing
+    a sample and reading any statistic are O(1), amortized for the minimum and maximum.
+    Running sums are recomputed from the buffer once per `capacity` pushes, so
+    floating point error does not build up.
+    """
+
+    def __init__(self, capacity: int, ema_span: Optional[int] = None) -> None:
+        """
+        Initialize the RollingWindow.
+
+        Parameters
+        ----------
+        capacity : int
+            Maximum number of samples kept.
+        ema_span : int, optional
+            Span of the exponential moving average, whose smoothing factor is
+            `2 / (ema_span + 1)`. Defaults to `capacity`.
+
+        Raises
+        ------
+        ValueError
+            If `capacity` or `ema_span` is not positive.
+        """
+        if capacity < 1:
+            raise ValueError("`capacity` must be at least 1.")
+        if ema_span is not None and ema_span < 1:
+            raise ValueError("`ema_span` must be at least 1.")
+
+        self.capacity = capacity
+        self.ema_span = ema_span or capacity
+        self._alpha = 2 / (self.ema_span + 1)
+        self._timestamps = array("d", bytes(8 * capacity))
+        self._values = array("d", bytes(8 * capacity))
+        self._weights = array("d", bytes(8 * capacity))
+        self._count = 0
+        self._pushed = 0
+        self._sum = 0.0
+        self._weight_sum = 0.0
+        self._weighted_sum = 0.0
+        self._ema: Optional[float] = None
+        self._minima: deque[tuple[int, float]] = deque()
+        self._maxima: deque[tuple[int, float]] = deque()
+
+    @property
+    def full(self) -> bool:
+        """Whether the window holds `capacity` samples."""
+        return self._count == self.capacity
+
+    @property
+    def latest(self) -> Optional[tuple[float, float, float]]:
+        """The last pushed `(timestamp, value, weight)` sample, if any."""
+        if not self._count:
+            return None
+        index = (self._pushed - 1) % self.capacity
+        return (self._timestamps[index], self._values[index], self._weights[index])
+
+    @property
+    def mean(self) -> Optional[float]:
+        """Simple moving average of the values in the window."""
+        return self._sum / self._count if self._count else None
+
+    @property
+    def ema(self) -> Optional[float]:
+        """Exponential moving average of every value pushed so far."""
+        return self._ema
+
+    @property
+    def min(self) -> Optional[float]:
+        """Smallest value in the window."""
+        return self._minima[0][1] if self._minima else None
+
+    @property
+    def max(self) -> Optional[float]:
+        """Largest value in the window."""
+        return self._maxima[0][1] if self._maxima else None
+
+    @property
+    def weighted_mean(self) -> Optional[float]:
+        """Mean of the values weighted by their weight, e.g. a VWAP for volumes."""
+        if self._weight_sum <= 0:
+            return None
+        return self._weighted_sum / self._weight_sum
+
+    def push(self, timestamp: float, value: float, weight: float = 0.0) -> None:
+        """
+        Append a sample, evicting the oldest one when the window is full.
+
+        Parameters
+        ----------
+        timestamp : float
+            Time of the sample.
+        value : float
+            The sampled value.
+        weight : float, optional
+            Weight of the value in the weighted mean.
+        """
+        sequence = self._pushed
+        index = sequence % self.capacity
+        if self.full:
+            evicted_value = self._values[index]
+            evicted_weight = self._weights[index]
+            self._sum -= evicted_value
+            self._weight_sum -= evicted_weight
+            self._weighted_sum -= evicted_value * evicted_weight
+        else:
+            self._count += 1
+
+        self._timestamps[index] = timestamp
+        self._values[index] = value
+        self._weights[index] = weight
+        self._pushed += 1
+        self._sum += value
+        self._weight_sum += weight
+        self._weighted_sum += value * weight
+        if self._pushed % self.capacity == 0:
+            self._recompute_sums()
+
+        if self._ema is None:
+            self._ema = value
+        else:
+            self._ema += self._alpha * (value - self._ema)
+
+        minima, maxima = self._minima, self._maxima
+        while minima and minima[-1][1] >= value:
+            minima.pop()
+        while maxima and maxima[-1][1] <= value:
+            maxima.pop()
+        minima.append((sequence, value))
+        maxima.append((sequence, value))
+        oldest = sequence - self.capacity
+        if minima[0][0] <= oldest:
+            minima.popleft()
+        if maxima[0][0] <= oldest:
+            maxima.popleft()
+
+    def timestamps(self) -> list[float]:
+        """Return the timestamps in the window, oldest first."""
+        return self._ordered(self._timestamps)
+
+    def values(self) -> list[float]:
+        """Return the values in the window, oldest first."""
+        return self._ordered(self._values)
+
+    def weights(self) -> list[float]:
+        """Return the weights in the window, oldest first."""
+        return self._ordered(self._weights)
+
+    def _recompute_sums(self) -> None:
+        """Recompute the running sums from the samples in the window."""
+        values = self._values[: self._count]
+        weights = self._weights[: self._count]
+        self._sum = sum(values)
+        self._weight_sum = sum(weights)
+        self._weighted_sum = sum(v * w for v, w in zip(values, weights))
+
+    def _ordered(self, samples: "array[float]") -> list[float]:
+        """Return the samples of one buffer, oldest first."""
+        if not self.full:
+            return samples[: self._count].tolist()
+        start = self._pushed % self.capacity
+        return samples[start:].tolist() + samples[:start].tolist()
+
+    def __len__(self) -> int:
+        """Return the number of samples in the window."""
+        return self._count
+
+    def __repr__(self) -> str:
+        """Return an unambiguous string representation of the window."""
+        return (
+            f"RollingWindow(capacity={self.capacity}, "
+            f"ema_span={self.ema_span}, "
+            f"samples={self._count})"
+        )